@@ -0,0 +1,247 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/compiled.py
+
+"""
+Compiled, read-only serialization of list rows.
+
+DRF serializers resolve every field of every row through model instances:
+`get_attribute`, `to_representation`, `SerializerMethodField` dispatch and
+`get_FOO_display()` for choice labels. `CompiledSerializer` walks a
+serializer once and turns it into one getter per field reading rows of
+`QuerySet.values()`: no model instance is built, choice labels come from
+precomputed dicts and values that need no conversion are copied as is.
+
+The output is identical to the serializer's. Conversions that are not
+trivially identical call the DRF field's own `to_representation`, and
+fields the compiler does not understand are rejected when compiling.
+
+Supported fields:
+
+- model fields generated by `ModelSerializer`;
+- `CharField(source="get_FOO_display")` choice labels;
+- nested `ModelSerializer`s of forward relations, compiled recursively;
+- any field listed in the serializer's `Meta.value_fields`, which maps it
+  to a `ValueField` (a column, annotation or related path of the queryset,
+  and an optional converter). `SerializerMethodField`s must be listed
+  there.
+
+Values are never converted when they are None, like DRF does.
+"""
+
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+Row = Mapping[str, Any]
+Getter = Callable[[Row], Any]
+
+_DISPLAY_SOURCE_RE = re.compile(r"^get_(?P<field>\w+)_display$")
+
+# DRF fields whose representation of the Python value the database returns
+# for the matching model fields is the value itself.
+_IDENTITY_FIELDS: dict[
+    type[serializers.Field[Any, Any, Any, Any]], tuple[type, ...]
+] = {
+    serializers.CharField: (models.CharField, models.TextField),
+    serializers.BooleanField: (models.BooleanField,),
+    serializers.IntegerField: (models.IntegerField,),
+}
+
+
+@dataclass(frozen=True)
+class ValueField:
+    """Column (or annotation, or related path) a serializer field reads."""
+
+    column: str
+    convert: Callable[[Any], Any] | None = None
+
+
+def _column_getter(column: str, convert: Callable[[Any], Any] | None) -> Getter:
+    if convert is None:
+        return lambda row: row[column]
+
+    def get(row: Row) -> Any:
+        value = row[column]
+        return None if value is None else convert(value)
+
+    return get
+
+
+def _field_converter(
+    field: serializers.Field[Any, Any, Any, Any],
+    model_field: models.Field[Any, Any],
+) -> Callable[[Any], Any] | None:
+    identity_types = _IDENTITY_FIELDS.get(type(field))
+    if identity_types is not None and isinstance(model_field, identity_types):
+        return None
+
+    if isinstance(field, serializers.UUIDField) and field.uuid_format == "hex_verbose":
+        return str
+
+    if isinstance(field, serializers.ChoiceField):
+        representations = {
+            value: field.to_representation(value) for value in field.choices
+        }
+
+        def convert_choice(value: Any) -> Any:
+            try:
+                return representations[value]
+            except (KeyError, TypeError):
+                return field.to_representation(value)
+
+        return convert_choice
+
+    return field.to_representation
+
+
+def _label_converter(model_field: models.Field[Any, Any]) -> Callable[[Any], Any]:
+    """Same as `get_FOO_display()` followed by `CharField.to_representation`."""
+    labels = {value: str(label) for value, label in model_field.flatchoices}
+
+    def convert_label(value: Any) -> Any:
+        try:
+            return labels[value]
+        except (KeyError, TypeError):
+            return str(value)
+
+    return convert_label
+
+
+class CompiledSerializer:
+    """
+    Row serializer compiled from a read-only serializer instance.
+
+    Compile the instance actually used by the request: fields removed from
+    it (e.g. by sparse fieldsets) are neither read nor rendered.
+    """
+
+    def __init__(
+        self,
+        serializer: serializers.ModelSerializer[Any],
+        *,
+        prefix: str = "",
+    ) -> None:
+        self.model: type[models.Model] = serializer.Meta.model
+        self.prefix = prefix
+        self.columns: list[str] = []
+
+        value_fields: Mapping[str, ValueField] = getattr(
+            serializer.Meta, "value_fields", {}
+        )
+
+        self.getters: list[tuple[str, Getter]] = [
+            (name, self._compile_field(name, field, value_fields))
+            for name, field in serializer.fields.items()
+            if not field.write_only
+        ]
+
+    def _column(self, path: str) -> str:
+        column = f"{self.prefix}{path}"
+        if column not in self.columns:
+            self.columns.append(column)
+        return column
+
+    def _model_field(self, name: str) -> models.Field[Any, Any] | None:
+        try:
+            field = self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+
+        return field if isinstance(field, models.Field) else None
+
+    def _compile_field(
+        self,
+        name: str,
+        field: serializers.Field[Any, Any, Any, Any],
+        value_fields: Mapping[str, ValueField],
+    ) -> Getter:
+        if name in value_fields:
+            value_field = value_fields[name]
+            return _column_getter(self._column(value_field.column), value_field.convert)
+
+        if isinstance(field, serializers.ModelSerializer):
+            return self._compile_nested(name, field)
+
+        source = field.source or name
+        model_field = self._model_field(source)
+
+        if (
+            model_field is not None
+            and model_field.concrete
+            and not model_field.is_relation
+        ):
+            return _column_getter(
+                self._column(source),
+                _field_converter(field, model_field),
+            )
+
+        match = _DISPLAY_SOURCE_RE.match(source)
+        label_field = self._model_field(match["field"]) if match else None
+
+        if (
+            type(field) is serializers.CharField
+            and label_field is not None
+            and label_field.choices
+        ):
+            return _column_getter(
+                self._column(label_field.name),
+                _label_converter(label_field),
+            )
+
+        raise ImproperlyConfigured(
+            f"Cannot compile field {name!r} of {self.model.__name__}: list it "
+            "in the serializer's `Meta.value_fields`."
+        )
+
+    def _compile_nested(
+        self,
+        name: str,
+        field: serializers.ModelSerializer[Any],
+    ) -> Getter:
+        source = field.source or name
+        relation = self._model_field(source)
+
+        if relation is None or not relation.is_relation or relation.many_to_many:
+            raise ImproperlyConfigured(
+                f"Cannot compile nested serializer {name!r} of "
+                f"{self.model.__name__}: only forward relations are supported."
+            )
+
+        nested = CompiledSerializer(field, prefix=f"{self.prefix}{source}__")
+        # A NULL primary key means there is no related object.
+        key = nested._column("pk")
+        for column in nested.columns:
+            self._column(column.removeprefix(self.prefix))
+
+        def get(row: Row) -> Any:
+            if row[key] is None:
+                return None
+            return nested.to_representation(row)
+
+        return get
+
+    def values(
+        self,
+        queryset: QuerySet[Any],
+        extra: Iterable[str] = (),
+    ) -> QuerySet[Any, dict[str, Any]]:
+        """
+        Rows with the compiled columns, the primary key and `extra` columns,
+        e.g. the ordering fields keyset pagination seeks on.
+        """
+        columns = dict.fromkeys(["pk", *self.columns, *extra])
+
+        return queryset.values(*columns)
+
+    def to_representation(self, row: Row) -> dict[str, Any]:
+        return {name: get(row) for name, get in self.getters}
+
+    def serialize(self, rows: Iterable[Row]) -> list[dict[str, Any]]:
+        to_representation = self.to_representation
+        return [to_representation(row) for row in rows]
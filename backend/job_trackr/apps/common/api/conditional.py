@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/conditional.py
+
+"""
+Validators for conditional GET requests (`ETag`, `Last-Modified`).
+
+Detail validators come from the `updated_at`-like fields of the object and
+of the related objects its representation includes. List validators come
+from a single aggregate over the filtered queryset: the MAX and non-null
+COUNT of the same fields, plus a signature of the query. Unchanged
+resources answer `304 Not Modified` before any row is serialized.
+
+That aggregate reads every matching row. Lists that avoid doing so (keyset
+pages, inexact counts) use page validators instead: the primary keys and
+fields of the page rows, the pagination state and the model versions of
+apps.common.cache, which cover writes outside the page. The page is read,
+but still not serialized, before answering `304 Not Modified`.
+
+ETags are strong: they also cover the query string and the negotiated media
+type, so two different representations never share one.
+
+List responses only carry an ETag. Deleting a row lowers the count but not
+necessarily MAX(updated_at), so `If-Modified-Since` cannot be answered
+safely for lists.
+"""
+
+import hashlib
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Count, Max, Model, QuerySet
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.request import Request
+
+from apps.common.api.counting import query_signature
+from apps.common.api.response_cache import normalized_query_string
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: datetime | None = None
+    # Rows matched by a list request, counted by the validator aggregate.
+    row_count: int | None = None
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def representation_variant(request: Request) -> tuple[str, str]:
+    """What, besides the data, selects the representation of a resource."""
+    return (
+        getattr(request, "accepted_media_type", "") or "",
+        normalized_query_string(request),
+    )
+
+
+def _field_value(instance: Model, path: str) -> Any:
+    value: Any = instance
+
+    for name in path.split("__"):
+        try:
+            value = getattr(value, name)
+        except ObjectDoesNotExist:
+            # Missing reverse one-to-one relation.
+            return None
+
+        if value is None:
+            return None
+
+    return value
+
+
+def _row_value(row: Model | Mapping[str, Any], path: str) -> Any:
+    if isinstance(row, Mapping):
+        return row[path]
+
+    return _field_value(row, path)
+
+
+def detail_validators(
+    instance: Model,
+    fields: list[str],
+    request: Request,
+) -> Validators:
+    values = [_field_value(instance, field) for field in fields]
+    timestamps = [value for value in values if isinstance(value, datetime)]
+
+    return Validators(
+        etag=make_etag(str(instance.pk), values, representation_variant(request)),
+        last_modified=max(timestamps, default=None),
+    )
+
+
+def list_validators(
+    queryset: QuerySet[Any],
+    fields: list[str],
+    request: Request,
+) -> Validators:
+    aggregates: dict[str, Any] = {"rows": Count("pk")}
+    for index, field in enumerate(fields):
+        aggregates[f"max_{index}"] = Max(field)
+        aggregates[f"count_{index}"] = Count(field)
+
+    values = queryset.order_by().aggregate(**aggregates)
+
+    return Validators(
+        etag=make_etag(
+            query_signature(queryset),
+            sorted(values.items()),
+            representation_variant(request),
+        ),
+        row_count=values["rows"],
+    )
+
+
+def page_validators(
+    rows: Sequence[Model | Mapping[str, Any]],
+    fields: list[str],
+    request: Request,
+    *,
+    versions: str,
+    page_state: Any,
+) -> Validators:
+    """
+    List validators of one page, from its rows rather than an aggregate.
+
+    Rows are model instances or `values()` dicts holding "pk" and `fields`.
+    `page_state` is what else the paginated response holds (count, links).
+    """
+    values = [
+        (str(_row_value(row, "pk")), [_row_value(row, field) for field in fields])
+        for row in rows
+    ]
+
+    return Validators(
+        etag=make_etag(versions, page_state, values, representation_variant(request))
+    )
+
+
+def set_validator_headers(response: HttpResponseBase, validators: Validators) -> None:
+    response["ETag"] = validators.etag
+
+    if validators.last_modified is not None:
+        response["Last-Modified"] = http_date(validators.last_modified.timestamp())
+
+
+def not_modified_response(
+    request: Request,
+    validators: Validators,
+) -> HttpResponseBase | None:
+    """`304 Not Modified` when the request's preconditions match, else None."""
+    last_modified = validators.last_modified
+
+    response = get_conditional_response(
+        request._request,
+        etag=validators.etag,
+        last_modified=(
+            int(last_modified.timestamp()) if last_modified is not None else None
+        ),
+    )
+
+    if response is not None:
+        set_validator_headers(response, validators)
+
+    return response
@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/counting.py
+
+import hashlib
+import json
+from collections.abc import Iterable
+from enum import StrEnum
+from typing import Any, NamedTuple
+
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Model, QuerySet
+
+from apps.common.cache import get_model_versions
+
+
+class CountStrategy(StrEnum):
+    # Plain COUNT(*) on every request.
+    EXACT = "exact"
+    # COUNT(*) cached per query signature, invalidated by model writes.
+    CACHED = "cached"
+    # Planner estimate when it exceeds a threshold, exact count otherwise.
+    ESTIMATED = "estimated"
+
+
+class RowCount(NamedTuple):
+    value: int
+    approximate: bool = False
+
+
+def exact_count(queryset: QuerySet[Any]) -> RowCount:
+    return RowCount(queryset.count())
+
+
+def query_signature(queryset: QuerySet[Any]) -> str:
+    """Stable hash of the SQL and parameters of an unordered queryset."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    payload = json.dumps([sql, [str(param) for param in params]])
+
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def cached_count(
+    queryset: QuerySet[Any],
+    *,
+    version: str,
+    timeout: int,
+) -> RowCount:
+    """
+    Count rows, caching the result per query signature.
+
+    `version` must change whenever a write can change the count, see
+    `apps.common.cache.get_model_versions`.
+    """
+    key = (
+        f"count:{queryset.model._meta.label_lower}:{version}:"
+        f"{query_signature(queryset)}"
+    )
+
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, timeout=timeout)
+
+    return RowCount(count)
+
+
+def table_row_estimate(model: type[Model], using: str) -> int | None:
+    """
+    Row count estimate maintained by VACUUM/ANALYZE in `pg_class`.
+
+    Returns None when the table has never been analyzed.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+
+    if row is None or row[0] < 0:
+        return None
+
+    return int(row[0])
+
+
+def planner_row_estimate(queryset: QuerySet[Any]) -> int:
+    """Row count the planner expects the queryset to return."""
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def estimated_count(queryset: QuerySet[Any], *, threshold: int) -> RowCount:
+    """
+    Return the planner's estimate when it is at least `threshold` rows.
+
+    Below the threshold an exact COUNT(*) is cheap enough and clients get a
+    precise number. Unfiltered querysets use `pg_class.reltuples` and skip
+    planning entirely.
+    """
+    if queryset.query.where:
+        estimate: int | None = planner_row_estimate(queryset)
+    else:
+        estimate = table_row_estimate(queryset.model, queryset.db)
+
+    if estimate is None or estimate < threshold:
+        return exact_count(queryset)
+
+    return RowCount(estimate, approximate=True)
+
+
+def count_rows(
+    queryset: QuerySet[Any],
+    *,
+    strategy: CountStrategy,
+    dependencies: Iterable[type[Model]],
+    cache_timeout: int,
+    estimate_threshold: int,
+) -> RowCount:
+    if strategy == CountStrategy.CACHED:
+        return cached_count(
+            queryset,
+            version=get_model_versions(dependencies),
+            timeout=cache_timeout,
+        )
+
+    if strategy == CountStrategy.ESTIMATED:
+        return estimated_count(queryset, threshold=estimate_threshold)
+
+    return exact_count(queryset)
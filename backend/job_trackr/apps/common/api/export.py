@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/export.py
+
+"""
+Streaming CSV, NDJSON and JSON exports of filtered querysets.
+
+Rows are read through a server-side cursor (`QuerySet.iterator`) as plain
+dictionaries and written to a `StreamingHttpResponse` in blocks, so memory
+use does not depend on the number of exported rows. JSON values are
+encoded like API responses (see apps.common.api.renderers).
+"""
+
+import csv
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+from decimal import Decimal
+from enum import StrEnum
+from itertools import batched
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from django.db.models import F, QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.request import Request
+
+from apps.common.api.renderers import ORJSONRenderer, dumps
+
+if TYPE_CHECKING:
+    _ViewBase = GenericAPIView[Any]
+else:
+    _ViewBase = object
+
+
+class ExportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    JSON = "json"
+
+
+CONTENT_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.JSON: "application/json",
+}
+
+# Rows joined into one chunk of the response body.
+ROWS_PER_BLOCK = 500
+
+
+class _Echo:
+    """File-like object returning what is written, for `csv.writer`."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    # Same representation as in JSON exports.
+    if isinstance(value, date | datetime | Decimal | UUID):
+        return dumps(value).decode().strip('"')
+
+    return value
+
+
+def stream_csv(rows: Iterable[dict[str, Any]], columns: list[str]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+
+    yield writer.writerow(columns)
+
+    for block in batched(rows, ROWS_PER_BLOCK):
+        yield "".join(
+            writer.writerow([_csv_value(row[column]) for column in columns])
+            for row in block
+        )
+
+
+def stream_ndjson(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    for block in batched(rows, ROWS_PER_BLOCK):
+        yield b"".join(dumps(row) + b"\n" for row in block)
+
+
+def stream_json(rows: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    return ORJSONRenderer().render_chunks(rows, chunk_size=ROWS_PER_BLOCK)
+
+
+def export_rows(
+    queryset: QuerySet[Any],
+    fields: dict[str, str],
+    *,
+    chunk_size: int,
+) -> Iterator[dict[str, Any]]:
+    """
+    Iterate over `queryset` as dictionaries keyed by export column.
+
+    `fields` maps column names to field paths; related paths such as
+    `job_posting__title` are allowed.
+    """
+    plain = [column for column, path in fields.items() if column == path]
+    renamed = {column: F(path) for column, path in fields.items() if column != path}
+
+    return queryset.values(*plain, **renamed).iterator(chunk_size=chunk_size)
+
+
+class StreamingExportMixin(_ViewBase):
+    """
+    Adds a `GET <list url>/export/` action to a viewset.
+
+    The export honours the filter, search and ordering parameters of the
+    list endpoint but is not paginated. `export_format` selects CSV
+    (default), NDJSON or a JSON array; DRF reserves the `format` parameter
+    for renderers.
+    """
+
+    export_fields: dict[str, str]
+    export_filename: str
+    export_chunk_size = 2_000
+    export_format_query_param = "export_format"
+
+    def get_export_format(self) -> ExportFormat:
+        value = self.request.query_params.get(
+            self.export_format_query_param,
+            ExportFormat.CSV,
+        )
+
+        try:
+            return ExportFormat(value)
+        except ValueError:
+            choices = ", ".join(ExportFormat)
+            raise ValidationError(
+                {self.export_format_query_param: [f"Must be one of: {choices}."]}
+            ) from None
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request: Request) -> StreamingHttpResponse:
+        export_format = self.get_export_format()
+        rows = export_rows(
+            self.filter_queryset(self.get_queryset()),
+            self.export_fields,
+            chunk_size=self.export_chunk_size,
+        )
+
+        content: Iterator[str] | Iterator[bytes]
+        if export_format == ExportFormat.CSV:
+            content = stream_csv(rows, list(self.export_fields))
+        elif export_format == ExportFormat.NDJSON:
+            content = stream_ndjson(rows)
+        else:
+            content = stream_json(rows)
+
+        response = StreamingHttpResponse(
+            content,
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_filename}.{export_format}"'
+        )
+
+        return response
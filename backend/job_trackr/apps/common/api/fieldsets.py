@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/fieldsets.py
+
+"""
+Sparse fieldsets: `?fields=a,b` keeps only the listed serializer fields and
+`?omit=a,b` drops them.
+
+Besides trimming the serializer, the selected fields are mapped to the
+database columns they read so the queryset loads only those (`only()` for
+`fields`, `defer()` for `omit`).
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from django.http import QueryDict
+from rest_framework.exceptions import ValidationError
+
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+
+
+class Fieldset(NamedTuple):
+    kept: frozenset[str]
+    omitted: frozenset[str]
+    # Selected with `fields` (only) rather than `omit` (defer).
+    explicit: bool
+
+
+def _split(value: str) -> list[str]:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def parse_fieldset(
+    query_params: QueryDict, available: Iterable[str]
+) -> Fieldset | None:
+    """Fieldset requested by the query string, or None to keep every field."""
+    available = list(available)
+    fields = query_params.get(FIELDS_PARAM)
+    omit = query_params.get(OMIT_PARAM)
+
+    if fields is None and omit is None:
+        return None
+
+    if fields is not None and omit is not None:
+        raise ValidationError(
+            {OMIT_PARAM: [f"Cannot be combined with `{FIELDS_PARAM}`."]}
+        )
+
+    param = FIELDS_PARAM if fields is not None else OMIT_PARAM
+    names = _split(fields if fields is not None else omit or "")
+
+    unknown = sorted(set(names) - set(available))
+    if unknown:
+        raise ValidationError({param: [f"Unknown fields: {', '.join(unknown)}."]})
+
+    if fields is not None:
+        kept = frozenset(names)
+        if not kept:
+            raise ValidationError({FIELDS_PARAM: ["Select at least one field."]})
+    else:
+        kept = frozenset(available) - set(names)
+
+    return Fieldset(
+        kept=kept,
+        omitted=frozenset(available) - kept,
+        explicit=fields is not None,
+    )
+
+
+def field_columns(
+    model: type[Model],
+    names: Iterable[str],
+    column_map: Mapping[str, list[str]],
+) -> set[str]:
+    """
+    Columns read by serializer fields `names`.
+
+    `column_map` lists the columns of fields that are not plain model fields
+    (labels, previews, nested objects). Other names are model fields or read
+    no column at all.
+    """
+    columns: set[str] = set()
+
+    for name in names:
+        if name in column_map:
+            columns.update(column_map[name])
+            continue
+
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+
+        if field.concrete:
+            columns.add(name)
+
+    return columns
+
+
+def apply_fieldset(
+    queryset: QuerySet[Any],
+    fieldset: Fieldset,
+    *,
+    column_map: Mapping[str, list[str]],
+    required: Iterable[str],
+) -> QuerySet[Any]:
+    """
+    Load only the columns of the kept fields, plus `required` ones (e.g.
+    the columns conditional GET validators read).
+    """
+    model = queryset.model
+    required = set(required)
+    kept_columns = field_columns(model, fieldset.kept, column_map) | required
+
+    if fieldset.explicit:
+        return queryset.only(*kept_columns)
+
+    omitted_columns = field_columns(model, fieldset.omitted, column_map)
+    # Columns of select_related() objects are loaded with their row anyway.
+    deferred = {
+        column for column in omitted_columns - kept_columns if "__" not in column
+    }
+
+    return queryset.defer(*deferred) if deferred else queryset
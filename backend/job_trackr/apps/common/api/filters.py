@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/filters.py
+
+from functools import reduce
+from operator import add, or_
+from typing import Any
+
+from django.contrib.postgres.search import SearchRank
+from django.db.models import F, FloatField, Model, Q, QuerySet
+from django.db.models.functions import Cast
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from apps.common.search import build_search_query
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Drop-in replacement for DRF's `SearchFilter` backed by PostgreSQL
+    full-text search.
+
+    Views opt in by declaring `search_vector_fields`, a list of `tsvector`
+    field paths (related paths are allowed). A row matches when any of those
+    vectors matches the query, and results are ranked by the summed
+    `ts_rank` of all of them.
+
+    The `search` query parameter and `search_fields` are unchanged, so views
+    without `search_vector_fields` keep the `ILIKE` behaviour of the parent
+    class.
+
+    NOTE:
+    This backend must be listed after `OrderingFilter`. Rank ordering is only
+    applied when the client did not ask for an explicit `ordering`, and the
+    view default ordering is then kept as a tie-breaker.
+    """
+
+    rank_annotation = "search_rank"
+
+    def filter_queryset(
+        self,
+        request: Request,
+        queryset: QuerySet[Any],
+        view: Any,
+    ) -> QuerySet[Any]:
+        vector_fields: list[str] | None = getattr(view, "search_vector_fields", None)
+
+        if not vector_fields:
+            return super().filter_queryset(request, queryset, view)
+
+        search_query = build_search_query(self.get_search_terms(request))
+
+        if search_query is None:
+            return queryset
+
+        matches = reduce(or_, (Q(**{field: search_query}) for field in vector_fields))
+        # `ts_rank` returns a `real`, whose text form does not round-trip
+        # exactly through Python floats. Casting to double precision keeps
+        # the rank usable as a keyset pagination position.
+        rank = Cast(
+            reduce(
+                add,
+                (SearchRank(F(field), search_query) for field in vector_fields),
+            ),
+            output_field=FloatField(),
+        )
+
+        queryset = queryset.filter(matches).annotate(**{self.rank_annotation: rank})
+
+        if api_settings.ORDERING_PARAM in request.query_params:
+            return queryset
+
+        return queryset.order_by(
+            f"-{self.rank_annotation}",
+            *self._get_fallback_ordering(queryset),
+        )
+
+    def _get_fallback_ordering(self, queryset: QuerySet[Model]) -> list[Any]:
+        if queryset.query.order_by:
+            return list(queryset.query.order_by)
+
+        return list(queryset.model._meta.ordering or [])
@@ -1,7 +1,374 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/common/api/pagination.py
 
+import base64
+import binascii
+import json
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+from functools import partial, reduce
+from operator import or_
+from typing import Any, cast
+from uuid import UUID
+
+from django.conf import settings
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.core.paginator import (
+    EmptyPage,
+    InvalidPage,
+    Page,
+    Paginator as DjangoPaginator,
+)
+from django.db.models import Field, Model, Q, QuerySet
+from django.db.models.query import ValuesIterable
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from apps.common.api.counting import CountStrategy, RowCount, count_rows
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position of a keyset page boundary and the direction to read from it."""
+
+    ordering: tuple[str, ...]
+    position: tuple[Any, ...] | None
+    reverse: bool = False
+
+
+def _encode_value(value: Any) -> Any:
+    # NOTE:
+    # DjangoJSONEncoder truncates datetimes to milliseconds, which would make
+    # the seek condition skip or repeat rows created within the same
+    # millisecond. ISO strings are parsed back by the field on filtering.
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    payload = {
+        "o": list(cursor.ordering),
+        "p": (
+            None
+            if cursor.position is None
+            else [_encode_value(value) for value in cursor.position]
+        ),
+        "r": cursor.reverse,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(encoded: str) -> Cursor:
+    """Decode a cursor, raising ValueError on any malformed input."""
+    try:
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        payload = json.loads(raw)
+        ordering = tuple(str(term) for term in payload["o"])
+        position = payload["p"]
+        reverse = bool(payload["r"])
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError) as exc:
+        raise ValueError("Malformed cursor.") from exc
+
+    if position is not None:
+        if not isinstance(position, list) or len(position) != len(ordering):
+            raise ValueError("Malformed cursor.")
+        position = tuple(position)
+
+    return Cursor(ordering=ordering, position=position, reverse=reverse)
+
+
+class KeysetPagination:
+    """
+    Keyset ("seek") pagination over the queryset's full ordering.
+
+    Unlike DRF's `CursorPagination`, which seeks on the first ordering field
+    and skips ties with an offset, every ordering term takes part in the seek
+    condition. The primary key is appended as the final tie-breaker, so the
+    ordering is total. Primary keys are uuid7 and therefore time-ordered,
+    which keeps that tie-breaker stable for rows created in the same instant.
+
+    PostgreSQL sorts NULLs last in ascending order and first in descending
+    order; the seek condition follows the same rules so nullable fields such
+    as `posted_on` can be paginated.
+
+    Only plain field names and annotations of the paginated model can be
+    used in the ordering. Rows may be model instances or `values()` dicts:
+    the primary key (as "pk") and the ordering fields are added to the
+    `values()` columns when missing, except annotations, which must be
+    selected up front (see `position_fields`).
+    """
+
+    tie_breaker = "pk"
+
+    def __init__(self, queryset: QuerySet[Any], page_size: int) -> None:
+        self.page_size = page_size
+        self.ordering = self.get_ordering(queryset)
+        self.queryset = self.with_position_values(queryset)
+
+    def get_ordering(self, queryset: QuerySet[Any]) -> tuple[str, ...]:
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering or [])
+
+        for term in ordering:
+            if not isinstance(term, str) or "__" in term or term.startswith("?"):
+                raise ImproperlyConfigured(
+                    f"Keyset pagination cannot seek on ordering term {term!r}."
+                )
+
+        names = {term.lstrip("-") for term in ordering}
+        pk_name = queryset.model._meta.pk.name if queryset.model._meta.pk else "id"
+
+        if not names & {self.tie_breaker, pk_name}:
+            ordering.append(self.tie_breaker)
+
+        return tuple(ordering)
+
+    @classmethod
+    def position_fields(cls, queryset: QuerySet[Any]) -> list[str]:
+        """
+        Columns `get_position` reads from rows of `queryset`. Annotations
+        among them must be selected by the first `values()` call: a later
+        one can no longer select them.
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering or []
+        names = [
+            term.lstrip("-")
+            for term in ordering
+            if isinstance(term, str) and not term.startswith("?")
+        ]
+
+        return list(dict.fromkeys([cls.tie_breaker, *names]))
+
+    def with_position_values(self, queryset: QuerySet[Any]) -> QuerySet[Any]:
+        """Add the model columns `get_position` reads to `values()` rows."""
+        fields = queryset._fields
+        if not fields or not issubclass(queryset._iterable_class, ValuesIterable):
+            return queryset
+
+        names = [self.tie_breaker, *(term.lstrip("-") for term in self.ordering)]
+        missing = [name for name in dict.fromkeys(names) if name not in fields]
+        if not missing:
+            return queryset
+
+        return queryset.values(*fields, *missing)
+
+    def paginate(
+        self, cursor: Cursor | None
+    ) -> tuple[list[Any], Cursor | None, Cursor | None]:
+        """
+        Return the page rows and the cursors of the next and previous pages.
+        """
+        reverse = cursor.reverse if cursor else False
+        position = cursor.position if cursor else None
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(self._invert(term) for term in ordering)
+
+        queryset = self.queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek_condition(ordering, position))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if reverse:
+            rows.reverse()
+
+        has_next = True if reverse else has_more
+        has_previous = has_more if reverse else position is not None
+
+        next_cursor = None
+        previous_cursor = None
+
+        if rows and has_next:
+            next_cursor = Cursor(self.ordering, self.get_position(rows[-1]))
+        if rows and has_previous:
+            previous_cursor = Cursor(
+                self.ordering,
+                self.get_position(rows[0]),
+                reverse=True,
+            )
+
+        return rows, next_cursor, previous_cursor
+
+    def clean_position(self, position: tuple[Any, ...]) -> tuple[Any, ...]:
+        """
+        Convert the values of a decoded cursor with the fields they seek on,
+        raising ValueError on any value the field rejects.
+        """
+        return tuple(
+            self._clean_value(term.lstrip("-"), value)
+            for term, value in zip(self.ordering, position, strict=True)
+        )
+
+    def _clean_value(self, name: str, value: Any) -> Any:
+        if value is None:
+            return None
+
+        try:
+            return self._get_field(name).to_python(value)
+        except (ValidationError, TypeError, ValueError) as exc:
+            raise ValueError("Malformed cursor.") from exc
+
+    def _get_field(self, name: str) -> Field[Any, Any]:
+        model = self.queryset.model
+
+        if name == self.tie_breaker:
+            return cast(Field[Any, Any], model._meta.pk)
+
+        try:
+            return cast(Field[Any, Any], model._meta.get_field(name))
+        except FieldDoesNotExist:
+            # Annotation, e.g. a search rank.
+            return self.queryset.query.annotations[name].output_field
+
+    def get_position(self, obj: Model | Mapping[str, Any]) -> tuple[Any, ...]:
+        return tuple(self._get_value(obj, term.lstrip("-")) for term in self.ordering)
+
+    def _get_value(self, obj: Model | Mapping[str, Any], name: str) -> Any:
+        if isinstance(obj, Mapping):
+            return obj["pk" if name == self.tie_breaker else name]
+
+        if name == self.tie_breaker:
+            return obj.pk
+
+        try:
+            field = obj._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Annotation, e.g. a search rank.
+            return getattr(obj, name)
+
+        return getattr(obj, getattr(field, "attname", name))
+
+    @staticmethod
+    def _invert(term: str) -> str:
+        return term[1:] if term.startswith("-") else f"-{term}"
+
+    def _is_nullable(self, name: str) -> bool:
+        if name == self.tie_breaker:
+            return False
+
+        try:
+            field = self.queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Annotations may produce NULLs.
+            return True
+
+        return bool(field.null)
+
+    def _after(self, name: str, descending: bool, value: Any) -> Q | None:
+        """Rows strictly after `value` for one ordering term, None if none."""
+        if value is None:
+            # NULLs come last in ascending order and first in descending order.
+            return Q(**{f"{name}__isnull": False}) if descending else None
+
+        if descending:
+            return Q(**{f"{name}__lt": value})
+
+        after = Q(**{f"{name}__gt": value})
+        if self._is_nullable(name):
+            after |= Q(**{f"{name}__isnull": True})
+
+        return after
+
+    def _seek_condition(
+        self, ordering: tuple[str, ...], position: tuple[Any, ...]
+    ) -> Q:
+        """
+        Expand `(f1, f2, ..., fn) > (v1, v2, ..., vn)` into
+
+            f1 > v1 OR (f1 = v1 AND f2 > v2) OR ...
+
+        with per-term directions and NULL ordering. A redundant range on the
+        first term is added so PostgreSQL can start the index scan at the
+        cursor instead of filtering from the start of the index.
+        """
+        branches = []
+        equal_so_far = Q()
+
+        for term, value in zip(ordering, position, strict=True):
+            name = term.lstrip("-")
+            descending = term.startswith("-")
+
+            after = self._after(name, descending, value)
+            if after is not None:
+                branches.append(equal_so_far & after)
+
+            if value is None:
+                equal_so_far &= Q(**{f"{name}__isnull": True})
+            else:
+                equal_so_far &= Q(**{name: value})
+
+        # The primary key tie-breaker is never NULL, so there is always at
+        # least one branch.
+        condition = reduce(or_, branches)
+
+        first_term = ordering[0]
+        first_value = position[0]
+        if first_value is not None and first_term.startswith("-"):
+            condition &= Q(**{f"{first_term[1:]}__lte": first_value})
+
+        return condition
+
+
+class CountingPaginator(DjangoPaginator[Any]):
+    """
+    Django paginator taking its total from a `RowCount` provider.
+
+    When the count is approximate, page numbers past the estimated last page
+    are still served: the real last page may lie beyond the estimate.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet[Any],
+        per_page: int,
+        *,
+        counter: Callable[[], RowCount],
+    ) -> None:
+        super().__init__(object_list, per_page)
+        self.counter = counter
+
+    @cached_property
+    def row_count(self) -> RowCount:
+        return self.counter()
+
+    @cached_property
+    def count(self) -> int:
+        return self.row_count.value
+
+    def validate_number(self, number: int | float | str) -> int:
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.row_count.approximate or int(number) < 1:
+                raise
+
+            return int(number)
+
+    def page(self, number: int | str) -> Page[Any]:
+        if not self.row_count.approximate:
+            return super().page(number)
+
+        # Unlike the parent class, do not clamp the last page to the count.
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+
+        return Page(self.object_list[bottom : bottom + self.per_page], number, self)
 
 
 class DefaultPagination(PageNumberPagination):
@@ -20,3 +387,217 @@ class DefaultPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+
+    # NOTE:
+    # Sending `?cursor=` (empty for the first page) switches to keyset
+    # pagination. The response keeps the same keys so clients can switch
+    # modes without new types, but `count` is null: skipping the COUNT(*) and
+    # the OFFSET scan is the point of this mode. `next`/`previous` carry
+    # opaque cursors bound to the current ordering.
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    keyset_pagination_class = KeysetPagination
+
+    # NOTE:
+    # How `count` is computed in page number mode, see `CountStrategy`.
+    # None defers to the `API_COUNT_STRATEGY` setting. With the "estimated"
+    # strategy, responses also carry `count_is_approximate`.
+    count_strategy: CountStrategy | None = None
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet[Any] | Sequence[Any],
+        request: Request,
+        view: Any = None,
+    ) -> list[Any] | None:
+        self.cursor_mode = False
+        self.active_count_strategy = self.get_count_strategy()
+        self.counting_paginator: CountingPaginator | None = None
+
+        if not isinstance(queryset, QuerySet):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        if self.cursor_query_param in request.query_params:
+            self.cursor_mode = True
+            return self.paginate_keyset(queryset, request, page_size)
+
+        return self.paginate_pages(queryset, request, page_size, view)
+
+    def paginate_pages(
+        self,
+        queryset: QuerySet[Any],
+        request: Request,
+        page_size: int,
+        view: Any,
+    ) -> list[Any]:
+        """
+        Same as `PageNumberPagination.paginate_queryset`, with the total
+        count computed by the configured count strategy.
+        """
+        paginator = CountingPaginator(
+            queryset,
+            page_size,
+            counter=partial(self.count_rows, queryset, view),
+        )
+        page_number = self.get_page_number(request, paginator)
+        self.counting_paginator = paginator
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(
+                page_number=page_number,
+                message=str(exc),
+            )
+            raise NotFound(msg) from exc
+
+        if paginator.num_pages > 1 and self.template is not None:
+            # The browsable API should display pagination controls.
+            self.display_page_controls = True
+
+        return list(self.page)
+
+    def paginate_keyset(
+        self,
+        queryset: QuerySet[Any],
+        request: Request,
+        page_size: int,
+    ) -> list[Any]:
+        keyset = self.keyset_pagination_class(queryset, page_size)
+        cursor = self.get_cursor(request, keyset)
+
+        rows, self.next_cursor, self.previous_cursor = keyset.paginate(cursor)
+
+        return rows
+
+    def counts_all_rows(self, request: Request) -> bool:
+        """Whether pages of `request` need the exact number of matching rows."""
+        return (
+            self.cursor_query_param not in request.query_params
+            and self.get_count_strategy() == CountStrategy.EXACT
+        )
+
+    def get_page_state(self) -> tuple[Any, ...]:
+        """Count and links of the last paginated page, for its validators."""
+        count = None if self.cursor_mode else self.page.paginator.count
+
+        return (count, self.get_next_link(), self.get_previous_link())
+
+    def get_count_strategy(self) -> CountStrategy:
+        return CountStrategy(self.count_strategy or settings.API_COUNT_STRATEGY)
+
+    def count_rows(self, queryset: QuerySet[Any], view: Any) -> RowCount:
+        # ReadAfterWriteModelViewSet counts the same filtered queryset in the
+        # aggregate behind its conditional GET validators.
+        row_count = getattr(view, "list_row_count", None)
+        if row_count is not None and self.active_count_strategy == CountStrategy.EXACT:
+            return RowCount(row_count)
+
+        # Views list every model whose writes can change their results, e.g.
+        # postings also depend on candidacies through `has_candidacy`.
+        dependencies = getattr(view, "cache_dependencies", None) or [queryset.model]
+
+        return count_rows(
+            queryset,
+            strategy=self.active_count_strategy,
+            dependencies=dependencies,
+            cache_timeout=settings.API_COUNT_CACHE_TIMEOUT,
+            estimate_threshold=settings.API_COUNT_ESTIMATE_THRESHOLD,
+        )
+
+    def get_cursor(
+        self,
+        request: Request,
+        keyset: KeysetPagination,
+    ) -> Cursor | None:
+        encoded = request.query_params.get(self.cursor_query_param, "")
+
+        if not encoded:
+            return None
+
+        try:
+            cursor = decode_cursor(encoded)
+        except ValueError as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        # A cursor only makes sense for the ordering it was taken from.
+        if cursor.ordering != keyset.ordering:
+            raise NotFound(self.invalid_cursor_message)
+
+        if cursor.position is None:
+            return cursor
+
+        # Values are compared in SQL: reject those the fields cannot read
+        # before they reach the database.
+        try:
+            position = keyset.clean_position(cursor.position)
+        except ValueError as exc:
+            raise NotFound(self.invalid_cursor_message) from exc
+
+        return replace(cursor, position=position)
+
+    def get_paginated_response(self, data: Any) -> Response:
+        if not self.cursor_mode:
+            response = super().get_paginated_response(data)
+
+            if (
+                self.active_count_strategy == CountStrategy.ESTIMATED
+                and self.counting_paginator is not None
+            ):
+                row_count = self.counting_paginator.row_count
+                response.data["count_is_approximate"] = row_count.approximate
+
+            return response
+
+        return Response(
+            {
+                "count": None,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> str | None:
+        if not self.cursor_mode:
+            return super().get_next_link()
+
+        return self._get_cursor_link(self.next_cursor)
+
+    def get_previous_link(self) -> str | None:
+        if not self.cursor_mode:
+            return super().get_previous_link()
+
+        return self._get_cursor_link(self.previous_cursor)
+
+    def _get_cursor_link(self, cursor: Cursor | None) -> str | None:
+        if cursor is None or self.request is None:
+            return None
+
+        url = remove_query_param(
+            self.request.build_absolute_uri(),
+            self.page_query_param,
+        )
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(cursor))
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    "Opaque keyset cursor. Send an empty value to start "
+                    "cursor pagination from the first page."
+                ),
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/parsers.py
+
+import codecs
+from collections.abc import Mapping
+from typing import IO, Any
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from apps.common.api.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    Parse JSON with orjson.
+
+    Like `JSONParser` with the default `STRICT_JSON`, `NaN` and `Infinity`
+    are rejected. Bodies in another encoding than UTF-8 are decoded first.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> Any:
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        content = stream.read()
+
+        try:
+            if codecs.lookup(encoding).name != "utf-8":
+                content = content.decode(encoding)
+
+            return orjson.loads(content)
+        except ValueError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parse newline-delimited JSON into a list with one item per line.
+
+    Blank lines are skipped. The body is decoded line by line, so large
+    uploads are never held twice in memory as text and parsed values.
+    """
+
+    media_type = "application/x-ndjson"
+
+    # Returns a list where the stubs expect a mapping, like JSONParser does
+    # for array bodies.
+    def parse(  # type: ignore[override]
+        self,
+        stream: IO[Any],
+        media_type: str | None = None,
+        parser_context: Mapping[str, Any] | None = None,
+    ) -> list[Any]:
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        lines = codecs.getreader(encoding)(stream)
+
+        items = []
+
+        try:
+            # Lines are decoded as they are read, by the iteration itself.
+            for number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    items.append(orjson.loads(line))
+                except ValueError as exc:
+                    raise ParseError(
+                        f"NDJSON parse error on line {number} - {exc}"
+                    ) from exc
+        except UnicodeDecodeError as exc:
+            raise ParseError(f"NDJSON parse error - {exc}") from exc
+
+        return items
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/renderers.py
+
+"""
+JSON rendering with orjson.
+
+orjson encodes dicts, lists, strings, UUIDs, dates and datetimes in C and
+returns bytes directly, where DRF's `JSONRenderer` goes through the
+stdlib encoder, calls back into Python for every UUID or date, builds a
+`str` and encodes it again. Other types (lazy translations, Decimals,
+querysets, ...) fall back to DRF's encoder, so anything DRF can render is
+still rendered.
+
+Output matches `JSONRenderer` with the default `COMPACT_JSON` and
+`UNICODE_JSON` settings, except for raw datetimes, which keep their
+microseconds (DRF truncates them to milliseconds) and end in `Z` when in
+UTC. Serializers already turn datetime fields into strings, so this only
+concerns data rendered without a serializer. Indented output, requested
+with `Accept: application/json; indent=4` or by the browsable API, is
+left to `JSONRenderer`.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from itertools import batched
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from apps.common.instrumentation import serialization_timer
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+# Items encoded into one chunk by `ORJSONRenderer.render_chunks`.
+ITEMS_PER_CHUNK = 500
+
+_encoder = JSONEncoder()
+
+
+def dumps(data: Any) -> bytes:
+    """Encode `data` to compact UTF-8 JSON, escaping U+2028 and U+2029."""
+    content = orjson.dumps(data, default=_encoder.default, option=OPTIONS)
+
+    # Same as JSONRenderer: keep the output a strict JavaScript subset.
+    return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+        b"\xe2\x80\xa9", b"\\u2029"
+    )
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: Mapping[str, Any] | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        with serialization_timer():
+            if self.get_indent(accepted_media_type or "", renderer_context or {}):
+                return super().render(data, accepted_media_type, renderer_context)
+
+            return dumps(data)
+
+    def render_chunks(
+        self,
+        items: Iterable[Any],
+        *,
+        chunk_size: int = ITEMS_PER_CHUNK,
+    ) -> Iterator[bytes]:
+        """
+        Render an iterable as a JSON array, `chunk_size` items at a time.
+
+        The array is never held in memory as a whole, neither as items nor
+        as text, which suits `StreamingHttpResponse`.
+        """
+        separator = b"["
+
+        for chunk in batched(items, chunk_size):
+            yield separator + b",".join(dumps(item) for item in chunk)
+            separator = b","
+
+        yield b"[]" if separator == b"[" else b"]"
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/api/response_cache.py
+
+"""
+Versioned cache of API response data.
+
+Keys combine the endpoint, the user, the normalized query string and the
+version counters of every model the response depends on (see
+apps.common.cache). A write to any of those models bumps its version, so
+older entries are never read again and simply expire: invalidation does
+not scan or delete keys.
+
+Response data is cached before rendering, with the validators of the
+response (see apps.common.api.conditional). It works with any Django cache
+backend that can pickle values, as long as every worker process shares it:
+see CACHES in the settings.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from rest_framework.request import Request
+
+from apps.common.cache import increment_counter
+from apps.common.metrics import Counter
+
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "jobtrackr_response_cache_lookups_total",
+    "Response cache lookups by scope and outcome (hit or miss).",
+    ["scope", "outcome"],
+)
+
+
+def normalized_query_string(request: Request) -> str:
+    """Query string with sorted parameters and values."""
+    return urlencode(
+        sorted(
+            (name, value)
+            for name, values in request.query_params.lists()
+            for value in values
+        )
+    )
+
+
+def response_cache_key(request: Request, *, scope: str, versions: str) -> str:
+    user = request.user.pk if request.user.is_authenticated else "anonymous"
+    # Pagination links are absolute, so the host is part of the response.
+    url = request.build_absolute_uri(request.path)
+    # The negotiated media type selects the ETag of the cached validators.
+    media_type = getattr(request, "accepted_media_type", "")
+    target = f"{media_type} {url}?{normalized_query_string(request)}"
+    digest = hashlib.sha256(target.encode()).hexdigest()
+
+    return f"response:{scope}:{user}:{versions}:{digest}"
+
+
+def _stats_key(scope: str, outcome: str) -> str:
+    return f"response-cache-stats:{scope}:{outcome}"
+
+
+def record_response_cache_lookup(scope: str, *, hit: bool) -> None:
+    increment_counter(_stats_key(scope, "hits" if hit else "misses"))
+    RESPONSE_CACHE_LOOKUPS.labels(scope, "hit" if hit else "miss").inc()
+
+
+def get_response_cache_stats(scopes: Iterable[str]) -> dict[str, dict[str, int]]:
+    """Hit and miss counters of each scope since the cache was last cleared."""
+    scopes = list(scopes)
+    keys = [
+        _stats_key(scope, outcome) for scope in scopes for outcome in ("hits", "misses")
+    ]
+    values = cache.get_many(keys)
+
+    return {
+        scope: {
+            outcome: values.get(_stats_key(scope, outcome), 0)
+            for outcome in ("hits", "misses")
+        }
+        for scope in scopes
+    }
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/cache.py
+
+"""
+Per-model version counters for cache invalidation.
+
+Cached values that depend on a model embed the model's current version in
+their cache key. Writing to the model bumps the version, which makes every
+older key unreachable at once: invalidation is O(1) and never scans keys.
+Stale entries simply expire. The counters live in the default cache, which
+must therefore be shared by every worker process.
+
+Versions are bumped by `post_save`/`post_delete` receivers for single-row
+writes. Code paths that bypass signals (`bulk_create`, `QuerySet.update`,
+raw SQL) must call `bump_model_version` themselves.
+
+Inside a transaction, a bump happens twice: at once, so the writer reads its
+own writes, and again on commit. Until the commit, concurrent readers still
+see the old rows and may cache them under the first new version; the second
+bump makes those entries unreachable.
+"""
+
+from collections.abc import Iterable
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+
+
+def _version_key(model: type[Model]) -> str:
+    return f"model-version:{model._meta.label_lower}"
+
+
+def get_model_versions(models: Iterable[type[Model]]) -> str:
+    """Return a cache key fragment combining the versions of `models`."""
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+
+    return ".".join(str(versions.get(key, 0)) for key in keys)
+
+
+def increment_counter(key: str) -> None:
+    """Atomically increment a counter stored in the cache without expiry."""
+    # `add` is a no-op when the key exists, so concurrent first writes
+    # cannot reset a counter that another process already incremented.
+    cache.add(key, 0, timeout=None)
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key was evicted between `add` and `incr`.
+        cache.set(key, 1, timeout=None)
+
+
+def bump_model_version(model: type[Model], using: str | None = None) -> None:
+    """Bump the version of `model` now, and on commit of database `using`."""
+    key = _version_key(model)
+    increment_counter(key)
+
+    if transaction.get_connection(using).in_atomic_block:
+        transaction.on_commit(partial(increment_counter, key), using=using)
@@ -0,0 +1,33 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/expressions.py
+
+from django.db.models import Case, Expression, F, TextField, Value, When
+from django.db.models.functions import Concat, Left, Length
+from django.db.models.lookups import GreaterThan
+
+ELLIPSIS = "…"
+
+
+def truncated_chars(field: str, length: int) -> Expression:
+    """
+    SQL counterpart of `Truncator(value).chars(length)`.
+
+    Text longer than `length` characters is cut to `length - 1` characters
+    followed by an ellipsis, so the preview never exceeds `length`; shorter
+    text is returned unchanged. Unlike Truncator, the text is not
+    NFC-normalized and combining marks count as characters.
+    """
+    column = F(field)
+
+    return Case(
+        When(
+            GreaterThan(Length(column), length),
+            then=Concat(
+                Left(column, length - len(ELLIPSIS)),
+                Value(ELLIPSIS),
+                output_field=TextField(),
+            ),
+        ),
+        default=column,
+        output_field=TextField(),
+    )
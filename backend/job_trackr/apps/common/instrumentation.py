@@ -0,0 +1,231 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/instrumentation.py
+
+"""
+Per-request SQL and serialization timings.
+
+`RequestInstrumentationMiddleware` installs an execute wrapper on every
+database connection for the duration of a request, counting queries and
+their time. Serializers and renderers report the time they spend through
+`serialization_timer()`, minus the SQL they trigger (lazy querysets are
+evaluated while serializing).
+
+Timings are sent in a `Server-Timing` header when `API_SERVER_TIMING` is
+on, and requests exceeding their budget are logged as warnings. Budgets
+are set per viewset action (`"<basename>:<action>"`, e.g.
+`"job-posting:list"`) or URL name for other views, in
+`API_REQUEST_BUDGETS`, on top of `API_REQUEST_BUDGET`:
+
+    API_REQUEST_BUDGET = {"queries": 20, "total_ms": 500}
+    API_REQUEST_BUDGETS = {"job-posting:list": {"queries": 4}}
+
+Budget keys are `queries`, `sql_ms`, `serialize_ms` and `total_ms`.
+
+Every request is also recorded in the metrics registry (see
+apps.common.metrics): a counter by endpoint, method and status code, and
+histograms of latency and query count by endpoint and method.
+
+Queries run while a streaming response is consumed happen after the
+middleware returns and are not counted.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponseBase
+
+from apps.common.metrics import Counter, Histogram
+
+logger = logging.getLogger(__name__)
+
+BUDGET_KEYS = ("queries", "sql_ms", "serialize_ms", "total_ms")
+
+# Endpoint label of requests that matched no URL, to bound cardinality.
+UNMATCHED = "unmatched"
+
+REQUESTS = Counter(
+    "jobtrackr_http_requests_total",
+    "HTTP requests by endpoint, method and status code.",
+    ["endpoint", "method", "status"],
+)
+REQUEST_DURATION = Histogram(
+    "jobtrackr_http_request_duration_seconds",
+    "HTTP request latency by endpoint and method.",
+    ["endpoint", "method"],
+)
+REQUEST_QUERIES = Histogram(
+    "jobtrackr_http_request_queries",
+    "Database queries per HTTP request by endpoint and method.",
+    ["endpoint", "method"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+
+
+@dataclass
+class RequestTimings:
+    queries: int = 0
+    # Seconds.
+    sql: float = 0.0
+    serialization: float = 0.0
+    total: float = 0.0
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: Mapping[str, Any],
+    ) -> Any:
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql += time.perf_counter() - start
+            self.queries += 1
+
+    def measurements(self) -> dict[str, float]:
+        """Values compared with budgets, in queries and milliseconds."""
+        return {
+            "queries": self.queries,
+            "sql_ms": self.sql * 1_000,
+            "serialize_ms": self.serialization * 1_000,
+            "total_ms": self.total * 1_000,
+        }
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            [
+                f'db;dur={self.sql * 1_000:.1f};desc="{self.queries} queries"',
+                f"serialize;dur={self.serialization * 1_000:.1f}",
+                f"total;dur={self.total * 1_000:.1f}",
+            ]
+        )
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings",
+    default=None,
+)
+
+
+def current_timings() -> RequestTimings | None:
+    """Timings of the request being processed, if instrumented."""
+    return _current.get()
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    """Add the time spent in the block, SQL excluded, to serialization."""
+    timings = _current.get()
+
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    sql = timings.sql
+
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        timings.serialization += elapsed - (timings.sql - sql)
+
+
+def endpoint_name(request: HttpRequest, response: HttpResponseBase) -> str | None:
+    """`"<basename>:<action>"` for viewsets, else the URL name."""
+    context = getattr(response, "renderer_context", None) or {}
+    view = context.get("view")
+    basename = getattr(view, "basename", None)
+    action = getattr(view, "action", None)
+
+    if basename and action:
+        return f"{basename}:{action}"
+
+    match = request.resolver_match
+    return match.url_name if match is not None else None
+
+
+def request_budget(name: str | None) -> dict[str, float]:
+    budget = dict(settings.API_REQUEST_BUDGET)
+
+    if name is not None:
+        budget.update(settings.API_REQUEST_BUDGETS.get(name, {}))
+
+    return budget
+
+
+class RequestInstrumentationMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponseBase]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponseBase:
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings))
+
+                response = self.get_response(request)
+        finally:
+            timings.total = time.perf_counter() - start
+            _current.reset(token)
+
+        if settings.API_SERVER_TIMING:
+            response["Server-Timing"] = timings.server_timing()
+
+        name = endpoint_name(request, response)
+        self._record_metrics(name or UNMATCHED, request, response, timings)
+        self._check_budget(name, request, timings)
+
+        return response
+
+    def _record_metrics(
+        self,
+        name: str,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        timings: RequestTimings,
+    ) -> None:
+        method = request.method or ""
+
+        REQUESTS.labels(name, method, str(response.status_code)).inc()
+        REQUEST_DURATION.labels(name, method).observe(timings.total)
+        REQUEST_QUERIES.labels(name, method).observe(timings.queries)
+
+    def _check_budget(
+        self,
+        name: str | None,
+        request: HttpRequest,
+        timings: RequestTimings,
+    ) -> None:
+        budget = request_budget(name)
+        measurements = timings.measurements()
+
+        exceeded = [
+            f"{key} {round(measurements[key], 1):g} > {budget[key]:g}"
+            for key in BUDGET_KEYS
+            if key in budget and measurements[key] > budget[key]
+        ]
+
+        if exceeded:
+            logger.warning(
+                "Request over budget: %s %s (%s): %s",
+                request.method,
+                request.path,
+                name or "unnamed",
+                ", ".join(exceeded),
+                extra={"endpoint": name, **measurements},
+            )
@@ -0,0 +1,414 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/metrics.py
+
+"""
+In-process metrics: counters and fixed-bucket histograms, exposed in the
+Prometheus text format.
+
+Samples are stored in a `MemoryStore` by default. With several worker
+processes, set `METRICS_DIR`: each process then writes its samples to its
+own memory-mapped file in that directory (`FileStore`), without any lock
+shared between processes, and a scrape sums the files of all processes.
+The directory must be emptied when the server (re)starts, or counters of
+previous runs are added to the new ones.
+
+Recording is meant for hot paths: `labels()` children are cached with
+their precomputed sample keys, so an observation is a bisection and three
+in-place float additions.
+
+Latency quantiles (p50, p95, p99) are computed from histogram buckets by
+the scraper, e.g. with PromQL's `histogram_quantile()`.
+"""
+
+import bisect
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Protocol
+
+from django.conf import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from 5 ms to 10 s.
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Store(Protocol):
+    def add(self, key: str, amount: float) -> None: ...
+
+    def items(self) -> Iterable[tuple[str, float]]:
+        """Samples of all processes, summed by key."""
+        ...
+
+
+class MemoryStore:
+    def __init__(self) -> None:
+        self._values: dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def add(self, key: str, amount: float) -> None:
+        with self._lock:
+            self._values[key] += amount
+
+    def items(self) -> Iterable[tuple[str, float]]:
+        with self._lock:
+            return list(self._values.items())
+
+
+# File layout: the number of bytes used (uint64), then entries made of the
+# key length (uint32), the UTF-8 key padded to 8 bytes and the value
+# (float64), so that values are 8-byte aligned.
+_HEADER = struct.Struct("<Q")
+_KEY_LENGTH = struct.Struct("<I")
+_VALUE = struct.Struct("<d")
+_INITIAL_SIZE = 64 * 1024
+
+
+def _padded(length: int) -> int:
+    return (length + 7) // 8 * 8
+
+
+def _read_entries(data: bytes) -> Iterator[tuple[str, float]]:
+    if len(data) < _HEADER.size:
+        return
+
+    (used,) = _HEADER.unpack_from(data)
+    offset = _HEADER.size
+
+    while offset < used:
+        (length,) = _KEY_LENGTH.unpack_from(data, offset)
+        start = offset + _KEY_LENGTH.size
+        key = data[start : start + length].decode()
+        offset = start + _padded(length)
+        (value,) = _VALUE.unpack_from(data, offset)
+        offset += _VALUE.size
+
+        yield key, value
+
+
+class FileStore:
+    """
+    One memory-mapped file per process in `directory`, written only by
+    that process. Files are opened lazily and reopened after a fork.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._file: mmap.mmap | None = None
+        self._offsets: dict[str, int] = {}
+
+    def _open(self) -> mmap.mmap:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"metrics-{os.getpid()}.db"
+
+        with open(path, "a+b") as file:
+            if os.fstat(file.fileno()).st_size < _INITIAL_SIZE:
+                file.truncate(_INITIAL_SIZE)
+            mapped = mmap.mmap(file.fileno(), 0)
+
+        self._offsets = {}
+        if _HEADER.unpack_from(mapped)[0] == 0:
+            _HEADER.pack_into(mapped, 0, _HEADER.size)
+        else:
+            self._index(mapped)
+
+        self._pid = os.getpid()
+        self._file = mapped
+        return mapped
+
+    def _index(self, mapped: mmap.mmap) -> None:
+        (used,) = _HEADER.unpack_from(mapped)
+        offset = _HEADER.size
+
+        while offset < used:
+            (length,) = _KEY_LENGTH.unpack_from(mapped, offset)
+            start = offset + _KEY_LENGTH.size
+            key = mapped[start : start + length].decode()
+            offset = start + _padded(length)
+            self._offsets[key] = offset
+            offset += _VALUE.size
+
+    def _append(self, mapped: mmap.mmap, key: str) -> tuple[mmap.mmap, int]:
+        encoded = key.encode()
+        (used,) = _HEADER.unpack_from(mapped)
+        value_offset = used + _KEY_LENGTH.size + _padded(len(encoded))
+        end = value_offset + _VALUE.size
+
+        if end > len(mapped):
+            size = len(mapped)
+            while size < end:
+                size *= 2
+            mapped.resize(size)
+
+        _KEY_LENGTH.pack_into(mapped, used, len(encoded))
+        mapped[used + _KEY_LENGTH.size : used + _KEY_LENGTH.size + len(encoded)] = (
+            encoded
+        )
+        _VALUE.pack_into(mapped, value_offset, 0.0)
+        # Published last: readers never see a partially written entry.
+        _HEADER.pack_into(mapped, 0, end)
+
+        self._offsets[key] = value_offset
+        return mapped, value_offset
+
+    def add(self, key: str, amount: float) -> None:
+        with self._lock:
+            mapped = self._file
+            if mapped is None or self._pid != os.getpid():
+                mapped = self._open()
+
+            offset = self._offsets.get(key)
+            if offset is None:
+                mapped, offset = self._append(mapped, key)
+
+            (value,) = _VALUE.unpack_from(mapped, offset)
+            _VALUE.pack_into(mapped, offset, value + amount)
+
+    def items(self) -> Iterable[tuple[str, float]]:
+        totals: dict[str, float] = defaultdict(float)
+
+        for path in sorted(self.directory.glob("metrics-*.db")):
+            for key, value in _read_entries(path.read_bytes()):
+                totals[key] += value
+
+        return list(totals.items())
+
+
+Labels = list[tuple[str, str]]
+
+
+def _sample_key(metric: str, suffix: str, labels: Labels) -> str:
+    return json.dumps([metric, suffix, labels], separators=(",", ":"))
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample_line(name: str, labels: Labels, value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+
+    pairs = ",".join(f'{label}="{_escape(text)}"' for label, text in labels)
+    return f"{name}{{{pairs}}} {_format_value(value)}"
+
+
+class Metric(ABC):
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        registry: "Registry | None" = None,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.registry = registry if registry is not None else REGISTRY
+        self.registry.register(self)
+
+    def _labels(self, values: Sequence[str]) -> Labels:
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels: {', '.join(self.labelnames)}."
+            )
+        return list(zip(self.labelnames, map(str, values), strict=True))
+
+    @abstractmethod
+    def lines(self, samples: dict[tuple[str, str], float]) -> Iterator[str]:
+        """Exposition lines from summed samples, keyed by suffix and labels."""
+
+
+class CounterChild:
+    __slots__ = ("key", "registry")
+
+    def __init__(self, registry: "Registry", key: str) -> None:
+        self.registry = registry
+        self.key = key
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.registry.store.add(self.key, amount)
+
+
+class Counter(Metric):
+    """Monotonic counter; by convention, its name ends with `_total`."""
+
+    type = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        registry: "Registry | None" = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, registry=registry)
+        self._children: dict[tuple[str, ...], CounterChild] = {}
+
+    def labels(self, *values: str) -> CounterChild:
+        child = self._children.get(values)
+
+        if child is None:
+            key = _sample_key(self.name, "", self._labels(values))
+            child = self._children[values] = CounterChild(self.registry, key)
+
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def lines(self, samples: dict[tuple[str, str], float]) -> Iterator[str]:
+        for (suffix, labels), value in sorted(samples.items()):
+            yield _sample_line(f"{self.name}{suffix}", json.loads(labels), value)
+
+
+class HistogramChild:
+    __slots__ = ("bucket_keys", "buckets", "count_key", "registry", "sum_key")
+
+    def __init__(
+        self,
+        registry: "Registry",
+        name: str,
+        labels: Labels,
+        buckets: tuple[float, ...],
+    ) -> None:
+        self.registry = registry
+        self.buckets = buckets
+        # Counts per bucket, not cumulative: one write per observation.
+        self.bucket_keys = [
+            _sample_key(name, "_bucket", [*labels, ("le", _format_value(bound))])
+            for bound in (*buckets, math.inf)
+        ]
+        self.sum_key = _sample_key(name, "_sum", labels)
+        self.count_key = _sample_key(name, "_count", labels)
+
+    def observe(self, value: float) -> None:
+        store = self.registry.store
+        store.add(self.bucket_keys[bisect.bisect_left(self.buckets, value)], 1.0)
+        store.add(self.sum_key, value)
+        store.add(self.count_key, 1.0)
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        *,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: "Registry | None" = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames, registry=registry)
+        self.buckets = tuple(sorted(buckets))
+        self._children: dict[tuple[str, ...], HistogramChild] = {}
+
+    def labels(self, *values: str) -> HistogramChild:
+        child = self._children.get(values)
+
+        if child is None:
+            child = self._children[values] = HistogramChild(
+                self.registry,
+                self.name,
+                self._labels(values),
+                self.buckets,
+            )
+
+        return child
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def lines(self, samples: dict[tuple[str, str], float]) -> Iterator[str]:
+        """Cumulative buckets, sum and count of each label set."""
+        series = sorted({labels for suffix, labels in samples if suffix == "_count"})
+
+        for labels_key in series:
+            labels: Labels = [(name, value) for name, value in json.loads(labels_key)]
+            cumulative = 0.0
+
+            for bound in (*self.buckets, math.inf):
+                bucket_labels = [*labels, ("le", _format_value(bound))]
+                bucket_key = json.dumps(bucket_labels, separators=(",", ":"))
+                cumulative += samples.get(("_bucket", bucket_key), 0.0)
+                yield _sample_line(f"{self.name}_bucket", bucket_labels, cumulative)
+
+            for suffix in ("_sum", "_count"):
+                value = samples.get((suffix, labels_key), 0.0)
+                yield _sample_line(f"{self.name}{suffix}", labels, value)
+
+
+class Registry:
+    def __init__(self, store: Store | None = None) -> None:
+        self._store = store
+        self._metrics: dict[str, Metric] = {}
+
+    @property
+    def store(self) -> Store:
+        if self._store is None:
+            directory = settings.METRICS_DIR
+            self._store = FileStore(directory) if directory else MemoryStore()
+        return self._store
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+
+    def exposition(self) -> str:
+        """All metrics in the Prometheus text format, version 0.0.4."""
+        samples: dict[str, dict[tuple[str, str], float]] = defaultdict(dict)
+
+        for key, value in self.store.items():
+            name, suffix, labels = json.loads(key)
+            samples[name][suffix, json.dumps(labels, separators=(",", ":"))] = value
+
+        lines: list[str] = []
+
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            lines.extend(metric.lines(samples[name]))
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
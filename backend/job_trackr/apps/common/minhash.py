@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/minhash.py
+
+"""
+MinHash signatures and locality-sensitive hashing (LSH) bands.
+
+A MinHash signature summarizes a set of shingles so that the fraction of
+equal positions in two signatures estimates the Jaccard similarity of the
+sets. LSH splits signatures into bands and hashes each band to a bucket:
+similar sets share at least one bucket with high probability, so candidate
+pairs are found by bucket lookups instead of all-pairs comparisons.
+
+With `NUM_PERMUTATIONS = 128` split into `BANDS = 32` bands of 4 rows, two
+sets become candidates with probability 1 - (1 - s^4)^32, i.e. about 0.87
+at a similarity of 0.5 and 0.99 at 0.6.
+
+Hashes are derived from BLAKE2b, never from `hash()`, which is randomized
+per process: stored signatures and buckets must be stable across restarts.
+"""
+
+import hashlib
+import random
+from collections.abc import Iterable, Sequence
+
+NUM_PERMUTATIONS = 128
+BANDS = 32
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+SHINGLE_SIZE = 3
+
+# Mersenne prime larger than any 32-bit shingle hash; signature values fit
+# in a signed 64-bit column.
+_PRIME = (1 << 61) - 1
+
+# Fixed seed: the permutations must never change for stored signatures.
+_random = random.Random(20_260_101)
+_PERMUTATIONS = [
+    (_random.randrange(1, _PRIME), _random.randrange(0, _PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def _hash64(value: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "big")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Word n-grams of `text`; texts shorter than `size` words are one shingle."""
+    words = text.split()
+
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def signature(items: Iterable[str]) -> list[int] | None:
+    """MinHash signature of a set of strings, or None when it is empty."""
+    hashes = {_hash64(item.encode()) & 0xFFFFFFFF for item in items}
+
+    if not hashes:
+        return None
+
+    return [min((a * x + b) % _PRIME for x in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the sets behind two signatures."""
+    equal = sum(1 for a, b in zip(left, right, strict=True) if a == b)
+    return equal / len(left)
+
+
+def lsh_buckets(values: Sequence[int]) -> list[int]:
+    """One bucket per band, as signed 64-bit integers."""
+    buckets = []
+
+    for band in range(BANDS):
+        rows = values[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        payload = b"".join(value.to_bytes(8, "big") for value in (band, *rows))
+        bucket = hashlib.blake2b(payload, digest_size=8).digest()
+        buckets.append(int.from_bytes(bucket, "big", signed=True))
+
+    return buckets
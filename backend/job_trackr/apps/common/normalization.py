@@ -5,6 +5,26 @@ import re
 import unicodedata
 from urllib.parse import urlparse, urlunparse
 
+# Characters matched by `str.strip()` and the `\s` of `re`, as PostgreSQL
+# regular expression escapes: its own `\s` does not match most of them.
+WHITESPACE_SQL = (
+    r"\u0009-\u000d\u001c-\u0020\u0085\u00a0\u1680\u2000-\u200a\u2028\u2029"
+    r"\u202f\u205f\u3000"
+)
+# Whitespace left once text is reduced to ASCII.
+_ASCII_WHITESPACE_SQL = r"\u0009-\u000d\u001c-\u0020"
+
+# Absolute URLs `normalize_url_sql()` applies to: Django's URLValidator,
+# which the API validates URLs with, without the length limits of host
+# labels, which make PostgreSQL's regular expressions far slower.
+URL_PATTERN_SQL = (
+    r"^(https?|ftps?)://([^\s:@/]+(:[^\s:@/]*)?@)?"
+    r"(localhost|[0-9]{1,3}(\.[0-9]{1,3}){3}|\[[0-9a-f:.]+\]"
+    r"|([a-z0-9\u00a1-\uffff]([a-z0-9\u00a1-\uffff-]*[a-z0-9\u00a1-\uffff])?\.)+"
+    r"[a-z\u00a1-\uffff-]{2,}\.?)"
+    r"(:[0-9]{1,5})?([/?#]\S*)?$"
+)
+
 
 def normalize_text(value: str | None) -> str | None:
     if value is None:
@@ -57,3 +77,90 @@ def normalize_url(value: str | None) -> str | None:
     )
 
     return urlunparse(normalized)
+
+
+# SQL counterparts, for set-based writes such as imports. Each returns an
+# expression normalizing the SQL expression `value` like the function above
+# does, NULL included.
+
+
+def strip_sql(value: str) -> str:
+    """SQL expression of `value.strip()`."""
+    return (
+        f"regexp_replace({value}, '^[{WHITESPACE_SQL}]+|[{WHITESPACE_SQL}]+$', '', 'g')"
+    )
+
+
+def normalize_text_sql(value: str) -> str:
+    """
+    SQL expression of `normalize_text(value)`.
+
+    Text is reduced to ASCII before being lowercased, so the result does
+    not depend on the database's locale.
+    """
+    value = f"normalize({strip_sql(value)}, NFKD)"
+    value = rf"lower(regexp_replace({value}, '[^\u0001-\u007f]', '', 'g'))"
+    value = f"regexp_replace({value}, '[{_ASCII_WHITESPACE_SQL}]+', ' ', 'g')"
+    value = f"regexp_replace({value}, '[^A-Za-z0-9_{_ASCII_WHITESPACE_SQL}+#./&-]', '', 'g')"
+
+    return f"NULLIF({value}, '')"
+
+
+def normalize_url_sql(value: str) -> str:
+    """
+    SQL expression of `normalize_url(value)` for values matching
+    `URL_PATTERN_SQL`, and NULL for others.
+
+    The URL is split like `urlparse()` does: the parameters of the last
+    path segment are kept apart from the path, whose trailing slashes are
+    removed, and an empty query or fragment is dropped. String functions
+    split it, much faster than a regular expression with groups would.
+    """
+    return f"""(
+        SELECT
+            lower(left(base, strpos(base, '://') + 2))
+            || lower(split_part(authority, '/', 1))
+            || CASE WHEN path = '' OR left(path, 1) = '/' THEN path ELSE '/' || path END
+            || CASE WHEN length(query) > 1 THEN query ELSE '' END
+            || CASE WHEN length(fragment) > 1 THEN fragment ELSE '' END
+        FROM
+            (SELECT {value} AS url) AS source,
+            LATERAL (
+                SELECT
+                    split_part(url, '#', 1) AS head,
+                    CASE WHEN strpos(url, '#') > 0
+                        THEN substr(url, strpos(url, '#')) ELSE ''
+                    END AS fragment
+            ) AS fragment,
+            LATERAL (
+                SELECT
+                    split_part(head, '?', 1) AS base,
+                    CASE WHEN strpos(head, '?') > 0
+                        THEN substr(head, strpos(head, '?')) ELSE ''
+                    END AS query
+            ) AS query,
+            LATERAL (
+                SELECT substr(base, strpos(base, '://') + 3) AS authority
+            ) AS authority,
+            LATERAL (
+                SELECT CASE WHEN strpos(authority, '/') > 0
+                    THEN substr(authority, strpos(authority, '/')) ELSE ''
+                END AS full_path
+            ) AS full_path,
+            LATERAL (
+                SELECT CASE WHEN strpos(full_path, ';') > 0
+                    THEN regexp_match(full_path, '^(.*/)?([^/;]*)(;[^/]*)?$')
+                END AS segments
+            ) AS segments,
+            LATERAL (
+                SELECT
+                    CASE WHEN segments IS NULL OR segments[3] IS NULL
+                        THEN rtrim(full_path, '/')
+                        ELSE rtrim(coalesce(segments[1], '') || segments[2], '/')
+                            || CASE WHEN length(segments[3]) > 1
+                                THEN segments[3] ELSE ''
+                            END
+                    END AS path
+            ) AS path
+        WHERE url ~* '{URL_PATTERN_SQL}'
+    )"""
@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/search.py
+
+import re
+from collections.abc import Iterable
+from functools import reduce
+from operator import add
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db.models import Expression
+
+# NOTE:
+# The `simple` configuration lowercases tokens but does not stem them or drop
+# stop words. Postings are written in several languages (French and English
+# mostly), so a language-specific dictionary would mangle half of them.
+# Prefix matching (see `build_search_query`) covers plurals and partial words
+# typed in the search box.
+SEARCH_CONFIG = "simple"
+
+_TERM_RE = re.compile(r"\w+")
+
+
+def weighted_search_vector(*weighted_fields: tuple[str, str]) -> Expression:
+    """
+    Build a concatenated `tsvector` expression from (field, weight) pairs.
+
+    The result is immutable and can be used as a `GeneratedField` expression.
+    """
+    vectors = [
+        SearchVector(field, weight=weight, config=SEARCH_CONFIG)
+        for field, weight in weighted_fields
+    ]
+
+    combined: Expression = reduce(add, vectors)
+    return combined
+
+
+def build_search_query(terms: Iterable[str]) -> SearchQuery | None:
+    """
+    Turn raw search box terms into a prefix-matching `tsquery`.
+
+    Every word must match (AND), and the last characters typed may be an
+    incomplete word. Punctuation is dropped so user input can never produce
+    an invalid `tsquery`. Returns None when nothing searchable remains.
+    """
+    words = [word for term in terms for word in _TERM_RE.findall(term.lower())]
+
+    if not words:
+        return None
+
+    raw_query = " & ".join(f"{word}:*" for word in words)
+
+    return SearchQuery(raw_query, search_type="raw", config=SEARCH_CONFIG)
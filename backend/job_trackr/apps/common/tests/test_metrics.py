@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/tests/test_metrics.py
+
+import multiprocessing
+
+import pytest
+
+from apps.common.metrics import Counter, FileStore, Histogram, MemoryStore, Registry
+
+
+@pytest.fixture
+def registry():
+    return Registry(MemoryStore())
+
+
+def test_counter_exposition(registry):
+    counter = Counter("jobs_total", "Jobs.", ["kind"], registry=registry)
+
+    counter.labels("posted").inc()
+    counter.labels("posted").inc(2)
+    counter.labels('say "hi"').inc()
+
+    assert registry.exposition() == (
+        "# HELP jobs_total Jobs.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{kind="posted"} 3\n'
+        'jobs_total{kind="say \\"hi\\""} 1\n'
+    )
+
+
+def test_histogram_exposition_is_cumulative(registry):
+    histogram = Histogram(
+        "latency_seconds",
+        "Latency.",
+        buckets=(0.1, 1.0),
+        registry=registry,
+    )
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert registry.exposition().splitlines()[2:] == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_labels_must_match(registry):
+    counter = Counter("jobs_total", "Jobs.", ["kind"], registry=registry)
+
+    with pytest.raises(ValueError, match="expects labels: kind"):
+        counter.labels("posted", "extra")
+
+
+def test_metric_names_are_unique(registry):
+    Counter("jobs_total", "Jobs.", registry=registry)
+
+    with pytest.raises(ValueError, match="already registered"):
+        Counter("jobs_total", "Jobs.", registry=registry)
+
+
+def _record_in_child(store, amount):
+    store.add("requests", amount)
+
+
+def test_file_store_sums_processes(tmp_path):
+    store = FileStore(tmp_path)
+    store.add("requests", 1.0)
+
+    context = multiprocessing.get_context("fork")
+    children = [
+        context.Process(target=_record_in_child, args=(store, amount))
+        for amount in (2.0, 3.0)
+    ]
+    for child in children:
+        child.start()
+    for child in children:
+        child.join()
+
+    assert len(list(tmp_path.glob("metrics-*.db"))) == 3
+    assert dict(store.items()) == {"requests": 6.0}
+
+
+def test_file_store_grows_and_reopens(tmp_path):
+    store = FileStore(tmp_path)
+    keys = [f"key-{index:05d}-{'x' * 100}" for index in range(1_000)]
+
+    for key in keys:
+        store.add(key, 1.0)
+
+    reopened = FileStore(tmp_path)
+    reopened.add(keys[0], 1.0)
+
+    values = dict(reopened.items())
+    assert len(values) == 1_000
+    assert values[keys[0]] == 2.0
+    assert values[keys[-1]] == 1.0
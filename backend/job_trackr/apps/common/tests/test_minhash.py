@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/tests/test_minhash.py
+
+from apps.common.minhash import (
+    BANDS,
+    NUM_PERMUTATIONS,
+    lsh_buckets,
+    shingles,
+    signature,
+    similarity,
+)
+
+WORDS = [f"word{n}" for n in range(200)]
+
+
+def test_shingles_are_word_trigrams():
+    assert shingles("a b c d") == {"a b c", "b c d"}
+
+
+def test_shingles_of_short_text():
+    assert shingles("backend engineer") == {"backend engineer"}
+    assert shingles("") == set()
+
+
+def test_signature_of_empty_set():
+    assert signature([]) is None
+
+
+def test_signature_is_deterministic():
+    values = signature(WORDS)
+
+    assert values is not None
+    assert len(values) == NUM_PERMUTATIONS
+    assert values == signature(reversed(WORDS))
+
+
+def test_similarity_estimates_jaccard():
+    # Jaccard similarity of 100 / 200 = 0.5.
+    left = signature(WORDS[:150])
+    right = signature(WORDS[50:])
+
+    assert left is not None and right is not None
+    assert similarity(left, left) == 1.0
+    assert 0.35 <= similarity(left, right) <= 0.65
+    assert similarity(left, signature(f"other{n}" for n in range(150))) < 0.1
+
+
+def test_similar_sets_share_a_bucket():
+    left = signature(WORDS)
+    right = signature(WORDS[:190])
+
+    assert left is not None and right is not None
+    assert len(lsh_buckets(left)) == BANDS
+    assert set(lsh_buckets(left)) & set(lsh_buckets(right))
@@ -1,7 +1,51 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/common/tests/test_normalization.py
 
-from apps.common.normalization import normalize_text
+import re
+import sys
+
+import pytest
+from django.db import connection
+
+from apps.common.normalization import (
+    WHITESPACE_SQL,
+    normalize_text,
+    normalize_text_sql,
+    normalize_url,
+    normalize_url_sql,
+    strip_sql,
+)
+
+TEXTS = [
+    None,
+    "",
+    "   ",
+    "  Développeur   Backend ",
+    "C++ / C# Developer!!",
+    "\u3000Ｐｙｔｈｏｎ\u00a0dev\u2003",
+    "İstanbul straße ﬁnance",
+    "a ! b\x1cc\x85d",
+    "Tab\there\nnew line",
+    "Node.js & Co (Go - Python)",
+    "!!!",
+]
+URLS = [
+    None,
+    "https://Jobs.Example.COM/a/b/",
+    "HTTP://example.io",
+    "https://example.io/a;p?q=1#f",
+    "https://example.io/a;p/b;c",
+    "https://example.io/a/;x",
+    "https://example.io/a;",
+    "https://example.io/?",
+    "https://example.io/#",
+    "https://example.io/a?b#c?d",
+    "https://example.io#a/b;c",
+    "ftp://user:pw@Host.org:21/p//",
+    "https://example.io///a//",
+    "https://[::1]:8000/A",
+    "https://éxample.fr/Café/",
+]
 
 
 def test_normalize_text_none():
@@ -49,3 +93,46 @@ def test_normalize_text_whitespace_collapse():
 
 def test_normalize_text_only_punctuation():
     assert normalize_text("!!!") is None
+
+
+def _sql(expression, value):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT {expression('value')} FROM (SELECT %s::text AS value) AS t",
+            [value],
+        )
+        return cursor.fetchone()[0]
+
+
+def test_whitespace_sql_matches_str_isspace():
+    ranges = re.findall(r"\\u(\w{4})(?:-\\u(\w{4}))?", WHITESPACE_SQL)
+    characters = {
+        chr(code)
+        for start, stop in ranges
+        for code in range(int(start, 16), int(stop or start, 16) + 1)
+    }
+
+    assert characters == {
+        character
+        for character in map(chr, range(sys.maxunicode + 1))
+        if character.isspace()
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("value", TEXTS)
+def test_sql_normalizes_text_like_python(value):
+    assert _sql(strip_sql, value) == (None if value is None else value.strip())
+    assert _sql(normalize_text_sql, value) == normalize_text(value)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("value", URLS)
+def test_sql_normalizes_url_like_python(value):
+    assert _sql(normalize_url_sql, value) == normalize_url(value)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("value", ["example.io/a", "mailto:a@example.io", "http://x"])
+def test_sql_does_not_normalize_invalid_url(value):
+    assert _sql(normalize_url_sql, value) is None
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/tests/test_renderers.py
+
+import io
+import json
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.api.parsers import NDJSONParser, ORJSONParser
+from apps.common.api.renderers import ORJSONRenderer
+
+PAGE = {
+    "count": 2,
+    "next": None,
+    "results": [
+        {
+            "id": UUID("0190d6c2-5a3b-7cc1-8f37-8d3f1c1b2a10"),
+            "title": "Ingénieur backend 🚀",
+            "posted_on": date(2026, 5, 1),
+            "easy_apply": True,
+            "salary": None,
+            "label": gettext_lazy("Remote"),
+            "tags": ["python", "django"],
+        },
+        {"id": 2, "title": "Line\u2028separator\u2029", "ratio": 0.25},
+    ],
+}
+
+
+def test_render_matches_json_renderer():
+    assert ORJSONRenderer().render(PAGE) == JSONRenderer().render(PAGE)
+
+
+def test_render_decimal_like_json_renderer():
+    data = {"amount": Decimal("12.50")}
+
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_render_datetimes_keep_microseconds():
+    data = {"at": datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)}
+
+    assert ORJSONRenderer().render(data) == b'{"at":"2026-05-01T12:30:15.123456Z"}'
+
+
+def test_render_none_is_empty():
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_render_indented_like_json_renderer():
+    media_type = "application/json; indent=4"
+
+    assert ORJSONRenderer().render(PAGE, media_type) == JSONRenderer().render(
+        PAGE, media_type
+    )
+
+
+@pytest.mark.parametrize("count", [0, 1, 5, 12])
+def test_render_chunks_is_a_json_array(count):
+    items = [{"n": n} for n in range(count)]
+
+    chunks = list(ORJSONRenderer().render_chunks(iter(items), chunk_size=5))
+
+    assert json.loads(b"".join(chunks)) == items
+    assert len(chunks) == -(-count // 5) + 1
+
+
+def test_parse():
+    stream = io.BytesIO('{"title": "Ingénieur", "tags": [1, 2]}'.encode())
+
+    assert ORJSONParser().parse(stream) == {"title": "Ingénieur", "tags": [1, 2]}
+
+
+def test_parse_other_encoding():
+    stream = io.BytesIO('{"title": "Ingénieur"}'.encode("latin-1"))
+
+    data = ORJSONParser().parse(stream, parser_context={"encoding": "latin-1"})
+
+    assert data == {"title": "Ingénieur"}
+
+
+@pytest.mark.parametrize("body", [b"{", b'{"value": NaN}', b"\xff"])
+def test_parse_errors(body):
+    with pytest.raises(ParseError, match="JSON parse error"):
+        ORJSONParser().parse(io.BytesIO(body))
+
+
+def test_parse_ndjson():
+    stream = io.BytesIO('{"title": "Ingénieur"}\n\n[1, 2]\n'.encode())
+
+    assert NDJSONParser().parse(stream) == [{"title": "Ingénieur"}, [1, 2]]
+
+
+@pytest.mark.parametrize("body", [b'{"a": 1}\n{\n', b'{"a": 1}\n\xff\n'])
+def test_parse_ndjson_errors(body):
+    with pytest.raises(ParseError, match="NDJSON parse error"):
+        NDJSONParser().parse(io.BytesIO(body))
@@ -8,3 +8,13 @@ from uuid6 import uuid7
 
 def uuid7_default() -> UUID:
     return uuid7()
+
+
+# SQL expression of a new uuid7, for rows inserted by set-based statements:
+# the Unix time in milliseconds of `clock_timestamp()` written over the first
+# 48 bits of a random uuid4, whose version bits are then set from 4 to 7.
+UUID7_SQL = (
+    "encode(set_bit(set_bit(overlay(uuid_send(gen_random_uuid()) placing "
+    "substring(int8send((extract(epoch FROM clock_timestamp()) * 1000)::bigint) "
+    "FROM 3) FROM 1 FOR 6), 52, 1), 53, 1), 'hex')::uuid"
+)
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/common/views.py
+
+import hmac
+
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+from django.views.decorators.http import require_GET
+
+from apps.common.metrics import CONTENT_TYPE, REGISTRY
+
+
+def _is_scraper(request: HttpRequest) -> bool:
+    token = settings.METRICS_TOKEN
+
+    if token is None:
+        # Behind a reverse proxy, this is the proxy's address for every
+        # client: set METRICS_TOKEN there.
+        return request.META.get("REMOTE_ADDR") in settings.METRICS_ALLOWED_IPS
+
+    credentials = request.headers.get("Authorization", "")
+    return hmac.compare_digest(credentials.encode(), f"Bearer {token}".encode())
+
+
+@require_GET
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Prometheus scrape endpoint, only served to requests bearing
+    `METRICS_TOKEN`, or without a token to `METRICS_ALLOWED_IPS`: other
+    clients get a 404, as if it did not exist.
+    """
+    if not _is_scraper(request):
+        raise Http404
+
+    return HttpResponse(REGISTRY.exposition(), content_type=CONTENT_TYPE)
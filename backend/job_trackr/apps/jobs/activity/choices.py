@@ -0,0 +1,16 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/activity/choices.py
+
+from django.db import models
+
+
+class ActivityPeriod(models.TextChoices):
+    DAY = "day", "Day"
+    WEEK = "week", "Week"
+
+
+class ActivityKind(models.TextChoices):
+    # Job postings, dated by `posted_on`.
+    POSTED = "posted", "Posted"
+    # Job candidacies, dated by `applied_on`.
+    APPLIED = "applied", "Applied"
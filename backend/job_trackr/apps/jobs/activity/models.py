@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/activity/models.py
+
+from django.db import models
+
+from apps.jobs.activity.choices import ActivityKind, ActivityPeriod
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.postings.choices import Platforms
+
+
+class JobActivityRollup(models.Model):
+    """
+    Per-day and per-week counts of posted job postings and of candidacies,
+    by platform and candidacy status.
+
+    Read-only: backed by the `job_activity_rollup` materialized view that
+    the migrations create (see apps.jobs.activity.rollups), refreshed by the
+    `refresh_activity_rollups` command. Rows are as fresh as the last
+    refresh.
+    """
+
+    pk = models.CompositePrimaryKey(
+        "period",
+        "period_start",
+        "kind",
+        "platform",
+        "status",
+    )
+
+    period = models.CharField(max_length=10, choices=ActivityPeriod.choices)
+    # The day itself, or the Monday of the ISO week.
+    period_start = models.DateField()
+    kind = models.CharField(max_length=10, choices=ActivityKind.choices)
+    platform = models.CharField(max_length=50, choices=Platforms.choices, blank=True)
+    # Blank for job postings.
+    status = models.CharField(
+        max_length=50,
+        choices=CandidacyStatus.choices,
+        blank=True,
+    )
+    count = models.BigIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = "job_activity_rollup"
+        verbose_name = "job activity rollup"
+        ordering = ["period", "period_start", "kind", "platform", "status"]
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.period} of {self.period_start}: {self.count}"
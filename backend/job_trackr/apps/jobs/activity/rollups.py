@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/activity/rollups.py
+
+"""
+Activity rollups: the `job_activity_rollup` materialized view.
+
+Histories over months of postings and candidacies are read from
+precomputed per-day and per-week counts instead of scanning both tables on
+every request. Both periods come from one pass over the tables, with
+`GROUPING SETS`. The view and its unique index are created by migration
+0013 of the jobs app.
+
+`REFRESH MATERIALIZED VIEW CONCURRENTLY` recomputes the view next to the
+current one and applies the differences: readers keep reading the old rows
+meanwhile and are never blocked. It relies on the view's unique index.
+"""
+
+from datetime import date
+
+from django.db import connection
+from django.db.models import QuerySet
+
+from apps.jobs.activity.choices import ActivityPeriod
+from apps.jobs.activity.models import JobActivityRollup
+
+VIEW_NAME = JobActivityRollup._meta.db_table
+
+
+def refresh_activity_rollups(*, concurrently: bool = True) -> None:
+    """
+    Recompute the rollups. Without `concurrently`, the refresh is faster
+    but locks readers out until it ends.
+    """
+    mode = " CONCURRENTLY" if concurrently else ""
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"REFRESH MATERIALIZED VIEW{mode} {VIEW_NAME}")
+
+
+def activity_history(
+    period: ActivityPeriod,
+    *,
+    since: date,
+) -> QuerySet[JobActivityRollup]:
+    """Rollups of `period` starting on or after `since`, oldest first."""
+    return JobActivityRollup.objects.filter(period=period, period_start__gte=since)
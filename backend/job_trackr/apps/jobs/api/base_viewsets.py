@@ -1,14 +1,37 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/api/base_viewsets.py
 
+from collections.abc import Callable, Sequence
+from functools import cached_property, partial
 from typing import Any, TypeVar, cast
 
-from django.db.models import Model
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Model, OneToOneRel, QuerySet
 from rest_framework import serializers, status, viewsets
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from apps.common.api.compiled import CompiledSerializer
+from apps.common.api.conditional import (
+    Validators,
+    detail_validators,
+    list_validators,
+    not_modified_response,
+    page_validators,
+    set_validator_headers,
+)
+from apps.common.api.fieldsets import Fieldset, apply_fieldset, parse_fieldset
+from apps.common.api.pagination import DefaultPagination
+from apps.common.api.response_cache import (
+    record_response_cache_lookup,
+    response_cache_key,
+)
+from apps.common.cache import get_model_versions
+from apps.common.instrumentation import serialization_timer
+
 ModelT = TypeVar("ModelT", bound=Model)
+RowT = TypeVar("RowT")
 
 
 class ReadAfterWriteModelViewSet(viewsets.ModelViewSet[ModelT]):
@@ -19,12 +42,60 @@ class ReadAfterWriteModelViewSet(viewsets.ModelViewSet[ModelT]):
     - a dedicated serializer for write actions;
     - serializer_class for detail and write responses.
 
-    Create and update responses are serialized again using serializer_class.
+    Create and update responses are serialized again using serializer_class,
+    from the saved instance: relations loaded with `select_related()` are
+    already attached to it, and reverse one-to-one relations of a new object
+    are known to be empty. The object is only re-fetched when `get_queryset()`
+    has annotations outside `derived_annotations`.
+
+    With `cache_responses`, list and retrieve response data is cached for
+    `API_RESPONSE_CACHE_TIMEOUT` seconds, keyed by the versions of
+    `cache_dependencies` (see apps.common.api.response_cache). Responses
+    carry an `X-Cache: HIT` or `X-Cache: MISS` header.
+
+    List and retrieve responses carry validators derived from
+    `last_modified_fields` and answer conditional requests with
+    `304 Not Modified` (see apps.common.api.conditional). Lists whose
+    paginator does not count every row (keyset pages, inexact counts) take
+    them from the page instead of an aggregate over the filtered queryset.
+
+    List and retrieve accept `?fields=` or `?omit=` to trim the serializer
+    and the columns loaded by the queryset (see apps.common.api.fieldsets).
+
+    With `compile_list_serializer`, list pages are read with `values()` and
+    serialized by the compiled list serializer instead of DRF's field
+    machinery (see apps.common.api.compiled).
     """
 
     list_serializer_class: type[serializers.BaseSerializer[Any]]
     write_serializer_class: type[serializers.BaseSerializer[Any]]
 
+    # Models whose writes can change the responses of this viewset.
+    # Their version counters key cached data (see apps.common.cache).
+    # Defaults to the queryset model when empty.
+    cache_dependencies: list[type[Model]] = []
+
+    cache_responses = False
+
+    # Timestamps the representation of an object depends on, including
+    # those of related objects it embeds. They back the ETag and
+    # Last-Modified validators of list and retrieve responses.
+    last_modified_fields: list[str] = ["updated_at"]
+
+    list_row_count: int | None = None
+
+    compile_list_serializer = False
+
+    # Annotations of get_queryset() that serializers compute themselves when
+    # missing, e.g. text previews. Stale values are dropped before create
+    # and update responses are serialized.
+    derived_annotations: frozenset[str] = frozenset()
+
+    # Columns read by serializer fields that are not plain model fields
+    # (labels, previews, nested objects), for sparse fieldsets.
+    fieldset_columns: dict[str, list[str]] = {}
+    fieldset_actions = frozenset({"list", "retrieve"})
+
     write_actions = frozenset(
         {
             "create",
@@ -46,15 +117,252 @@ class ReadAfterWriteModelViewSet(viewsets.ModelViewSet[ModelT]):
 
         return super().get_serializer_class()
 
+    @cached_property
+    def fieldset(self) -> Fieldset | None:
+        if getattr(self, "action", None) not in self.fieldset_actions:
+            return None
+
+        serializer = cast(serializers.Serializer[Any], self.get_serializer_class()())
+        return parse_fieldset(self.request.query_params, serializer.fields)
+
+    def filter_queryset(
+        self,
+        queryset: QuerySet[ModelT, RowT],
+    ) -> QuerySet[ModelT, RowT]:
+        queryset = super().filter_queryset(queryset)
+
+        if self.fieldset is None:
+            return queryset
+
+        return apply_fieldset(
+            queryset,
+            self.fieldset,
+            column_map=self.fieldset_columns,
+            required=self.last_modified_fields,
+        )
+
+    def get_serializer(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> serializers.BaseSerializer[ModelT]:
+        serializer = super().get_serializer(*args, **kwargs)
+
+        if self.fieldset is not None:
+            # List serializers hold the fields on their child.
+            target = cast(
+                serializers.Serializer[Any],
+                getattr(serializer, "child", serializer),
+            )
+            for name in self.fieldset.omitted:
+                target.fields.pop(name)
+
+        return serializer
+
+    def get_cache_dependencies(self) -> list[type[Model]]:
+        return self.cache_dependencies or [self.get_queryset().model]
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        counts_all_rows = getattr(self.paginator, "counts_all_rows", None)
+        if counts_all_rows is not None and not counts_all_rows(request):
+            return self._page_validated_list(request)
+
+        def validators() -> Validators:
+            validators = list_validators(
+                self.filter_queryset(self.get_queryset()),
+                self.last_modified_fields,
+                request,
+            )
+            # Reused by DefaultPagination instead of a second COUNT(*).
+            self.list_row_count = validators.row_count
+            return validators
+
+        build = (
+            self._compiled_list
+            if self.compile_list_serializer
+            else partial(super().list, request, *args, **kwargs)
+        )
+
+        return self._validated_response(request, validators=validators, build=build)
+
+    def _page_validated_list(self, request: Request) -> Response:
+        """
+        Same response as `list`, with validators computed from the page, so
+        that no query reads every filtered row.
+        """
+        page: list[Any] = []
+        serialize: Callable[[Sequence[Any]], Any] = self._serialize_list
+
+        def validators() -> Validators:
+            nonlocal serialize
+            queryset = self.filter_queryset(self.get_queryset())
+
+            rows: QuerySet[Any, Any] = queryset
+            if self.compile_list_serializer:
+                compiled = self._compile_list_serializer()
+                rows = self._list_values(
+                    compiled, queryset, extra=self.last_modified_fields
+                )
+                serialize = compiled.serialize
+
+            page.extend(cast(list[Any], self.paginate_queryset(rows)))
+            paginator = cast(DefaultPagination, self.paginator)
+
+            return page_validators(
+                page,
+                self.last_modified_fields,
+                request,
+                versions=get_model_versions(self.get_cache_dependencies()),
+                page_state=paginator.get_page_state(),
+            )
+
+        def build() -> Response:
+            return self.get_paginated_response(serialize(page))
+
+        return self._validated_response(request, validators=validators, build=build)
+
+    def _serialize_list(self, rows: Sequence[Any]) -> Any:
+        return self.get_serializer(rows, many=True).data
+
+    def _compile_list_serializer(self) -> CompiledSerializer:
+        serializer = cast(
+            serializers.ListSerializer[Any],
+            self.get_serializer(many=True),
+        )
+        return CompiledSerializer(
+            cast(serializers.ModelSerializer[Any], serializer.child)
+        )
+
+    def _list_values(
+        self,
+        compiled: CompiledSerializer,
+        queryset: QuerySet[Any],
+        extra: Sequence[str] = (),
+    ) -> QuerySet[Any, dict[str, Any]]:
+        """
+        `values()` rows of the compiled serializer, with the ordering fields
+        keyset pagination seeks on, search rank included.
+        """
+        keyset_class = getattr(self.paginator, "keyset_pagination_class", None)
+        position_fields = (
+            keyset_class.position_fields(queryset) if keyset_class is not None else []
+        )
+
+        return compiled.values(queryset, extra=[*extra, *position_fields])
+
+    def _compiled_list(self) -> Response:
+        """Same response as `ListModelMixin.list`, built from `values()` rows."""
+        compiled = self._compile_list_serializer()
+
+        rows = self._list_values(compiled, self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(compiled.serialize(page))
+
+        return Response(compiled.serialize(rows))
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        instances: list[ModelT] = []
+
+        def validators() -> Validators:
+            instances.append(self.get_object())
+            return detail_validators(instances[0], self.last_modified_fields, request)
+
+        def build() -> Response:
+            # `validators` always runs first on a cache miss.
+            return Response(self.get_serializer(instances[0]).data)
+
+        return self._validated_response(request, validators=validators, build=build)
+
+    def _validated_response(
+        self,
+        request: Request,
+        *,
+        validators: Callable[[], Validators],
+        build: Callable[[], Response],
+    ) -> Response:
+        """
+        Answer a read with 304, cached data or a fresh response.
+
+        Cached entries store the validators next to the data, so a cache hit
+        runs no query at all, conditional or not. On a miss, validators are
+        computed first so that unchanged resources are never serialized.
+        """
+        key = self._response_cache_key(request)
+        entry = cache.get(key) if key is not None else None
+
+        if entry is not None:
+            record_response_cache_lookup(self._response_cache_scope(), hit=True)
+            cached_validators, data = entry
+
+            response = not_modified_response(request, cached_validators)
+            if response is None:
+                response = Response(data)
+
+            set_validator_headers(response, cached_validators)
+            response["X-Cache"] = "HIT"
+            # DRF finalizes any HttpResponseBase, including the 304.
+            return cast(Response, response)
+
+        if key is not None:
+            record_response_cache_lookup(self._response_cache_scope(), hit=False)
+
+        current_validators = validators()
+
+        response = not_modified_response(request, current_validators)
+        if response is None:
+            # Queries of lazy querysets are left out of the timing.
+            with serialization_timer():
+                response = build()
+
+        set_validator_headers(response, current_validators)
+
+        if key is not None:
+            response["X-Cache"] = "MISS"
+
+            if response.status_code == status.HTTP_200_OK:
+                cache.set(
+                    key,
+                    (current_validators, cast(Response, response).data),
+                    timeout=settings.API_RESPONSE_CACHE_TIMEOUT,
+                )
+
+        return cast(Response, response)
+
+    def _response_cache_scope(self) -> str:
+        return self.basename or type(self).__name__
+
+    def _response_cache_key(self, request: Request) -> str | None:
+        if not self.cache_responses or not settings.API_RESPONSE_CACHE_TIMEOUT:
+            return None
+
+        # Versions are read before the response is built: data computed
+        # during a concurrent write is stored under the old version, which
+        # is never read again.
+        return response_cache_key(
+            request,
+            scope=self._response_cache_scope(),
+            versions=get_model_versions(self.get_cache_dependencies()),
+        )
+
     def _serialize_detail_response(
         self,
         instance: ModelT,
     ) -> serializers.BaseSerializer[Any]:
         """
-        Re-fetch the object using the enriched queryset and serialize it
-        using the default detail serializer.
+        Serialize a saved object using the default detail serializer.
+
+        The object is re-fetched using the enriched queryset only when that
+        queryset has annotations the serializers cannot derive.
         """
-        instance = self.get_queryset().get(pk=instance.pk)
+        queryset = self.get_queryset()
+
+        if set(queryset.query.annotations) - self.derived_annotations:
+            instance = queryset.get(pk=instance.pk)
+        else:
+            for name in self.derived_annotations:
+                instance.__dict__.pop(name, None)
 
         detail_serializer_class = super().get_serializer_class()
 
@@ -63,6 +371,22 @@ class ReadAfterWriteModelViewSet(viewsets.ModelViewSet[ModelT]):
             context=self.get_serializer_context(),
         )
 
+    def _attach_empty_reverse_relations(self, instance: ModelT) -> None:
+        """
+        Mark the reverse one-to-one relations `get_queryset()` selects as
+        empty on a new object: nothing can point to it yet.
+        """
+        select_related = self.get_queryset().query.select_related
+
+        if not isinstance(select_related, dict):
+            return
+
+        for name in select_related:
+            field = instance._meta.get_field(name)
+
+            if isinstance(field, OneToOneRel) and not field.is_cached(instance):
+                field.set_cached_value(instance, None)
+
     def create(
         self,
         request: Request,
@@ -75,12 +399,13 @@ class ReadAfterWriteModelViewSet(viewsets.ModelViewSet[ModelT]):
         self.perform_create(write_serializer)
 
         instance = cast(ModelT, write_serializer.instance)
+        self._attach_empty_reverse_relations(instance)
         read_serializer = self._serialize_detail_response(instance)
 
-        return Response(
-            read_serializer.data,
-            status=status.HTTP_201_CREATED,
-        )
+        with serialization_timer():
+            data = read_serializer.data
+
+        return Response(data, status=status.HTTP_201_CREATED)
 
     def update(
         self,
@@ -103,4 +428,7 @@ class ReadAfterWriteModelViewSet(viewsets.ModelViewSet[ModelT]):
         updated_instance = cast(ModelT, write_serializer.instance)
         read_serializer = self._serialize_detail_response(updated_instance)
 
-        return Response(read_serializer.data)
+        with serialization_timer():
+            data = read_serializer.data
+
+        return Response(data)
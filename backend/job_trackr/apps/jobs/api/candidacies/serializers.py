@@ -1,12 +1,24 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/api/candidacies/serializers.py
 
+from typing import Any
+
+from django.core.validators import EMPTY_VALUES
+from django.db.models import QuerySet
 from django.utils.text import Truncator
 from rest_framework import serializers
 
+from apps.common.api.compiled import ValueField
+from apps.jobs.candidacies.choices import CandidacyStatus
 from apps.jobs.candidacies.models import JobCandidacy
 from apps.jobs.postings.models import JobPosting
 
+from .filters import JobCandidacyFilter
+
+NOTES_PREVIEW_LENGTH = 100
+
+BULK_STATUS_MAX_IDS = 10_000
+
 
 class JobPostingSummarySerializer(serializers.ModelSerializer[JobPosting]):
     class Meta:
@@ -45,9 +57,19 @@ class JobCandidacyListSerializer(serializers.ModelSerializer[JobCandidacy]):
             "updated_at",
         ]
         read_only_fields = tuple(fields)
+        # Columns of method fields for the compiled list serializer.
+        value_fields = {
+            "notes_preview": ValueField("notes_preview"),
+        }
 
     def get_notes_preview(self, obj: JobCandidacy) -> str:
-        return Truncator(obj.notes).chars(100)
+        # Annotated by JobCandidacyViewSet so lists can defer `notes`.
+        preview: str | None = getattr(obj, "notes_preview", None)
+
+        if preview is None:
+            return Truncator(obj.notes).chars(NOTES_PREVIEW_LENGTH)
+
+        return preview
 
 
 class JobCandidacyDetailSerializer(JobCandidacyListSerializer):
@@ -77,3 +99,59 @@ class JobCandidacyWriteSerializer(serializers.ModelSerializer[JobCandidacy]):
             )
 
         return job_posting
+
+
+class JobCandidacyBulkStatusSerializer(serializers.Serializer[Any]):
+    """
+    Target status of a bulk transition, and the candidacies it applies to:
+    either explicit `ids` or a `filter` object taking the filters of the
+    list endpoint (see JobCandidacyFilter).
+    """
+
+    status = serializers.ChoiceField(choices=CandidacyStatus.choices)
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=BULK_STATUS_MAX_IDS,
+        required=False,
+    )
+    filter = serializers.DictField(allow_empty=False, required=False)
+
+    def validate_filter(self, value: dict[str, Any]) -> dict[str, Any]:
+        filterset = JobCandidacyFilter(data=value, queryset=JobCandidacy.objects.all())
+
+        # Unknown filters would be ignored and widen the update.
+        unknown = sorted(set(value) - set(filterset.filters))
+        if unknown:
+            raise serializers.ValidationError(f"Unknown filters: {', '.join(unknown)}.")
+
+        if not filterset.is_valid():
+            raise serializers.ValidationError(filterset.errors)
+
+        # Blank filters are ignored too, and would select every candidacy.
+        cleaned_data = filterset.form.cleaned_data
+        if all(cleaned_data.get(name) in EMPTY_VALUES for name in value):
+            raise serializers.ValidationError("At least one filter must have a value.")
+
+        return value
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        if ("ids" in attrs) == ("filter" in attrs):
+            raise serializers.ValidationError(
+                "Provide either `ids` or `filter`, not both."
+            )
+
+        return attrs
+
+    def get_queryset(self) -> QuerySet[JobCandidacy]:
+        """Candidacies selected by the validated data."""
+        queryset = JobCandidacy.objects.all()
+
+        if "ids" in self.validated_data:
+            return queryset.filter(pk__in=self.validated_data["ids"])
+
+        filterset = JobCandidacyFilter(
+            data=self.validated_data["filter"],
+            queryset=queryset,
+        )
+        return filterset.qs
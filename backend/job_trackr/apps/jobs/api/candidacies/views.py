@@ -5,20 +5,36 @@ from django.db.models import QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 
+from apps.common.api.conditional import Validators, list_validators
+from apps.common.api.export import StreamingExportMixin
+from apps.common.api.filters import FullTextSearchFilter
+from apps.common.expressions import truncated_chars
 from apps.jobs.api.base_viewsets import ReadAfterWriteModelViewSet
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.candidacies.funnel import FunnelStage, candidacy_funnel
 from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.candidacies.status import bulk_set_status
+from apps.jobs.postings.models import JobPosting
 
 from .filters import JobCandidacyFilter
 from .serializers import (
+    NOTES_PREVIEW_LENGTH,
+    JobCandidacyBulkStatusSerializer,
     JobCandidacyDetailSerializer,
     JobCandidacyListSerializer,
     JobCandidacyWriteSerializer,
 )
 
 
-class JobCandidacyViewSet(ReadAfterWriteModelViewSet[JobCandidacy]):
+class JobCandidacyViewSet(
+    StreamingExportMixin,
+    ReadAfterWriteModelViewSet[JobCandidacy],
+):
     """
     ModelViewSet automatically provides:
 
@@ -28,6 +44,12 @@ class JobCandidacyViewSet(ReadAfterWriteModelViewSet[JobCandidacy]):
     - update(): PUT /api/v1/jobs/candidacies/{id}/
     - partial_update(): PATCH /api/v1/jobs/candidacies/{id}/
     - destroy(): DELETE /api/v1/jobs/candidacies/{id}/
+
+    Extra actions:
+
+    - export(): GET /api/v1/jobs/candidacies/export/
+    - bulk_status(): POST /api/v1/jobs/candidacies/bulk-status/
+    - funnel(): GET /api/v1/jobs/candidacies/funnel/
     """
 
     authentication_classes = [SessionAuthentication]
@@ -37,12 +59,37 @@ class JobCandidacyViewSet(ReadAfterWriteModelViewSet[JobCandidacy]):
     list_serializer_class = JobCandidacyListSerializer
     write_serializer_class = JobCandidacyWriteSerializer
 
+    # Writes to these models invalidate cached counts and responses:
+    # the nested job posting summary and filters read job postings.
+    cache_dependencies = [JobCandidacy, JobPosting]
+    cache_responses = True
+    compile_list_serializer = True
+
+    # The serializers truncate the text themselves when it is missing.
+    derived_annotations = frozenset({"notes_preview"})
+
+    # The job posting summary is part of the representation.
+    last_modified_fields = ["updated_at", "job_posting__updated_at"]
+
+    fieldset_columns = {
+        "job_posting": [
+            "job_posting__id",
+            "job_posting__title",
+            "job_posting__company",
+            "job_posting__location",
+        ],
+        "status_label": ["status"],
+        # Annotated in SQL, see get_queryset().
+        "notes_preview": [],
+    }
+
     # --- Search, Order, Filter ---
 
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        # Must run after OrderingFilter to rank results by relevance.
+        FullTextSearchFilter,
     ]
 
     filterset_class = JobCandidacyFilter
@@ -54,11 +101,123 @@ class JobCandidacyViewSet(ReadAfterWriteModelViewSet[JobCandidacy]):
         "notes",
     ]
 
+    # Weighted tsvector columns searched by FullTextSearchFilter.
+    # `search_fields` documents what those vectors are built from.
+    search_vector_fields = [
+        "job_posting__search_vector",
+        "search_vector",
+    ]
+
     ordering_fields = [
         "applied_on",
         "created_at",
         "updated_at",
     ]
 
+    # --- Export ---
+    export_filename = "job-candidacies"
+    export_fields = {
+        "id": "id",
+        "job_posting_id": "job_posting_id",
+        "job_posting_title": "job_posting__title",
+        "job_posting_company": "job_posting__company",
+        "job_posting_location": "job_posting__location",
+        "status": "status",
+        "applied_on": "applied_on",
+        "notes": "notes",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+
     def get_queryset(self) -> QuerySet[JobCandidacy]:
-        return JobCandidacy.objects.select_related("job_posting")
+        queryset = JobCandidacy.objects.select_related("job_posting").annotate(
+            notes_preview=truncated_chars("notes", NOTES_PREVIEW_LENGTH),
+        )
+
+        if self.action == "list":
+            # List items only show the preview: never load full texts.
+            queryset = queryset.defer("notes", "job_posting__description")
+
+        return queryset
+
+    # --- Bulk status transition ---
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request: Request) -> Response:
+        """
+        Move the candidacies selected by `ids` or `filter` to `status` with
+        one UPDATE, and return the ids of those that changed.
+        """
+        serializer = JobCandidacyBulkStatusSerializer(
+            data=request.data,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+
+        status = CandidacyStatus(serializer.validated_data["status"])
+        ids = bulk_set_status(serializer.get_queryset(), status)
+
+        return Response(
+            {
+                "status": status,
+                "count": len(ids),
+                "ids": [str(candidacy_id) for candidacy_id in ids],
+            }
+        )
+
+    # --- Funnel ---
+    @action(detail=False, methods=["get"], url_path="funnel")
+    def funnel(self, request: Request) -> Response:
+        """
+        Stage conversion and median stage durations of the filtered
+        candidacies, computed from their status events.
+
+        Every status event comes with an update of its candidacy, so the
+        list validators (and cached responses) follow the funnel too.
+        """
+
+        def validators() -> Validators:
+            return list_validators(
+                self.filter_queryset(self.get_queryset()),
+                self.last_modified_fields,
+                request,
+            )
+
+        def build() -> Response:
+            funnel = candidacy_funnel(self.filter_queryset(self.get_queryset()))
+
+            return Response(
+                {
+                    "candidacies": funnel.candidacies,
+                    "stages": [
+                        {
+                            **self._funnel_stage(stage),
+                            "reached": stage.reached,
+                            "conversion": stage.conversion,
+                        }
+                        for stage in funnel.stages
+                    ],
+                    "outcomes": [
+                        {
+                            **self._funnel_stage(outcome),
+                            "rate": (
+                                outcome.entered / funnel.candidacies
+                                if funnel.candidacies
+                                else None
+                            ),
+                        }
+                        for outcome in funnel.outcomes
+                    ],
+                }
+            )
+
+        return self._validated_response(request, validators=validators, build=build)
+
+    @staticmethod
+    def _funnel_stage(stage: FunnelStage) -> dict[str, object]:
+        return {
+            "status": stage.status,
+            "label": stage.status.label,
+            "entered": stage.entered,
+            "median_duration_seconds": stage.median_duration_seconds,
+            "median_time_to_reach_seconds": stage.median_time_to_reach_seconds,
+        }
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/api/postings/bulk.py
+
+"""
+Bulk upsert of job postings keyed by their normalized URL.
+
+Rows are validated one after the other by a single serializer instance, so
+fields are built once per request instead of once per row. Valid rows are
+written with chunked `bulk_create(update_conflicts=True)`: a row whose
+normalized URL already exists updates that posting, like a PUT would.
+Rows without a URL are always created. Like other writes, the upsert
+leaves duplicate signatures to `cluster_duplicate_postings`: it only drops
+those of the postings it updates (see apps.jobs.postings.dedupe).
+"""
+
+from collections.abc import Mapping
+from enum import StrEnum
+from itertools import batched
+from typing import Any
+
+from django.db import transaction
+from rest_framework import serializers
+
+from apps.common.cache import bump_model_version
+from apps.jobs.postings.dedupe import drop_signatures
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.postings.normalization import apply_normalization
+
+from .serializers import JobPostingBulkItemSerializer
+
+# Columns overwritten when a row matches an existing posting.
+UPSERT_FIELDS = [
+    *JobPostingBulkItemSerializer.Meta.fields,
+    "normalized_title",
+    "normalized_company",
+    "updated_at",
+]
+
+
+class BulkRowStatus(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    INVALID = "invalid"
+
+
+def invalid_row(index: int, errors: Any) -> dict[str, Any]:
+    return {"index": index, "status": BulkRowStatus.INVALID, "errors": errors}
+
+
+def bulk_upsert_job_postings(
+    rows: list[Any],
+    *,
+    context: Mapping[str, Any],
+    chunk_size: int,
+) -> list[dict[str, Any]]:
+    """
+    Validate and upsert `rows`, returning one result per row, in order.
+
+    Created and updated rows are told apart by looking up the normalized
+    URLs of each chunk right before writing it. A posting inserted
+    concurrently in between is still updated, not duplicated, but its row
+    is reported as created.
+    """
+    serializer = JobPostingBulkItemSerializer(context=context)
+    results: list[dict[str, Any]] = [{} for _row in rows]
+    postings: list[tuple[int, JobPosting]] = []
+    seen_urls: set[str] = set()
+
+    for index, row in enumerate(rows):
+        try:
+            data = serializer.run_validation(row)
+        except serializers.ValidationError as exc:
+            results[index] = invalid_row(index, exc.detail)
+            continue
+
+        posting = JobPosting(**data)
+        apply_normalization(posting)
+
+        # PostgreSQL cannot update the same row twice in one statement.
+        if posting.normalized_url is not None:
+            if posting.normalized_url in seen_urls:
+                results[index] = invalid_row(
+                    index,
+                    {"url": ["This URL appears more than once in the request."]},
+                )
+                continue
+
+            seen_urls.add(posting.normalized_url)
+
+        postings.append((index, posting))
+
+    with transaction.atomic():
+        for chunk in batched(postings, chunk_size):
+            urls = [
+                posting.normalized_url
+                for _index, posting in chunk
+                if posting.normalized_url is not None
+            ]
+            existing = dict(
+                JobPosting.objects.filter(normalized_url__in=urls).values_list(
+                    "normalized_url", "pk"
+                )
+            )
+
+            JobPosting.objects.bulk_create(
+                [posting for _index, posting in chunk],
+                update_conflicts=True,
+                unique_fields=["normalized_url"],
+                update_fields=UPSERT_FIELDS,
+            )
+
+            for index, posting in chunk:
+                existing_pk = existing.get(posting.normalized_url)
+                if existing_pk is not None:
+                    posting.pk = existing_pk
+
+                results[index] = {
+                    "index": index,
+                    "status": (
+                        BulkRowStatus.CREATED
+                        if existing_pk is None
+                        else BulkRowStatus.UPDATED
+                    ),
+                    "id": str(posting.pk),
+                }
+
+            # `bulk_create` sends no signals: drop the signatures of updated
+            # postings like the post_save receiver does.
+            if existing:
+                drop_signatures(existing.values())
+
+    # `bulk_create` bypasses the signals that bump cache versions.
+    if postings:
+        bump_model_version(JobPosting)
+
+    return results
@@ -4,6 +4,7 @@
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
 
+from apps.common.normalization import normalize_text
 from apps.jobs.postings.choices import Platforms
 from apps.jobs.postings.models import JobPosting
 
@@ -13,6 +14,10 @@ class JobPostingFilter(filters.FilterSet):
     company = filters.CharFilter(lookup_expr="icontains")
     location = filters.CharFilter(lookup_expr="icontains")
 
+    # Case, accent and whitespace insensitive exact match, backed by the
+    # `normalized_company` index.
+    company_exact = filters.CharFilter(method="filter_company_exact")
+
     platform = filters.ChoiceFilter(choices=Platforms.choices)
 
     easy_apply = filters.BooleanFilter()
@@ -38,6 +43,14 @@ class JobPostingFilter(filters.FilterSet):
             "active_hiring",
         ]
 
+    def filter_company_exact(
+        self,
+        queryset: QuerySet[JobPosting],
+        name: str,
+        value: str,
+    ) -> QuerySet[JobPosting]:
+        return queryset.filter(normalized_company=normalize_text(value) or "")
+
     def filter_has_salary(
         self,
         queryset: QuerySet[JobPosting],
@@ -1,11 +1,21 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/api/postings/serializers.py
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from django.db import IntegrityError, transaction
 from django.utils.text import Truncator
 from rest_framework import serializers
 
+from apps.common.api.compiled import ValueField
+from apps.common.normalization import normalize_url
 from apps.jobs.postings.models import JobPosting
 
+DESCRIPTION_PREVIEW_LENGTH = 240
+DUPLICATE_URL_MESSAGE = "A job posting with this URL already exists."
+
 
 class JobPostingListSerializer(serializers.ModelSerializer[JobPosting]):
     description_preview = serializers.SerializerMethodField()
@@ -48,9 +58,20 @@ class JobPostingListSerializer(serializers.ModelSerializer[JobPosting]):
             "updated_at",
         ]
         read_only_fields = tuple(fields)
+        # Columns of method fields for the compiled list serializer.
+        value_fields = {
+            "description_preview": ValueField("description_preview"),
+            "candidacy_id": ValueField("candidacy__id", str),
+        }
 
     def get_description_preview(self, obj: JobPosting) -> str:
-        return Truncator(obj.description).chars(240)
+        # Annotated by JobPostingViewSet so lists can defer `description`.
+        preview: str | None = getattr(obj, "description_preview", None)
+
+        if preview is None:
+            return Truncator(obj.description).chars(DESCRIPTION_PREVIEW_LENGTH)
+
+        return preview
 
     def get_candidacy_id(self, obj: JobPosting) -> str | None:
         candidacy = getattr(obj, "candidacy", None)
@@ -87,3 +108,64 @@ class JobPostingWriteSerializer(serializers.ModelSerializer[JobPosting]):
             "work_mode",
             "posted_on",
         ]
+
+    def validate_url(self, url: str) -> str:
+        if self._url_is_taken(url):
+            raise serializers.ValidationError(DUPLICATE_URL_MESSAGE)
+
+        return url
+
+    def create(self, validated_data: dict[str, Any]) -> JobPosting:
+        with self._duplicate_url_as_error(validated_data):
+            return super().create(validated_data)
+
+    def update(
+        self,
+        instance: JobPosting,
+        validated_data: dict[str, Any],
+    ) -> JobPosting:
+        with self._duplicate_url_as_error(validated_data):
+            return super().update(instance, validated_data)
+
+    def _url_is_taken(self, url: str) -> bool:
+        normalized_url = normalize_url(url)
+        if normalized_url is None:
+            return False
+
+        duplicates = JobPosting.objects.filter(normalized_url=normalized_url)
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+
+        return duplicates.exists()
+
+    @contextmanager
+    def _duplicate_url_as_error(
+        self,
+        validated_data: dict[str, Any],
+    ) -> Iterator[None]:
+        """
+        Another request can save the same URL between `validate_url` and
+        the write: report the unique constraint as the same 400 error.
+        """
+        try:
+            with transaction.atomic():
+                yield
+        except IntegrityError:
+            url = validated_data.get("url")
+            if url is None or not self._url_is_taken(url):
+                raise
+            raise serializers.ValidationError(
+                {"url": [DUPLICATE_URL_MESSAGE]}
+            ) from None
+
+
+class JobPostingBulkItemSerializer(JobPostingWriteSerializer):
+    """
+    One row of a bulk upsert.
+
+    An existing normalized URL is not an error here: the row updates the
+    posting that has it.
+    """
+
+    def validate_url(self, url: str) -> str:
+        return url
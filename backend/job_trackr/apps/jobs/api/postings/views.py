@@ -1,24 +1,40 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/api/postings/views.py
 
+from collections import Counter
+
 from django.db.models import QuerySet
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import filters
+from rest_framework import filters, serializers
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 
+from apps.common.api.export import StreamingExportMixin
+from apps.common.api.filters import FullTextSearchFilter
+from apps.common.api.parsers import NDJSONParser, ORJSONParser
+from apps.common.expressions import truncated_chars
 from apps.jobs.api.base_viewsets import ReadAfterWriteModelViewSet
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.postings.dedupe import SIMILARITY_THRESHOLD, find_duplicates
 from apps.jobs.postings.models import JobPosting
 
+from .bulk import BulkRowStatus, bulk_upsert_job_postings
 from .filters import JobPostingFilter
 from .serializers import (
+    DESCRIPTION_PREVIEW_LENGTH,
     JobPostingDetailSerializer,
     JobPostingListSerializer,
     JobPostingWriteSerializer,
 )
 
 
-class JobPostingViewSet(ReadAfterWriteModelViewSet[JobPosting]):
+class JobPostingViewSet(
+    StreamingExportMixin,
+    ReadAfterWriteModelViewSet[JobPosting],
+):
     """
     ModelViewSet automatically provides:
 
@@ -28,6 +44,12 @@ class JobPostingViewSet(ReadAfterWriteModelViewSet[JobPosting]):
     - update(): PUT /api/v1/jobs/postings/{id}/
     - partial_update(): PATCH /api/v1/jobs/postings/{id}/
     - destroy(): DELETE /api/v1/jobs/postings/{id}/
+
+    Extra actions:
+
+    - bulk(): POST /api/v1/jobs/postings/bulk/
+    - export(): GET /api/v1/jobs/postings/export/
+    - duplicates(): GET /api/v1/jobs/postings/{id}/duplicates/
     """
 
     authentication_classes = [SessionAuthentication]
@@ -37,11 +59,33 @@ class JobPostingViewSet(ReadAfterWriteModelViewSet[JobPosting]):
     list_serializer_class = JobPostingListSerializer
     write_serializer_class = JobPostingWriteSerializer
 
+    # Writes to these models invalidate cached counts and responses:
+    # candidacies show up through `candidacy_id` and `has_candidacy`.
+    cache_dependencies = [JobPosting, JobCandidacy]
+    cache_responses = True
+    compile_list_serializer = True
+
+    # The serializers truncate the text themselves when it is missing.
+    derived_annotations = frozenset({"description_preview"})
+
+    # `candidacy_id` is part of the representation.
+    last_modified_fields = ["updated_at", "candidacy__updated_at"]
+
+    fieldset_columns = {
+        # Annotated in SQL, see get_queryset().
+        "description_preview": [],
+        "platform_label": ["platform"],
+        "employment_type_label": ["employment_type"],
+        "work_mode_label": ["work_mode"],
+        "candidacy_id": ["candidacy__id"],
+    }
+
     # --- Search, Order, Filter ---
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
         filters.OrderingFilter,
+        # Must run after OrderingFilter to rank results by relevance.
+        FullTextSearchFilter,
     ]
     filterset_class = JobPostingFilter
 
@@ -52,6 +96,10 @@ class JobPostingViewSet(ReadAfterWriteModelViewSet[JobPosting]):
         "description",
     ]
 
+    # Weighted tsvector columns searched by FullTextSearchFilter.
+    # `search_fields` documents what those vectors are built from.
+    search_vector_fields = ["search_vector"]
+
     ordering_fields = [
         "posted_on",
         "created_at",
@@ -62,5 +110,135 @@ class JobPostingViewSet(ReadAfterWriteModelViewSet[JobPosting]):
     ]
     ordering = ["-posted_on", "-created_at"]
 
+    # --- Export ---
+    export_filename = "job-postings"
+    export_fields = {
+        "id": "id",
+        "title": "title",
+        "company": "company",
+        "location": "location",
+        "url": "url",
+        "description": "description",
+        "salary": "salary",
+        "easy_apply": "easy_apply",
+        "active_hiring": "active_hiring",
+        "platform": "platform",
+        "employment_type": "employment_type",
+        "work_mode": "work_mode",
+        "candidacy_id": "candidacy__id",
+        "posted_on": "posted_on",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+
     def get_queryset(self) -> QuerySet[JobPosting]:
-        return JobPosting.objects.select_related("candidacy")
+        queryset = JobPosting.objects.select_related("candidacy").annotate(
+            description_preview=truncated_chars(
+                "description",
+                DESCRIPTION_PREVIEW_LENGTH,
+            ),
+        )
+
+        if self.action == "list":
+            # List items only show the preview: never load full texts.
+            queryset = queryset.defer("description", "candidacy__notes")
+
+        return queryset
+
+    # --- Bulk upsert ---
+    bulk_max_rows = 10_000
+    bulk_chunk_size = 500
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        parser_classes=[ORJSONParser, NDJSONParser],
+    )
+    def bulk(self, request: Request) -> Response:
+        """
+        Create or update postings from a JSON array or an NDJSON body.
+
+        A row whose normalized URL matches an existing posting updates it.
+        Invalid rows are reported and skipped; valid rows are still written.
+        """
+        rows = request.data
+
+        if not isinstance(rows, list):
+            raise serializers.ValidationError(
+                {"non_field_errors": ["Expected a list of job postings."]}
+            )
+
+        if len(rows) > self.bulk_max_rows:
+            raise serializers.ValidationError(
+                {
+                    "non_field_errors": [
+                        f"Ensure this request has no more than "
+                        f"{self.bulk_max_rows} job postings."
+                    ]
+                }
+            )
+
+        results = bulk_upsert_job_postings(
+            rows,
+            context=self.get_serializer_context(),
+            chunk_size=self.bulk_chunk_size,
+        )
+        statuses = Counter(result["status"] for result in results)
+
+        return Response(
+            {
+                **{str(status): statuses[status] for status in BulkRowStatus},
+                "results": results,
+            }
+        )
+
+    # --- Near-duplicates ---
+    @action(detail=True, methods=["get"], url_path="duplicates")
+    def duplicates(self, request: Request, pk: str | None = None) -> Response:
+        """
+        Likely duplicates of a posting, most similar first.
+
+        `min_similarity` (0 to 1) overrides the default threshold on the
+        estimated Jaccard similarity of the postings' text.
+        """
+        job_posting = self.get_object()
+        threshold = self.get_min_similarity()
+
+        duplicates = find_duplicates(job_posting, threshold=threshold)
+        job_postings = self.get_queryset().in_bulk(
+            [duplicate.job_posting_id for duplicate in duplicates]
+        )
+        context = self.get_serializer_context()
+
+        return Response(
+            [
+                {
+                    "similarity": round(duplicate.similarity, 3),
+                    "job_posting": self.list_serializer_class(
+                        job_postings[duplicate.job_posting_id],
+                        context=context,
+                    ).data,
+                }
+                for duplicate in duplicates
+                if duplicate.job_posting_id in job_postings
+            ]
+        )
+
+    def get_min_similarity(self) -> float:
+        value = self.request.query_params.get("min_similarity")
+
+        if value is None:
+            return SIMILARITY_THRESHOLD
+
+        try:
+            threshold = float(value)
+        except ValueError:
+            threshold = -1.0
+
+        if not 0 <= threshold <= 1:
+            raise serializers.ValidationError(
+                {"min_similarity": ["Must be a number between 0 and 1."]}
+            )
+
+        return threshold
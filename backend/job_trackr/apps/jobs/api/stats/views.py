@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/api/stats/views.py
+
+from datetime import date, timedelta
+from typing import Any, cast
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.api.conditional import (
+    Validators,
+    make_etag,
+    not_modified_response,
+    representation_variant,
+    set_validator_headers,
+)
+from apps.common.cache import get_model_versions
+from apps.jobs.activity.choices import ActivityPeriod
+from apps.jobs.activity.rollups import activity_history
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.stats import job_stats
+
+
+class JobStatsView(APIView):
+    """
+    GET /api/v1/jobs/stats/: candidacy counts by status, platform, work
+    mode, employment type and ISO week, see apps.jobs.stats.
+
+    Statistics are cached under the version counters of job postings and
+    candidacies: every write bumps them, deletions included, so a cached
+    entry is never stale and a hit runs no query at all. A miss runs a
+    single one.
+    """
+
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    cache_dependencies = [JobCandidacy, JobPosting]
+
+    def get(self, request: Request) -> Response:
+        versions = get_model_versions(self.cache_dependencies)
+        key = f"job-stats:{versions}"
+
+        stats = cache.get(key)
+        if stats is None:
+            stats = job_stats()
+            cache.set(key, stats, timeout=settings.API_STATS_CACHE_TIMEOUT)
+
+        validators = Validators(
+            etag=make_etag(
+                versions, stats["updated_at"], representation_variant(request)
+            ),
+            last_modified=stats["updated_at"],
+        )
+
+        response: Any = not_modified_response(request, validators)
+        if response is None:
+            response = Response(stats)
+
+        set_validator_headers(response, validators)
+
+        return cast(Response, response)
+
+
+class JobActivityView(APIView):
+    """
+    GET /api/v1/jobs/stats/activity/: per-day or per-week counts of posted
+    job postings and of candidacies, by platform and status, over the last
+    `months` months (12 by default).
+
+    Read from the activity rollups (see apps.jobs.activity.rollups): as
+    fresh as their last refresh, and never blocked by one.
+    """
+
+    authentication_classes = [SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    max_months = 60
+
+    def get(self, request: Request) -> Response:
+        period = self.get_period()
+        since = self.get_since(period)
+
+        rows = activity_history(period, since=since).values(
+            "period_start", "kind", "platform", "status", "count"
+        )
+
+        return Response({"period": period, "since": since, "results": list(rows)})
+
+    def get_period(self) -> ActivityPeriod:
+        value = self.request.query_params.get("period", ActivityPeriod.WEEK)
+
+        if value not in ActivityPeriod.values:
+            raise serializers.ValidationError(
+                {"period": [f"Must be one of: {', '.join(ActivityPeriod.values)}."]}
+            )
+
+        return ActivityPeriod(value)
+
+    def get_since(self, period: ActivityPeriod) -> date:
+        """First day of the month `months` months ago, or the Monday of its week."""
+        value = self.request.query_params.get("months", "12")
+
+        try:
+            months = int(value)
+        except ValueError:
+            months = 0
+
+        if not 1 <= months <= self.max_months:
+            raise serializers.ValidationError(
+                {"months": [f"Must be a number between 1 and {self.max_months}."]}
+            )
+
+        today = timezone.localdate()
+        year, month = divmod(today.year * 12 + today.month - 1 - months, 12)
+        since = date(year, month + 1, 1)
+
+        if period == ActivityPeriod.WEEK:
+            since -= timedelta(days=since.weekday())
+
+        return since
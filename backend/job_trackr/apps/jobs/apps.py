@@ -6,3 +6,6 @@ from django.apps import AppConfig
 
 class JobsConfig(AppConfig):
     name = "apps.jobs"
+
+    def ready(self) -> None:
+        import apps.jobs.signals  # noqa: F401
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/benchmarks/dataset.py
+
+"""
+Deterministic benchmark datasets.
+
+The same size and seed always produce the same rows (primary keys and
+timestamps aside), so timings taken on different runs or machines compare
+the same work. Rows come from the demo data generator (see
+apps.jobs.demo_data.rows), dated relative to a fixed `ANCHOR` rather than
+today.
+"""
+
+from datetime import date
+
+from django.db import connection
+
+from apps.jobs.activity.rollups import refresh_activity_rollups
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.demo_data.bulk import seed_jobs
+from apps.jobs.postings.models import JobPosting
+
+ANCHOR = date(2026, 1, 1)
+
+
+def seed_dataset(
+    postings: int,
+    *,
+    candidacy_ratio: float = 0.5,
+    seed: int = 0,
+) -> None:
+    """
+    Create `postings` postings, a candidacy for `candidacy_ratio` of them
+    with its status history, then analyze the tables and refresh the
+    activity rollups so plans and rollups reflect the new rows.
+    """
+    seed_jobs(postings, round(postings * candidacy_ratio), seed=seed, anchor=ANCHOR)
+
+    with connection.cursor() as cursor:
+        for model in (JobPosting, JobCandidacy, CandidacyStatusEvent):
+            cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    refresh_activity_rollups(concurrently=False)
@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/benchmarks/scenarios.py
+
+"""
+Requests timed by the `benchmark_api` command.
+
+Every list endpoint is timed unfiltered, with each filter of its filterset,
+each ordering field and a full-text search. Filter values match the
+vocabularies of the demo data generator (see apps.jobs.demo_data.rows),
+and a filter without a value here is a configuration error: new filters
+cannot be left out of the benchmark by accident.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+
+from apps.jobs.api.candidacies.views import JobCandidacyViewSet
+from apps.jobs.api.postings.views import JobPostingViewSet
+from apps.jobs.benchmarks.dataset import ANCHOR
+from apps.jobs.demo_data.rows import COMPANIES
+
+SEARCH_TERM = "python"
+
+POSTING_FILTER_VALUES = {
+    "title": "engineer",
+    "company": "nova",
+    "location": "Lyon",
+    "company_exact": COMPANIES[7].upper(),
+    "platform": "linkedin",
+    "easy_apply": "true",
+    "active_hiring": "true",
+    "posted_on_after": (ANCHOR - timedelta(days=30)).isoformat(),
+    "posted_on_before": (ANCHOR - timedelta(days=300)).isoformat(),
+    "has_salary": "true",
+    "has_candidacy": "true",
+}
+
+CANDIDACY_FILTER_VALUES = {
+    "status": "interview",
+    "applied_on_after": (ANCHOR - timedelta(days=30)).isoformat(),
+    "applied_on_before": (ANCHOR - timedelta(days=300)).isoformat(),
+    "platform": "indeed",
+    "employment_type": "full_time",
+    "work_mode": "remote",
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    params: Mapping[str, str] = field(default_factory=dict)
+    data: Mapping[str, Any] | None = None
+
+
+def _list_scenarios(
+    label: str,
+    path: str,
+    viewset: type[JobPostingViewSet | JobCandidacyViewSet],
+    filter_values: Mapping[str, str],
+) -> list[Scenario]:
+    missing = set(viewset.filterset_class.base_filters) - set(filter_values)
+
+    if missing:
+        raise ImproperlyConfigured(
+            f"No benchmark value for the {label} filters: {', '.join(sorted(missing))}."
+        )
+
+    return [
+        Scenario(f"{label} list", "get", path),
+        *(
+            Scenario(f"{label} filter {name}", "get", path, {name: value})
+            for name, value in filter_values.items()
+        ),
+        *(
+            Scenario(f"{label} ordering -{name}", "get", path, {"ordering": f"-{name}"})
+            for name in viewset.ordering_fields
+        ),
+        Scenario(f"{label} search", "get", path, {"search": SEARCH_TERM}),
+    ]
+
+
+def build_scenarios(*, posting_id: str, candidacy_id: str) -> list[Scenario]:
+    """
+    Every scenario, reading and writing the given posting and candidacy.
+
+    Writes create postings and update the candidacy's notes: their work
+    does not change from one repetition to the next.
+    """
+    postings = reverse("job-posting-list")
+    candidacies = reverse("job-candidacy-list")
+
+    return [
+        *_list_scenarios(
+            "postings", postings, JobPostingViewSet, POSTING_FILTER_VALUES
+        ),
+        Scenario(
+            "postings retrieve",
+            "get",
+            reverse("job-posting-detail", args=[posting_id]),
+        ),
+        Scenario("postings export", "get", reverse("job-posting-export")),
+        Scenario(
+            "postings create",
+            "post",
+            postings,
+            data={
+                "title": "Benchmark engineer",
+                "company": "Benchmark",
+                "location": "Paris",
+                "platform": "linkedin",
+                "employment_type": "full_time",
+                "work_mode": "hybrid",
+            },
+        ),
+        *_list_scenarios(
+            "candidacies", candidacies, JobCandidacyViewSet, CANDIDACY_FILTER_VALUES
+        ),
+        Scenario(
+            "candidacies retrieve",
+            "get",
+            reverse("job-candidacy-detail", args=[candidacy_id]),
+        ),
+        Scenario(
+            "candidacies update",
+            "patch",
+            reverse("job-candidacy-detail", args=[candidacy_id]),
+            data={"notes": "Benchmark notes."},
+        ),
+        Scenario("candidacies export", "get", reverse("job-candidacy-export")),
+        Scenario("candidacies funnel", "get", reverse("job-candidacy-funnel")),
+        Scenario("stats", "get", reverse("job-stats")),
+        Scenario(
+            "activity",
+            "get",
+            reverse("job-activity"),
+            {"period": "day", "months": "12"},
+        ),
+    ]
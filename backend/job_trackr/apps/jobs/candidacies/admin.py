@@ -1,16 +1,37 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/candidacies/admin.py
 
+from typing import Any
+
 from django.contrib import admin
+from django.http import HttpRequest
 from django.urls import reverse
 from django.utils.html import format_html
 from django.utils.text import Truncator
 
-from .models import JobCandidacy
+from .models import CandidacyStatusEvent, JobCandidacy
+
+
+class CandidacyStatusEventInline(admin.TabularInline[CandidacyStatusEvent, Any]):
+    """Status history, written by `JobCandidacy.save()` and never edited."""
+
+    model = CandidacyStatusEvent
+    fields = ("status", "occurred_at")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request: HttpRequest, obj: Any = None) -> bool:
+        return False
+
+    def has_change_permission(self, request: HttpRequest, obj: Any = None) -> bool:
+        return False
 
 
 @admin.register(JobCandidacy)
 class JobCandidacyAdmin(admin.ModelAdmin[JobCandidacy]):
+    inlines = (CandidacyStatusEventInline,)
+
     list_display = (
         "short_job_candidacy",
         "job_posting_link",
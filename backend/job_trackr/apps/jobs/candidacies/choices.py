@@ -11,3 +11,19 @@ class CandidacyStatus(models.TextChoices):
     OFFER = "offer", "Offer"
     REJECTED = "rejected", "Rejected"
     WITHDRAWN = "withdrawn", "Withdrawn"
+
+
+# Stages of the hiring pipeline, in order: reaching one implies having gone
+# through the previous ones, even when a candidacy skipped some of them.
+PIPELINE_STATUSES = (
+    CandidacyStatus.APPLIED,
+    CandidacyStatus.INTERVIEW,
+    CandidacyStatus.TECHNICAL_TEST,
+    CandidacyStatus.OFFER,
+)
+
+# Statuses ending a candidacy at any stage.
+OUTCOME_STATUSES = (
+    CandidacyStatus.REJECTED,
+    CandidacyStatus.WITHDRAWN,
+)
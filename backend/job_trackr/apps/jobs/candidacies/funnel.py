@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/candidacies/funnel.py
+
+"""
+Hiring funnel computed from candidacy status events.
+
+Everything is computed by PostgreSQL in one query: window functions pair
+each event with the next one of its candidacy (time spent in a status)
+and with its first one (time to reach a status), and a running sum over
+the pipeline counts the candidacies that reached each stage.
+
+A candidacy reached a pipeline stage when its furthest pipeline status is
+that stage or a later one, so skipped stages still count and conversion
+never exceeds 1. Candidacies created directly with an outcome count as
+applied.
+"""
+
+from typing import NamedTuple
+
+from django.db import connections
+from django.db.models import QuerySet
+
+from apps.jobs.candidacies.choices import (
+    OUTCOME_STATUSES,
+    PIPELINE_STATUSES,
+    CandidacyStatus,
+)
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+
+
+class FunnelStage(NamedTuple):
+    status: CandidacyStatus
+    # Candidacies that entered the status at least once.
+    entered: int
+    # Pipeline stages only: candidacies that reached the stage, and the
+    # share of those that reached the previous one.
+    reached: int | None
+    conversion: float | None
+    # Median time spent in the status, until the next event.
+    median_duration_seconds: float | None
+    # Median time from the first event of a candidacy to entering the status.
+    median_time_to_reach_seconds: float | None
+
+
+class Funnel(NamedTuple):
+    candidacies: int
+    stages: list[FunnelStage]
+    outcomes: list[FunnelStage]
+
+
+def candidacy_funnel(queryset: QuerySet[JobCandidacy]) -> Funnel:
+    """Funnel of the candidacies of `queryset`."""
+    events_table = CandidacyStatusEvent._meta.db_table
+    using = queryset.db
+    candidacies = queryset.order_by().values("pk")
+    candidacies_sql, candidacies_params = candidacies.query.get_compiler(
+        using=using
+    ).as_sql()
+
+    statuses = [*PIPELINE_STATUSES, *OUTCOME_STATUSES]
+    stages_sql = ", ".join(
+        f"(%s, {position}, {'TRUE' if status in PIPELINE_STATUSES else 'FALSE'})"
+        for position, status in enumerate(statuses, start=1)
+    )
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH events AS (
+                SELECT
+                    candidacy_id,
+                    status,
+                    occurred_at,
+                    LEAD(occurred_at) OVER candidacy AS left_at,
+                    FIRST_VALUE(occurred_at) OVER candidacy AS started_at,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY candidacy_id, status
+                        ORDER BY occurred_at, id
+                    ) AS visit
+                FROM {events_table}
+                WHERE candidacy_id IN ({candidacies_sql})
+                WINDOW candidacy AS (
+                    PARTITION BY candidacy_id ORDER BY occurred_at, id
+                )
+            ),
+            stages (status, position, pipeline) AS (VALUES {stages_sql}),
+            furthest AS (
+                SELECT
+                    COALESCE(MAX(position) FILTER (WHERE pipeline), 1) AS position
+                FROM events JOIN stages USING (status)
+                GROUP BY candidacy_id
+            ),
+            per_status AS (
+                SELECT
+                    status,
+                    COUNT(*) FILTER (WHERE visit = 1) AS entered,
+                    percentile_cont(0.5) WITHIN GROUP (
+                        ORDER BY EXTRACT(EPOCH FROM left_at - occurred_at)::float8
+                    ) AS median_duration,
+                    percentile_cont(0.5) WITHIN GROUP (
+                        ORDER BY EXTRACT(EPOCH FROM occurred_at - started_at)::float8
+                    ) FILTER (WHERE visit = 1) AS median_time_to_reach
+                FROM events
+                GROUP BY status
+            ),
+            reached AS (
+                SELECT
+                    stages.status,
+                    stages.position,
+                    stages.pipeline,
+                    SUM(COUNT(furthest.position)) OVER (
+                        PARTITION BY stages.pipeline ORDER BY stages.position DESC
+                    )::bigint AS reached
+                FROM stages LEFT JOIN furthest USING (position)
+                GROUP BY stages.status, stages.position, stages.pipeline
+            )
+            SELECT
+                reached.status,
+                reached.pipeline,
+                COALESCE(per_status.entered, 0),
+                reached.reached,
+                reached.reached::float8 / NULLIF(
+                    LAG(reached.reached) OVER (ORDER BY reached.position), 0
+                ),
+                per_status.median_duration,
+                per_status.median_time_to_reach
+            FROM reached LEFT JOIN per_status USING (status)
+            ORDER BY reached.position
+            """,
+            [*candidacies_params, *statuses],
+        )
+        rows = cursor.fetchall()
+
+    stages: list[FunnelStage] = []
+    outcomes: list[FunnelStage] = []
+
+    for status, pipeline, entered, reached, conversion, duration, to_reach in rows:
+        if pipeline:
+            # The first stage has nothing to convert from.
+            conversion = conversion if stages else None
+            stages.append(
+                FunnelStage(
+                    CandidacyStatus(status),
+                    entered,
+                    reached,
+                    conversion,
+                    duration,
+                    to_reach,
+                )
+            )
+        else:
+            outcomes.append(
+                FunnelStage(
+                    CandidacyStatus(status),
+                    entered,
+                    None,
+                    None,
+                    duration,
+                    to_reach,
+                )
+            )
+
+    return Funnel(candidacies=stages[0].reached or 0, stages=stages, outcomes=outcomes)
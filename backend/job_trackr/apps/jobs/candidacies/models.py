@@ -1,11 +1,16 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/candidacies/models.py
 
+from collections.abc import Collection
 from datetime import date
+from typing import Any, Self
 
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.utils.encoding import force_str
 
+from apps.common.search import weighted_search_vector
 from apps.common.uuid import uuid7_default
 from apps.jobs.candidacies.choices import CandidacyStatus
 
@@ -35,6 +40,13 @@ class JobCandidacy(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Maintained by PostgreSQL on every write; never assigned from Python.
+    search_vector = models.GeneratedField(
+        expression=weighted_search_vector(("notes", "D")),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         db_table = "job_candidacy"
         verbose_name = "job candidacy"
@@ -43,10 +55,125 @@ class JobCandidacy(models.Model):
         indexes = [
             models.Index(fields=["status"], name="idx_job_cand_status"),
             models.Index(fields=["applied_on"], name="idx_job_cand_applied"),
+            # Matches the default ordering plus the primary key tie-breaker
+            # used by keyset pagination, so each page is a single index seek.
+            models.Index(
+                fields=["-applied_on", "-created_at", "id"],
+                name="idx_job_cand_default_order",
+            ),
+            GinIndex(fields=["search_vector"], name="idx_job_cand_search"),
         ]
 
+    # Status as last loaded from or saved to the database, see save().
+    _saved_status: str | None = None
+
     def __str__(self) -> str:
         return f"{self.job_posting} ({self.status_label()})"
 
+    @classmethod
+    def from_db(
+        cls,
+        db: str | None,
+        field_names: Collection[str],
+        values: Collection[Any],
+        **kwargs: Any,
+    ) -> Self:
+        instance = super().from_db(db, field_names, values, **kwargs)
+        instance._saved_status = instance.__dict__.get("status")
+        return instance
+
     def status_label(self) -> str:
         return force_str(CandidacyStatus(self.status).label)
+
+    def _status_changed(self, update_fields: Any) -> bool:
+        if update_fields is not None and "status" not in update_fields:
+            return False
+
+        # A deferred status that was never assigned cannot have changed.
+        if "status" not in self.__dict__:
+            return False
+
+        return self._state.adding or self.status != self._saved_status
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Save the candidacy and, when it is created or its status changes,
+        record a `CandidacyStatusEvent` in the same transaction.
+        """
+        update_fields = kwargs.get("update_fields")
+
+        if not self._status_changed(update_fields):
+            super().save(*args, **kwargs)
+            return
+
+        if update_fields is not None:
+            # The event is dated like the change itself.
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+
+        # No savepoint: the event fails or succeeds with the candidacy.
+        with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+            super().save(*args, **kwargs)
+            CandidacyStatusEvent.objects.create(
+                candidacy=self,
+                status=self.status,
+                occurred_at=self.updated_at,
+            )
+
+        self._saved_status = self.status
+
+
+class CandidacyStatusEvent(models.Model):
+    """
+    Append-only history of candidacy statuses: one row per status a
+    candidacy entered, including the one it was created with.
+
+    Rows are written with every status change (see `JobCandidacy.save()`
+    and apps.jobs.candidacies.status) and are never updated.
+    """
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid7_default,
+        editable=False,
+    )
+
+    candidacy = models.ForeignKey(
+        JobCandidacy,
+        related_name="status_events",
+        on_delete=models.CASCADE,
+        # Covered by the (candidacy, occurred_at) index.
+        db_index=False,
+    )
+
+    status = models.CharField(
+        max_length=50,
+        choices=CandidacyStatus.choices,
+    )
+
+    occurred_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "job_candidacy_status_event"
+        verbose_name = "candidacy status event"
+        verbose_name_plural = "candidacy status events"
+        ordering = ["occurred_at", "id"]
+        indexes = [
+            # History of a candidacy, and the window functions of the funnel.
+            models.Index(
+                fields=["candidacy", "occurred_at"],
+                name="idx_cand_event_cand_at",
+            ),
+            models.Index(
+                fields=["status", "occurred_at"],
+                name="idx_cand_event_status_at",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.candidacy_id}: {self.status} at {self.occurred_at}"
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if not self._state.adding:
+            raise ValueError("Candidacy status events are append-only.")
+
+        super().save(*args, **kwargs)
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/candidacies/status.py
+
+"""
+Set-based status transitions of job candidacies.
+"""
+
+from uuid import UUID
+
+from django.db import connections, transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.common.cache import bump_model_version
+from apps.common.uuid import uuid7_default
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+
+
+def bulk_set_status(
+    queryset: QuerySet[JobCandidacy],
+    status: CandidacyStatus,
+) -> list[UUID]:
+    """
+    Move the candidacies of `queryset` to `status` with a single UPDATE.
+
+    Candidacies already in `status` are left untouched. Returns the ids of
+    the updated candidacies, in creation order (uuid7). Their status events
+    are inserted with one more query, in the same transaction.
+
+    The ORM's `update()` only returns a row count, so the statement is
+    written by hand with `RETURNING`, around the queryset's own SQL.
+    """
+    table = JobCandidacy._meta.db_table
+    events_table = CandidacyStatusEvent._meta.db_table
+    using = queryset.db
+    targets = queryset.exclude(status=status).order_by().values("pk")
+    targets_sql, targets_params = targets.query.sql_with_params()
+    now = timezone.now()
+
+    with transaction.atomic(using=using), connections[using].cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table}
+            SET status = %s, updated_at = %s
+            WHERE id IN ({targets_sql})
+            RETURNING id
+            """,
+            [status, now, *targets_params],
+        )
+        ids = sorted(row[0] for row in cursor.fetchall())
+
+        if ids:
+            # Arrays keep it to four parameters however many rows changed.
+            cursor.execute(
+                f"""
+                INSERT INTO {events_table} (id, candidacy_id, status, occurred_at)
+                SELECT unnest(%s::uuid[]), unnest(%s::uuid[]), %s, %s
+                """,
+                [[uuid7_default() for _ in ids], ids, status, now],
+            )
+
+    if ids:
+        bump_model_version(JobCandidacy, using=using)
+
+    return ids
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/demo_data/bulk.py
+
+"""
+Bulk seeding of demo job postings and candidacies.
+
+Rows are generated in chunks by apps.jobs.demo_data.rows and written with
+`COPY FROM STDIN`. With one worker, the calling process writes everything
+in one transaction. With more, each worker process generates and writes
+its own chunks through its own connection, one transaction per chunk:
+maintaining the indexes of `job_posting` costs more than generating the
+rows, and only spreads across CPUs that way. An interrupted run then
+leaves the chunks already written.
+
+`COPY` skips `save()` and signals: normalized fields and status events are
+generated with the rows, cache versions are bumped here, and duplicate
+signatures are left to `cluster_duplicate_postings`, which indexes the
+postings that have none.
+"""
+
+import multiprocessing
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from typing import NamedTuple
+
+import django
+from django.db import connection, connections, transaction
+from django.db.models import Model
+from django.utils import timezone
+
+from apps.common.cache import bump_model_version
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.demo_data.rows import (
+    CANDIDACY_COLUMNS,
+    POSTING_COLUMNS,
+    STATUS_EVENT_COLUMNS,
+    Chunk,
+    ChunkTask,
+    generate_chunk,
+)
+from apps.jobs.postings.models import JobPosting
+
+CHUNK_SIZE = 10_000
+
+
+class SeedResult(NamedTuple):
+    postings: int
+    candidacies: int
+    status_events: int
+    # Seconds.
+    duration: float
+
+    @property
+    def rows(self) -> int:
+        return self.postings + self.candidacies + self.status_events
+
+
+def _tasks(
+    postings: int,
+    candidacies: int,
+    *,
+    seed: int,
+    anchor: date,
+    now: datetime,
+    chunk_size: int,
+) -> Iterator[ChunkTask]:
+    for start in range(0, postings, chunk_size):
+        yield ChunkTask(
+            seed=seed,
+            start=start,
+            stop=min(start + chunk_size, postings),
+            postings=postings,
+            candidacies=candidacies,
+            anchor=anchor,
+            now=now,
+        )
+
+
+def _copy(model: type[Model], columns: tuple[str, ...], data: bytes) -> None:
+    if not data:
+        return
+
+    # Turn psycopg errors into Django's, e.g. IntegrityError.
+    with (
+        connection.wrap_database_errors,
+        connection.cursor() as cursor,
+        cursor.copy(
+            f"COPY {model._meta.db_table} ({', '.join(columns)}) FROM STDIN"
+        ) as copy,
+    ):
+        copy.write(data)
+
+
+def _write_chunk(task: ChunkTask) -> Chunk:
+    """Generate and write the rows of `task`, and return their counts."""
+    chunk = generate_chunk(task)
+
+    with transaction.atomic():
+        _copy(JobPosting, POSTING_COLUMNS, chunk.postings)
+        _copy(JobCandidacy, CANDIDACY_COLUMNS, chunk.candidacies)
+        _copy(CandidacyStatusEvent, STATUS_EVENT_COLUMNS, chunk.status_events)
+
+    # Only the counts go back to the parent process.
+    return chunk._replace(postings=b"", candidacies=b"", status_events=b"")
+
+
+def _write_worker_chunk(alias: str, name: str, task: ChunkTask) -> Chunk:
+    # The parent process may use another database than the settings' one,
+    # e.g. a test database.
+    connections[alias].settings_dict["NAME"] = name
+    return _write_chunk(task)
+
+
+def _written_chunks(tasks: Iterator[ChunkTask], workers: int) -> Iterator[Chunk]:
+    """Write the chunks of `tasks`, yielding their counts in order."""
+    if workers == 1:
+        with transaction.atomic():
+            yield from map(_write_chunk, tasks)
+        return
+
+    write = partial(
+        _write_worker_chunk,
+        connection.alias,
+        connection.settings_dict["NAME"],
+    )
+
+    # Spawned rather than forked: forked workers would share this
+    # process's database connection.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=django.setup,
+    ) as executor:
+        yield from executor.map(write, tasks)
+
+
+def seed_jobs(
+    postings: int,
+    candidacies: int,
+    *,
+    seed: int = 0,
+    anchor: date | None = None,
+    workers: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    on_chunk: Callable[[SeedResult], None] | None = None,
+) -> SeedResult:
+    """
+    Create `postings` postings and `candidacies` candidacies, spread evenly
+    across them, with their status histories.
+
+    Postings are dated in the year before `anchor` (default: today). The
+    running totals are passed to `on_chunk` after each chunk is written.
+    """
+    start = time.perf_counter()
+    tasks = _tasks(
+        postings,
+        candidacies,
+        seed=seed,
+        anchor=anchor or timezone.localdate(),
+        now=timezone.now(),
+        chunk_size=chunk_size,
+    )
+    result = SeedResult(0, 0, 0, 0.0)
+
+    for chunk in _written_chunks(tasks, workers):
+        result = SeedResult(
+            result.postings + chunk.posting_count,
+            result.candidacies + chunk.candidacy_count,
+            result.status_events + chunk.status_event_count,
+            time.perf_counter() - start,
+        )
+
+        if on_chunk is not None:
+            on_chunk(result)
+
+    bump_model_version(JobPosting)
+    bump_model_version(JobCandidacy)
+
+    return result
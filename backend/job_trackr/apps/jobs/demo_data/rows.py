@@ -0,0 +1,392 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/demo_data/rows.py
+
+"""
+Generation of demo rows in PostgreSQL's COPY text format.
+
+Postings are generated in chunks of consecutive indexes. Each chunk draws
+from its own random generator, seeded from the seed and the chunk's first
+index: a seed always produces the same rows (primary keys aside), however
+chunks are spread across worker processes.
+
+Values are drawn from weighted vocabularies rather than Faker, one column
+of a chunk at a time: a few companies post most jobs, LinkedIn carries
+most postings and most candidacies end up applied or rejected. The
+vocabularies hold no tab, newline or backslash, so values are written to
+the COPY text as is, without escaping.
+
+This module does not import models, so it works in worker processes that
+never set up Django.
+"""
+
+import random
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime, timedelta
+from itertools import accumulate
+from typing import NamedTuple
+from uuid import UUID
+
+from apps.common.normalization import normalize_text, normalize_url
+from apps.common.uuid import uuid7_default
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.postings.choices import EmploymentType, Platforms, WorkMode
+
+POSTING_COLUMNS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "url",
+    "description",
+    "salary",
+    "easy_apply",
+    "active_hiring",
+    "posted_on",
+    "platform",
+    "employment_type",
+    "work_mode",
+    "normalized_title",
+    "normalized_company",
+    "normalized_url",
+    "created_at",
+    "updated_at",
+)
+CANDIDACY_COLUMNS = (
+    "id",
+    "job_posting_id",
+    "status",
+    "applied_on",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+STATUS_EVENT_COLUMNS = ("id", "candidacy_id", "status", "occurred_at")
+
+SENIORITIES = {"": 40, "Junior ": 15, "Senior ": 30, "Lead ": 10, "Staff ": 5}
+ROLES = [
+    "backend engineer",
+    "frontend engineer",
+    "full-stack developer",
+    "Python developer",
+    "data engineer",
+    "data scientist",
+    "DevOps engineer",
+    "site reliability engineer",
+    "mobile developer",
+    "QA engineer",
+    "product designer",
+    "product manager",
+    "engineering manager",
+    "security engineer",
+    "machine learning engineer",
+]
+LOCATIONS = {
+    "Paris": 45,
+    "Lyon": 12,
+    "Toulouse": 8,
+    "Nantes": 8,
+    "Bordeaux": 7,
+    "Lille": 6,
+    "Marseille": 5,
+    "Rennes": 4,
+    "Remote": 5,
+}
+COMPANY_PREFIXES = [
+    "Acme",
+    "Blue",
+    "Bright",
+    "Cloud",
+    "Data",
+    "Delta",
+    "Green",
+    "Hexa",
+    "Iron",
+    "Luma",
+    "Nova",
+    "Orbit",
+    "Pixel",
+    "Quantum",
+    "Silver",
+    "Terra",
+    "Vertex",
+    "Wave",
+    "Zen",
+    "Atlas",
+]
+COMPANY_SUFFIXES = [
+    "Labs",
+    "Systems",
+    "Software",
+    "Analytics",
+    "Health",
+    "Logistics",
+    "Finance",
+    "Robotics",
+    "Studio",
+    "Networks",
+    "Energy",
+    "Media",
+    "Security",
+    "Works",
+    "Mobility",
+    "Foods",
+    "Games",
+    "Insurance",
+    "Retail",
+    "Bank",
+    "Cloud",
+    "AI",
+    "Tech",
+    "Digital",
+    "Solutions",
+]
+COMPANIES = [
+    f"{prefix} {suffix}" for suffix in COMPANY_SUFFIXES for prefix in COMPANY_PREFIXES
+]
+DESCRIPTION_ENDINGS = [
+    "You will ship product features with a small cross-functional team.",
+    "You will improve the reliability and performance of our platform.",
+    "You will help us scale our product to new markets.",
+    "You will own projects end to end, from design to production.",
+]
+NOTES = {
+    "": 50,
+    "Applied through the company website.": 15,
+    "Referred by a former colleague.": 10,
+    "Follow up next week.": 15,
+    "Salary expectations discussed.": 10,
+}
+
+PLATFORMS = {
+    Platforms.LINKEDIN: 55,
+    Platforms.INDEED: 25,
+    Platforms.WTTJ: 12,
+    Platforms.CAREER_PAGE: 8,
+}
+EMPLOYMENT_TYPES = {
+    EmploymentType.FULL_TIME: 70,
+    EmploymentType.FIXED_TERM: 10,
+    EmploymentType.FREELANCE: 8,
+    EmploymentType.INTERNSHIP: 6,
+    EmploymentType.APPRENTICESHIP: 4,
+    EmploymentType.PART_TIME: 2,
+}
+WORK_MODES = {WorkMode.HYBRID: 55, WorkMode.ON_SITE: 30, WorkMode.REMOTE: 15}
+STATUSES = {
+    CandidacyStatus.APPLIED: 40,
+    CandidacyStatus.REJECTED: 30,
+    CandidacyStatus.INTERVIEW: 12,
+    CandidacyStatus.WITHDRAWN: 9,
+    CandidacyStatus.TECHNICAL_TEST: 6,
+    CandidacyStatus.OFFER: 3,
+}
+
+# Statuses walked through before reaching each current status. Rejections
+# and withdrawals sometimes follow an interview, see _status_path().
+STATUS_PATHS: dict[str, list[str]] = {
+    CandidacyStatus.APPLIED: [CandidacyStatus.APPLIED],
+    CandidacyStatus.INTERVIEW: [CandidacyStatus.APPLIED, CandidacyStatus.INTERVIEW],
+    CandidacyStatus.TECHNICAL_TEST: [
+        CandidacyStatus.APPLIED,
+        CandidacyStatus.INTERVIEW,
+        CandidacyStatus.TECHNICAL_TEST,
+    ],
+    CandidacyStatus.OFFER: [
+        CandidacyStatus.APPLIED,
+        CandidacyStatus.INTERVIEW,
+        CandidacyStatus.TECHNICAL_TEST,
+        CandidacyStatus.OFFER,
+    ],
+    CandidacyStatus.REJECTED: [CandidacyStatus.APPLIED, CandidacyStatus.REJECTED],
+    CandidacyStatus.WITHDRAWN: [CandidacyStatus.APPLIED, CandidacyStatus.WITHDRAWN],
+}
+
+# Postings are spread over the year before the anchor date, mostly recent.
+POSTED_DAYS = 365
+POSTED_MEAN_AGE_DAYS = 60
+
+
+class ChunkTask(NamedTuple):
+    seed: int
+    start: int
+    stop: int
+    postings: int
+    candidacies: int
+    anchor: date
+    now: datetime
+
+
+class Chunk(NamedTuple):
+    postings: bytes
+    candidacies: bytes
+    status_events: bytes
+    posting_count: int
+    candidacy_count: int
+    status_event_count: int
+
+
+class _Weighted[T]:
+    """Population and cumulative weights, for `Random.choices()`."""
+
+    def __init__(self, weights: Mapping[T, float]) -> None:
+        self.population = list(weights)
+        self.cum_weights = list(accumulate(weights.values()))
+
+    def draw(self, rng: random.Random, count: int) -> list[T]:
+        return rng.choices(self.population, cum_weights=self.cum_weights, k=count)
+
+
+_SENIORITIES = _Weighted(SENIORITIES)
+_LOCATIONS = _Weighted(LOCATIONS)
+# Zipf-like: the n-th company posts about 1/n as many jobs as the first.
+_COMPANIES = _Weighted({company: 1 / rank for rank, company in enumerate(COMPANIES, 1)})
+_NOTES = _Weighted(NOTES)
+_PLATFORMS = _Weighted(PLATFORMS)
+_EMPLOYMENT_TYPES = _Weighted(EMPLOYMENT_TYPES)
+_WORK_MODES = _Weighted(WORK_MODES)
+_STATUSES = _Weighted(STATUSES)
+
+_normalized_texts: dict[str, str] = {}
+
+
+def _normalized_text(value: str) -> str:
+    # Titles and companies come from small vocabularies.
+    try:
+        return _normalized_texts[value]
+    except KeyError:
+        normalized = _normalized_texts[value] = normalize_text(value) or ""
+        return normalized
+
+
+def _copy_rows(rows: Iterable[Sequence[str]]) -> bytes:
+    return "".join("\t".join(row) + "\n" for row in rows).encode()
+
+
+def _bool(value: bool) -> str:
+    return "t" if value else "f"
+
+
+def has_candidacy(index: int, *, postings: int, candidacies: int) -> bool:
+    """Whether posting `index` gets a candidacy: they are evenly spread."""
+    return (index + 1) * candidacies // postings > index * candidacies // postings
+
+
+def _status_path(status: str, rng: random.Random) -> list[str]:
+    path = STATUS_PATHS[status]
+
+    outcome = status in (CandidacyStatus.REJECTED, CandidacyStatus.WITHDRAWN)
+    if outcome and rng.random() < 0.35:
+        return [CandidacyStatus.APPLIED, CandidacyStatus.INTERVIEW, status]
+
+    return path
+
+
+def generate_chunk(task: ChunkTask) -> Chunk:
+    """Rows of the postings `task.start` to `task.stop`, as COPY text."""
+    rng = random.Random(f"{task.seed}:{task.start}")
+    count = task.stop - task.start
+    now = task.now.isoformat()
+    url_prefix = f"https://jobs.example.com/{task.seed}/"
+    # Only the scheme and host of URLs change when normalized.
+    normalized_url_prefix = f"{normalize_url(url_prefix.rstrip('/'))}/"
+
+    seniorities = _SENIORITIES.draw(rng, count)
+    roles = rng.choices(ROLES, k=count)
+    companies = _COMPANIES.draw(rng, count)
+    locations = _LOCATIONS.draw(rng, count)
+    platforms = _PLATFORMS.draw(rng, count)
+    employment_types = _EMPLOYMENT_TYPES.draw(rng, count)
+    work_modes = _WORK_MODES.draw(rng, count)
+
+    postings: list[tuple[str, ...]] = []
+    candidacies: list[tuple[str, ...]] = []
+    status_events: list[tuple[str, ...]] = []
+
+    for offset, index in enumerate(range(task.start, task.stop)):
+        title = f"{seniorities[offset]}{roles[offset]}"
+        title = title[0].upper() + title[1:]
+        company = companies[offset]
+        location = locations[offset]
+        url = f"{url_prefix}{index}"
+        posted_on = task.anchor - timedelta(
+            days=int(rng.expovariate(1 / POSTED_MEAN_AGE_DAYS)) % POSTED_DAYS
+        )
+        salary = f"{rng.randrange(35, 95, 5)}k € / year" if rng.random() < 0.6 else ""
+        description = (
+            f"{company} is looking for a {title.lower()} in {location}. "
+            f"{rng.choice(DESCRIPTION_ENDINGS)}"
+        )
+        posting_id = uuid7_default()
+
+        postings.append(
+            (
+                str(posting_id),
+                title,
+                company,
+                location,
+                url,
+                description,
+                salary,
+                _bool(rng.random() < 0.4),
+                _bool(rng.random() < 0.3),
+                posted_on.isoformat(),
+                platforms[offset],
+                employment_types[offset],
+                work_modes[offset],
+                _normalized_text(title),
+                _normalized_text(company),
+                f"{normalized_url_prefix}{index}",
+                now,
+                now,
+            )
+        )
+
+        if has_candidacy(index, postings=task.postings, candidacies=task.candidacies):
+            _add_candidacy(posting_id, posted_on, task, rng, candidacies, status_events)
+
+    return Chunk(
+        postings=_copy_rows(postings),
+        candidacies=_copy_rows(candidacies),
+        status_events=_copy_rows(status_events),
+        posting_count=len(postings),
+        candidacy_count=len(candidacies),
+        status_event_count=len(status_events),
+    )
+
+
+def _add_candidacy(
+    posting_id: UUID,
+    posted_on: date,
+    task: ChunkTask,
+    rng: random.Random,
+    candidacies: list[tuple[str, ...]],
+    status_events: list[tuple[str, ...]],
+) -> None:
+    candidacy_id = str(uuid7_default())
+    status = _STATUSES.draw(rng, 1)[0]
+    applied_on = min(posted_on + timedelta(days=rng.randrange(10)), task.anchor)
+    occurred_at = datetime.combine(applied_on, task.now.timetz())
+
+    for event_status in _status_path(status, rng):
+        status_events.append(
+            (
+                str(uuid7_default()),
+                candidacy_id,
+                event_status,
+                occurred_at.isoformat(),
+            )
+        )
+        # Histories of recent candidacies stop today.
+        occurred_at = min(occurred_at + timedelta(days=rng.randrange(1, 15)), task.now)
+
+    candidacies.append(
+        (
+            candidacy_id,
+            str(posting_id),
+            status,
+            applied_on.isoformat(),
+            _NOTES.draw(rng, 1)[0],
+            task.now.isoformat(),
+            task.now.isoformat(),
+        )
+    )
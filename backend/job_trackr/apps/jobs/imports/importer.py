@@ -0,0 +1,359 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/imports/importer.py
+
+"""
+Set-based imports of job postings and candidacies from CSV or NDJSON files.
+
+Rows never go through the ORM:
+
+1. The file is copied into a staging table, see apps.jobs.imports.staging.
+2. One `CREATE TABLE ... AS SELECT` validates and normalizes every row with
+   the rules of apps.jobs.imports.rules, and gives each a posting id.
+3. Valid rows are merged into `job_posting` with one
+   `INSERT ... ON CONFLICT (normalized_url) DO UPDATE`, like the bulk upsert
+   API does: a row whose normalized URL exists updates that posting, rows
+   without a URL are always created, and a URL may only appear once in a
+   file. Rows equal to their posting leave it untouched.
+4. Rows with candidacy columns are merged into `job_candidacy` the same
+   way, keyed by posting, with a status event for each new status.
+
+Everything happens in one transaction, which drops the work tables at the
+end. `COPY` and raw SQL skip `save()` and signals: cache versions are bumped
+here, and the signatures of postings whose text changed are deleted, to be
+recomputed by `cluster_duplicate_postings` with those of new postings.
+"""
+
+import time
+import uuid
+from collections.abc import Callable
+from datetime import date, datetime
+from enum import StrEnum
+from typing import IO, NamedTuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.common.cache import bump_model_version
+from apps.common.uuid import UUID7_SQL
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.imports.rules import (
+    CANDIDACY_FIELDS,
+    COLUMNS,
+    POSTING_FIELDS,
+    cleaned_sql,
+    column_sql,
+    errors_sql,
+    literal,
+    normalized_sql,
+)
+from apps.jobs.imports.staging import (
+    ImportFormat,
+    copy_file,
+    create_staging_table,
+    source_sql,
+)
+from apps.jobs.postings.dedupe import SOURCE_FIELDS
+from apps.jobs.postings.models import JobPosting, JobPostingSignature
+from apps.jobs.postings.normalization import NORMALIZED_FIELDS
+
+DUPLICATE_URL_ERROR = "url: This URL appears more than once in the file."
+
+# Posting columns compared with, then written over, those of the posting
+# with the same normalized URL.
+_UPSERT_FIELDS = [*POSTING_FIELDS, "normalized_title", "normalized_company"]
+# Errors are NULL rather than empty, so the planner knows from the column's
+# statistics how many rows are valid.
+_VALID = "errors IS NULL"
+
+
+class ImportStep(StrEnum):
+    LOAD = "load"
+    VALIDATE = "validate"
+    MERGE_POSTINGS = "merge postings"
+    MERGE_CANDIDACIES = "merge candidacies"
+
+
+class Reject(NamedTuple):
+    line: int
+    errors: list[str]
+
+
+class ImportResult(NamedTuple):
+    rows: int
+    rejects: list[Reject]
+    postings_created: int
+    postings_updated: int
+    candidacies_created: int
+    candidacies_updated: int
+    # Columns of the file that are not importable.
+    ignored_columns: list[str]
+    # Seconds.
+    duration: float
+
+    @property
+    def postings_unchanged(self) -> int:
+        return (
+            self.rows
+            - len(self.rejects)
+            - self.postings_created
+            - self.postings_updated
+        )
+
+
+def _create_rows_table(table: str, source: str) -> int:
+    """Create the table of checked rows and return their number."""
+    cleaned = ", ".join(f"{cleaned_sql(name)} AS {name}" for name in COLUMNS)
+    values = ", ".join(f"{column_sql(name, name).value} AS {name}" for name in COLUMNS)
+    normalized = ", ".join(
+        f"{sql} AS {name}"
+        for name, sql in normalized_sql({c: c for c in COLUMNS}).items()
+    )
+    has_candidacy = " OR ".join(f"{name} IS NOT NULL" for name in CANDIDACY_FIELDS)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE UNLOGGED TABLE {table} AS
+            SELECT
+                line,
+                CASE
+                    WHEN file_error IS NOT NULL THEN ARRAY[file_error]
+                    ELSE NULLIF({errors_sql({name: name for name in COLUMNS})}, '{{}}')
+                END AS errors,
+                {values},
+                {normalized},
+                {has_candidacy} AS has_candidacy,
+                {UUID7_SQL} AS posting_id
+            FROM (
+                -- OFFSET 0 keeps the cleaned values from being inlined, and
+                -- computed again, in every expression using them.
+                SELECT line, file_error, {cleaned} FROM ({source}) AS source OFFSET 0
+            ) AS cleaned
+            """
+        )
+        rows: int = cursor.rowcount
+
+        # PostgreSQL cannot update the same row twice in one statement: the
+        # first valid row of a URL wins.
+        cursor.execute(
+            f"""
+            UPDATE {table} SET errors = ARRAY[{literal(DUPLICATE_URL_ERROR)}]
+            WHERE line IN (
+                SELECT line
+                FROM (
+                    SELECT
+                        line,
+                        row_number() OVER (
+                            PARTITION BY normalized_url ORDER BY line
+                        ) AS rank
+                    FROM {table}
+                    WHERE {_VALID} AND normalized_url IS NOT NULL
+                ) AS ranked
+                WHERE rank > 1
+            )
+            """
+        )
+        cursor.execute(f"ANALYZE {table}")
+
+    return rows
+
+
+def _merge_postings(table: str, now: datetime) -> tuple[int, int]:
+    """Upsert the valid rows, returning the created and updated counts."""
+    postings = JobPosting._meta.db_table
+    signatures = JobPostingSignature._meta.db_table
+    fields = ", ".join(
+        ["id", *POSTING_FIELDS, *NORMALIZED_FIELDS, "created_at", "updated_at"]
+    )
+    values = ", ".join(
+        ["posting_id", *POSTING_FIELDS, *NORMALIZED_FIELDS, "%(now)s", "%(now)s"]
+    )
+    updates = ", ".join(
+        f"{name} = EXCLUDED.{name}" for name in [*_UPSERT_FIELDS, "updated_at"]
+    )
+    current = ", ".join(f"posting.{name}" for name in _UPSERT_FIELDS)
+    excluded = ", ".join(f"EXCLUDED.{name}" for name in _UPSERT_FIELDS)
+    sources = ", ".join(SOURCE_FIELDS)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH merged AS (
+                INSERT INTO {postings} AS posting ({fields})
+                SELECT {values} FROM {table} WHERE {_VALID} ORDER BY line
+                ON CONFLICT (normalized_url) DO UPDATE SET {updates}
+                WHERE ({current}) IS DISTINCT FROM ({excluded})
+                RETURNING posting.id, posting.xmax = 0 AS created, {sources}
+            ),
+            -- Every sub-statement sees the postings as they were before.
+            stale_signatures AS (
+                DELETE FROM {signatures} AS signature
+                USING merged, {postings} AS previous
+                WHERE NOT merged.created
+                    AND signature.job_posting_id = merged.id
+                    AND previous.id = merged.id
+                    AND ({", ".join(f"previous.{name}" for name in SOURCE_FIELDS)})
+                        IS DISTINCT FROM
+                        ({", ".join(f"merged.{name}" for name in SOURCE_FIELDS)})
+            )
+            SELECT count(*) FILTER (WHERE created), count(*) FILTER (WHERE NOT created)
+            FROM merged
+            """,
+            {"now": now},
+        )
+        created, updated = cursor.fetchone()
+
+        # Candidacies are merged by joining the postings: the planner must
+        # know about the new ones.
+        cursor.execute(f"ANALYZE {postings}")
+
+    return created, updated
+
+
+def _merge_candidacies(table: str, now: datetime, today: date) -> tuple[int, int]:
+    """
+    Upsert the candidacies of the valid rows, returning the created and
+    updated counts. A row without `applied_on` keeps the candidacy's date,
+    or applies today.
+    """
+    postings = JobPosting._meta.db_table
+    candidacies = JobCandidacy._meta.db_table
+    events = CandidacyStatusEvent._meta.db_table
+    compared = ["status", "applied_on", "notes"]
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH source AS (
+                SELECT
+                    COALESCE(posting.id, imported.posting_id) AS job_posting_id,
+                    imported.status,
+                    imported.applied_on,
+                    imported.notes
+                FROM {table} AS imported
+                LEFT JOIN {postings} AS posting
+                    ON posting.normalized_url = imported.normalized_url
+                WHERE imported.errors IS NULL AND imported.has_candidacy
+            ),
+            previous AS (
+                SELECT candidacy.job_posting_id, candidacy.status, candidacy.applied_on
+                FROM {candidacies} AS candidacy
+                JOIN source USING (job_posting_id)
+            ),
+            merged AS (
+                INSERT INTO {candidacies} AS candidacy
+                    (id, job_posting_id, status, applied_on, notes, created_at, updated_at)
+                SELECT
+                    {UUID7_SQL},
+                    source.job_posting_id,
+                    source.status,
+                    COALESCE(source.applied_on, previous.applied_on, %(today)s),
+                    source.notes,
+                    %(now)s,
+                    %(now)s
+                FROM source
+                LEFT JOIN previous USING (job_posting_id)
+                ON CONFLICT (job_posting_id) DO UPDATE SET
+                    {", ".join(f"{name} = EXCLUDED.{name}" for name in [*compared, "updated_at"])}
+                WHERE ({", ".join(f"candidacy.{name}" for name in compared)})
+                    IS DISTINCT FROM ({", ".join(f"EXCLUDED.{name}" for name in compared)})
+                RETURNING
+                    candidacy.id,
+                    candidacy.job_posting_id,
+                    candidacy.status,
+                    candidacy.xmax = 0 AS created
+            ),
+            status_events AS (
+                INSERT INTO {events} (id, candidacy_id, status, occurred_at)
+                SELECT {UUID7_SQL}, merged.id, merged.status, %(now)s
+                FROM merged
+                LEFT JOIN previous USING (job_posting_id)
+                WHERE merged.status IS DISTINCT FROM previous.status
+            )
+            SELECT count(*) FILTER (WHERE created), count(*) FILTER (WHERE NOT created)
+            FROM merged
+            """,
+            {"now": now, "today": today},
+        )
+        created, updated = cursor.fetchone()
+
+    return created, updated
+
+
+def _rejects(table: str) -> list[Reject]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT line, errors FROM {table} WHERE errors IS NOT NULL ORDER BY line"
+        )
+        return [Reject(*row) for row in cursor.fetchall()]
+
+
+def import_jobs(
+    file: IO[bytes],
+    file_format: ImportFormat,
+    *,
+    dry_run: bool = False,
+    on_progress: Callable[[ImportStep, int], None] | None = None,
+) -> ImportResult:
+    """
+    Import the postings and candidacies of `file`. With `dry_run`, rows are
+    validated and merged, then rolled back.
+
+    `on_progress` is passed each step when it ends, with its count of rows,
+    and the number of bytes loaded so far during the load.
+    """
+
+    def progress(step: ImportStep, count: int) -> None:
+        if on_progress is not None:
+            on_progress(step, count)
+
+    start = time.perf_counter()
+    suffix = uuid.uuid4().hex[:12]
+    staging_table = f"import_staging_{suffix}"
+    rows_table = f"import_rows_{suffix}"
+    now = timezone.now()
+
+    with transaction.atomic():
+        staging = create_staging_table(staging_table, file_format, file)
+        copy_file(
+            staging,
+            file,
+            on_block=lambda sent: progress(ImportStep.LOAD, sent),
+        )
+
+        rows = _create_rows_table(rows_table, source_sql(staging))
+        rejects = _rejects(rows_table)
+        progress(ImportStep.VALIDATE, rows)
+
+        postings_created, postings_updated = _merge_postings(rows_table, now)
+        progress(ImportStep.MERGE_POSTINGS, postings_created + postings_updated)
+
+        candidacies_created, candidacies_updated = _merge_candidacies(
+            rows_table, now, timezone.localdate()
+        )
+        progress(
+            ImportStep.MERGE_CANDIDACIES, candidacies_created + candidacies_updated
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {staging_table}, {rows_table}")
+
+        if dry_run:
+            transaction.set_rollback(True)
+
+    if not dry_run:
+        if postings_created or postings_updated:
+            bump_model_version(JobPosting)
+        if candidacies_created or candidacies_updated:
+            bump_model_version(JobCandidacy)
+
+    return ImportResult(
+        rows=rows,
+        rejects=rejects,
+        postings_created=postings_created,
+        postings_updated=postings_updated,
+        candidacies_created=candidacies_created,
+        candidacies_updated=candidacies_updated,
+        ignored_columns=staging.ignored,
+        duration=time.perf_counter() - start,
+    )
@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/imports/rules.py
+
+"""
+Validation and normalization of imported rows, as SQL expressions.
+
+Each importable column is checked against its model field like the API's
+serializers would: values are stripped, required fields may not be blank,
+lengths, choices, booleans, ISO dates and URLs are checked, and blank
+optional values get the field's default. Error messages are DRF's.
+
+Normalized posting fields come from the SQL counterparts of
+apps.common.normalization, so imported postings are found by the same
+duplicate lookups as the API's.
+"""
+
+from collections.abc import Callable
+from typing import Any, NamedTuple, cast
+
+from django.db import models
+from rest_framework import serializers
+
+from apps.common.normalization import (
+    URL_PATTERN_SQL,
+    normalize_text,
+    normalize_text_sql,
+    normalize_url,
+    normalize_url_sql,
+    strip_sql,
+)
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.postings.normalization import NORMALIZED_FIELDS
+
+# Same fields as the bulk upsert API.
+POSTING_FIELDS = (
+    "title",
+    "company",
+    "location",
+    "url",
+    "salary",
+    "description",
+    "easy_apply",
+    "active_hiring",
+    "platform",
+    "employment_type",
+    "work_mode",
+    "posted_on",
+)
+# A row with any of these also creates or updates the posting's candidacy.
+CANDIDACY_FIELDS = ("status", "applied_on", "notes")
+COLUMNS = POSTING_FIELDS + CANDIDACY_FIELDS
+
+_NORMALIZERS_SQL: dict[Callable[[str | None], str | None], Callable[[str], str]] = {
+    normalize_text: normalize_text_sql,
+    normalize_url: normalize_url_sql,
+}
+_DATE_PATTERN = "^[0-9]{4}-[0-9]{1,2}-[0-9]{1,2}$"
+
+
+class Check(NamedTuple):
+    # The value is invalid when this SQL condition holds.
+    condition: str
+    # SQL expression of the error message.
+    message: str
+
+
+class ColumnSQL(NamedTuple):
+    # SQL expression of the value to write, typed like the model field.
+    value: str
+    checks: list[Check]
+
+
+def literal(value: str | bool) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    return "'" + value.replace("'", "''") + "'"
+
+
+def cleaned_sql(raw: str) -> str:
+    """SQL expression of the text `raw` stripped, NULL when blank."""
+    return f"NULLIF({strip_sql(raw)}, '')"
+
+
+def _model_field(name: str) -> models.Field[Any, Any]:
+    model = JobCandidacy if name in CANDIDACY_FIELDS else JobPosting
+    return cast(models.Field[Any, Any], model._meta.get_field(name))
+
+
+def _default(field: models.Field[Any, Any]) -> str:
+    # Callable defaults, e.g. `date.today`, are left to the merge.
+    if field.has_default() and not callable(field.default):
+        return literal(field.default)
+
+    if field.null or not isinstance(field, (models.CharField, models.TextField)):
+        return "NULL"
+
+    return "''"
+
+
+def _boolean_sql(value: str) -> str:
+    """CASE branches parsing `value` like DRF's BooleanField."""
+    branches = []
+
+    for boolean, accepted in (
+        (True, serializers.BooleanField.TRUE_VALUES),
+        (False, serializers.BooleanField.FALSE_VALUES),
+    ):
+        texts = sorted(text for text in accepted if isinstance(text, str))
+        branches.append(
+            f"WHEN lower({value}) IN ({', '.join(map(literal, texts))}) "
+            f"THEN {literal(boolean)}"
+        )
+
+    return " ".join(branches)
+
+
+def column_sql(name: str, value: str) -> ColumnSQL:
+    """
+    SQL of the column `name`, whose cleaned text is the SQL expression
+    `value` (see cleaned_sql()).
+    """
+    field = _model_field(name)
+    default = _default(field)
+    checks = []
+
+    if not field.blank and not field.has_default():
+        checks.append(Check(f"{value} IS NULL", literal("This field is required.")))
+
+    if isinstance(field, models.BooleanField):
+        parsed = f"CASE {_boolean_sql(value)} END"
+        checks.append(
+            Check(
+                f"{value} IS NOT NULL AND {parsed} IS NULL",
+                literal("Must be a valid boolean."),
+            )
+        )
+        return ColumnSQL(f"COALESCE({parsed}, {default})", checks)
+
+    if isinstance(field, models.DateField):
+        parsed = (
+            f"CASE WHEN {value} ~ '{_DATE_PATTERN}' "
+            f"AND pg_input_is_valid({value}, 'date') THEN {value}::date END"
+        )
+        checks.append(
+            Check(
+                f"{value} IS NOT NULL AND {parsed} IS NULL",
+                literal(
+                    "Date has wrong format. "
+                    "Use one of these formats instead: YYYY-MM-DD."
+                ),
+            )
+        )
+        return ColumnSQL(f"COALESCE({parsed}, {default})", checks)
+
+    if field.max_length is not None:
+        checks.append(
+            Check(
+                f"char_length({value}) > {field.max_length}",
+                literal(
+                    f"Ensure this field has no more than {field.max_length} characters."
+                ),
+            )
+        )
+
+    if isinstance(field, models.URLField):
+        checks.append(
+            Check(f"{value} !~* '{URL_PATTERN_SQL}'", literal("Enter a valid URL."))
+        )
+
+    if field.choices:
+        choices = ", ".join(
+            literal(str(choice)) for choice, _label in field.flatchoices
+        )
+        checks.append(
+            Check(
+                f"{value} NOT IN ({choices})",
+                f"""'"' || {value} || '" is not a valid choice.'""",
+            )
+        )
+
+    return ColumnSQL(f"COALESCE({value}, {default})", checks)
+
+
+def errors_sql(columns: dict[str, str]) -> str:
+    """
+    SQL array of the error messages of a row, as "<column>: <message>".
+    `columns` maps column names to the SQL of their cleaned values.
+    """
+    messages = [
+        f"CASE WHEN {check.condition} THEN {literal(f'{name}: ')} || {check.message} END"
+        for name, value in columns.items()
+        for check in column_sql(name, value).checks
+    ]
+
+    return f"array_remove(ARRAY[{', '.join(messages)}]::text[], NULL)"
+
+
+def normalized_sql(columns: dict[str, str]) -> dict[str, str]:
+    """
+    SQL of the normalized posting fields by field name, from the cleaned
+    values of `columns`.
+    """
+    normalized = {}
+
+    for field_name, (source, normalizer) in NORMALIZED_FIELDS.items():
+        value = _NORMALIZERS_SQL[normalizer](columns[source])
+
+        if not JobPosting._meta.get_field(field_name).null:
+            value = f"COALESCE({value}, '')"
+
+        normalized[field_name] = value
+
+    return normalized
@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/imports/staging.py
+
+"""
+Loading of import files into a staging table with `COPY FROM STDIN`.
+
+The file is streamed to PostgreSQL in blocks, as is: Python neither parses
+it nor holds it in memory. The staging table is unlogged, as it only lives
+for the import's transaction, and numbers rows with their line in the file.
+
+- CSV files are parsed by COPY itself. Only their header is read here, to
+  map the file's columns to importable ones: others are loaded but ignored.
+- NDJSON files are loaded one line per row and parsed in SQL, see
+  `source_sql()`: a line of invalid JSON is a rejected row instead of a
+  failed import.
+"""
+
+import codecs
+import csv
+from collections.abc import Callable
+from enum import StrEnum
+from typing import IO, NamedTuple
+
+from django.db import connection
+
+from apps.common.normalization import WHITESPACE_SQL
+from apps.jobs.imports.rules import COLUMNS, literal
+
+BLOCK_SIZE = 1024 * 1024
+
+# The column NDJSON lines are loaded in.
+_DOCUMENT = "document"
+
+
+class ImportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ImportFileError(ValueError):
+    pass
+
+
+class Staging(NamedTuple):
+    table: str
+    format: ImportFormat
+    # Columns of the table loaded by COPY, in file order.
+    copy_columns: list[str]
+    # Importable columns found in the file.
+    columns: list[str]
+    # Columns of the file that are not importable.
+    ignored: list[str]
+
+
+def _read_header(file: IO[bytes]) -> list[str]:
+    # Excel starts UTF-8 files with a byte order mark.
+    text = codecs.decode(file.readline(), "utf-8-sig").strip("\r\n")
+
+    if not text:
+        raise ImportFileError("The file has no header.")
+
+    return [name.strip().lower() for name in next(csv.reader([text]))]
+
+
+def create_staging_table(
+    table: str,
+    file_format: ImportFormat,
+    file: IO[bytes],
+) -> Staging:
+    """Create the staging table for `file`, after reading its CSV header."""
+    if file_format == ImportFormat.NDJSON:
+        staging = Staging(table, file_format, [_DOCUMENT], list(COLUMNS), [])
+    else:
+        header = _read_header(file)
+        repeated = sorted({name for name in header if header.count(name) > 1})
+
+        if repeated:
+            raise ImportFileError(
+                f"Columns appear more than once: {', '.join(repeated)}."
+            )
+
+        staging = Staging(
+            table,
+            file_format,
+            # Ignored columns are loaded too: COPY cannot skip them.
+            [
+                name if name in COLUMNS else f"ignored_{position}"
+                for position, name in enumerate(header, 1)
+            ],
+            [name for name in header if name in COLUMNS],
+            [name for name in header if name not in COLUMNS],
+        )
+
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(f"{quote_name(name)} text" for name in staging.copy_columns)
+    # Rows are numbered like the lines of the file, unless CSV values span
+    # several lines.
+    first_line = 2 if file_format == ImportFormat.CSV else 1
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE UNLOGGED TABLE {quote_name(table)} ("
+            f"line bigint GENERATED ALWAYS AS IDENTITY (START WITH {first_line}), "
+            f"{columns})"
+        )
+
+    return staging
+
+
+def _escape_text(block: bytes) -> bytes:
+    # Backslashes, tabs and carriage returns are special in COPY's text
+    # format. All are single bytes: blocks are escaped independently.
+    return block.replace(b"\\", b"\\\\").replace(b"\t", b"\\t").replace(b"\r", b"\\r")
+
+
+def copy_file(
+    staging: Staging,
+    file: IO[bytes],
+    *,
+    on_block: Callable[[int], None] | None = None,
+) -> None:
+    """
+    Stream the rest of `file` into the staging table. `on_block` is passed
+    the number of bytes sent so far.
+    """
+    quote_name = connection.ops.quote_name
+    columns = ", ".join(map(quote_name, staging.copy_columns))
+    options = (
+        "FORMAT text"
+        if staging.format == ImportFormat.NDJSON
+        else "FORMAT csv, HEADER false"
+    )
+    sent = 0
+
+    # Turn psycopg errors into Django's, e.g. DataError for a malformed CSV.
+    with (
+        connection.wrap_database_errors,
+        connection.cursor() as cursor,
+        cursor.copy(
+            f"COPY {quote_name(staging.table)} ({columns}) FROM STDIN "
+            f"WITH ({options}, ENCODING 'UTF8')"
+        ) as copy,
+    ):
+        while block := file.read(BLOCK_SIZE):
+            if staging.format == ImportFormat.NDJSON:
+                block = _escape_text(block)
+
+            copy.write(block)
+            sent += len(block)
+
+            if on_block is not None:
+                on_block(sent)
+
+
+def source_sql(staging: Staging) -> str:
+    """
+    SQL of the staged rows, with a `line`, a `file_error` and one text column
+    per importable column: NULL when missing from the file or row.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(staging.table)
+
+    if staging.format == ImportFormat.CSV:
+        columns = ", ".join(
+            quote_name(name) if name in staging.columns else f"NULL::text AS {name}"
+            for name in COLUMNS
+        )
+        return f"SELECT line, NULL::text AS file_error, {columns} FROM {table}"
+
+    document = quote_name(_DOCUMENT)
+    columns = ", ".join(
+        f"parsed.value ->> {literal(name)} AS {name}" for name in COLUMNS
+    )
+
+    # Blank lines are skipped, like the API's NDJSON parser does.
+    return f"""
+        SELECT
+            line,
+            CASE
+                WHEN parsed.value IS NULL THEN 'This line is not valid JSON.'
+                WHEN jsonb_typeof(parsed.value) <> 'object'
+                    THEN 'This line is not a JSON object.'
+            END AS file_error,
+            {columns}
+        FROM {table},
+            LATERAL (
+                SELECT CASE
+                    WHEN pg_input_is_valid({document}, 'jsonb') THEN {document}::jsonb
+                END AS value
+            ) AS parsed
+        WHERE {document} !~ '^[{WHITESPACE_SQL}]*$'
+    """
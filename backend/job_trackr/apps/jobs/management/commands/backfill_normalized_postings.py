@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/backfill_normalized_postings.py
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.common.cache import bump_model_version
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.postings.normalization import backfill_normalized_fields
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the normalized title, company and URL of every job posting, "
+        "e.g. after a change to apps.common.normalization."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--chunk-size", type=int, default=1_000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        chunk_size = options["chunk_size"]
+
+        if chunk_size <= 0:
+            raise CommandError("Chunk size must be greater than 0.")
+
+        updated = backfill_normalized_fields(JobPosting, chunk_size=chunk_size)
+
+        # `bulk_update` bypasses the signals that bump cache versions.
+        if updated:
+            bump_model_version(JobPosting)
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} job postings."))
@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/benchmark_api.py
+
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection, transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIClient
+
+from apps.common.instrumentation import RequestTimings
+from apps.jobs.benchmarks.dataset import seed_dataset
+from apps.jobs.benchmarks.scenarios import Scenario, build_scenarios
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.postings.models import JobPosting
+
+Result = dict[str, float]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a deterministic dataset, time every jobs API endpoint, filter "
+        "and ordering on it, and compare the results with a JSON baseline. "
+        "Fails when a scenario regresses beyond the threshold. The dataset "
+        "is rolled back at the end: run it on an empty database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--postings", type=int, default=10_000)
+        parser.add_argument("--candidacy-ratio", type=float, default=0.5)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            default=[],
+            help="Only run scenarios whose name contains this text (repeatable).",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=Path,
+            default=settings.BASE_DIR.parent / "benchmarks" / "api-baseline.json",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Record the results as the new baseline instead of comparing.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Allowed relative slowdown of a scenario's median time.",
+        )
+        parser.add_argument(
+            "--min-delta-ms",
+            type=float,
+            default=2.0,
+            help="Slowdowns below this many milliseconds are noise.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["postings"] <= 0:
+            raise CommandError("Postings must be greater than 0.")
+
+        if not 0 < options["candidacy_ratio"] <= 1:
+            raise CommandError("Candidacy ratio must be between 0 and 1.")
+
+        if options["repeat"] <= 0:
+            raise CommandError("Repeat must be greater than 0.")
+
+        if JobPosting.objects.exists():
+            raise CommandError(
+                "The benchmark seeds its own dataset: run it on an empty database."
+            )
+
+        dataset = {
+            "postings": options["postings"],
+            "candidacy_ratio": options["candidacy_ratio"],
+            "seed": options["seed"],
+        }
+        path = Path(options["baseline"])
+        baseline = self._read_baseline(path)
+
+        if baseline is not None and baseline["dataset"] != dataset:
+            if not options["update_baseline"]:
+                raise CommandError(
+                    f"{path} was recorded on another dataset ({baseline['dataset']}): "
+                    "run with the same options or --update-baseline."
+                )
+            baseline = None
+
+        results = self._run(dataset, options["scenario"], options["repeat"])
+
+        if options["update_baseline"]:
+            scenarios = baseline["scenarios"] if baseline is not None else {}
+            self._write_baseline(
+                path,
+                {"dataset": dataset, "scenarios": {**scenarios, **results}},
+            )
+            self.stdout.write(f"Baseline written to {path}.")
+            return
+
+        reference = baseline["scenarios"] if baseline is not None else {}
+        regressions = [
+            name
+            for name, result in results.items()
+            if self._report(name, result, reference.get(name), options)
+        ]
+
+        if baseline is None:
+            self.stdout.write(
+                f"No baseline at {path}, record one with --update-baseline."
+            )
+
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} scenario(s) regressed: {', '.join(regressions)}."
+            )
+
+    def _run(
+        self,
+        dataset: dict[str, Any],
+        selected: list[str],
+        repeat: int,
+    ) -> dict[str, Result]:
+        with (
+            override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+                # Time the work behind the responses, not cache hits.
+                API_COUNT_CACHE_TIMEOUT=0,
+                API_RESPONSE_CACHE_TIMEOUT=0,
+                API_STATS_CACHE_TIMEOUT=0,
+            ),
+            transaction.atomic(),
+        ):
+            start = time.perf_counter()
+            seed_dataset(
+                dataset["postings"],
+                candidacy_ratio=dataset["candidacy_ratio"],
+                seed=dataset["seed"],
+            )
+            self.stdout.write(
+                f"Seeded {dataset['postings']} postings "
+                f"in {time.perf_counter() - start:.1f} s."
+            )
+
+            candidacy = JobCandidacy.objects.order_by("pk").first()
+            if candidacy is None:
+                raise CommandError("The dataset has no candidacies, add postings.")
+
+            client = APIClient()
+            client.force_authenticate(
+                get_user_model().objects.create_user(username="benchmark")
+            )
+
+            scenarios = [
+                scenario
+                for scenario in build_scenarios(
+                    posting_id=str(candidacy.job_posting_id),
+                    candidacy_id=str(candidacy.pk),
+                )
+                if not selected or any(text in scenario.name for text in selected)
+            ]
+
+            if not scenarios:
+                raise CommandError("No scenario matches --scenario.")
+
+            results = {
+                scenario.name: self._measure(client, scenario, repeat)
+                for scenario in scenarios
+            }
+
+            transaction.set_rollback(True)
+
+        return results
+
+    def _measure(self, client: APIClient, scenario: Scenario, repeat: int) -> Result:
+        def request() -> None:
+            method = getattr(client, scenario.method)
+
+            if scenario.data is not None:
+                response = method(scenario.path, scenario.data, format="json")
+            else:
+                response = method(scenario.path, scenario.params)
+
+            if response.status_code >= 400:
+                raise CommandError(
+                    f"{scenario.name} answered {response.status_code}: "
+                    f"{response.content[:200]!r}"
+                )
+
+            if response.streaming:
+                b"".join(response.streaming_content)
+
+        # Untimed first run, which also counts the queries. The test client
+        # resets `connection.queries` on every request: count them with an
+        # execute wrapper instead.
+        counter = RequestTimings()
+        with connection.execute_wrapper(counter):
+            request()
+
+        timings = []
+
+        for _ in range(repeat):
+            start = time.perf_counter()
+            request()
+            timings.append(time.perf_counter() - start)
+
+        return {
+            "median_ms": round(statistics.median(timings) * 1_000, 3),
+            "queries": counter.queries,
+        }
+
+    def _report(
+        self,
+        name: str,
+        result: Result,
+        reference: Result | None,
+        options: dict[str, Any],
+    ) -> bool:
+        """Write the result of a scenario and return whether it regressed."""
+        line = f"{name}: {result['median_ms']:.2f} ms, {result['queries']:g} queries"
+
+        if reference is None:
+            self.stdout.write(line)
+            return False
+
+        delta = result["median_ms"] - reference["median_ms"]
+        slower = (
+            delta > reference["median_ms"] * options["threshold"]
+            and delta > options["min_delta_ms"]
+        )
+        more_queries = result["queries"] > reference["queries"]
+
+        line += (
+            f" (baseline {reference['median_ms']:.2f} ms, "
+            f"{reference['queries']:g} queries)"
+        )
+
+        if slower or more_queries:
+            self.stdout.write(self.style.ERROR(f"{line} REGRESSED"))
+            return True
+
+        self.stdout.write(line)
+        return False
+
+    def _read_baseline(self, path: Path) -> dict[str, Any] | None:
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            baseline: dict[str, Any] = orjson.loads(content)
+        except orjson.JSONDecodeError as exc:
+            raise CommandError(f"{path} is not valid JSON: {exc}") from exc
+
+        return baseline
+
+    def _write_baseline(self, path: Path, baseline: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(
+            orjson.dumps(baseline, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            + b"\n"
+        )
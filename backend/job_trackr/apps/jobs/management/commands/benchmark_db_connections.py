@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/benchmark_db_connections.py
+
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, cast
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import close_old_connections, connection
+from django.db.backends.postgresql.base import DatabaseWrapper
+from django.test.utils import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.jobs.postings.models import JobPosting
+
+# Database settings of each mode, over those of the default database.
+MODES: dict[str, dict[str, Any]] = {
+    "new connection": {"CONN_MAX_AGE": 0},
+    "persistent": {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True},
+    "pool": {
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {"pool": {"min_size": 1, "max_size": 1}},
+    },
+}
+
+ENDPOINTS = {
+    "postings list": "job-posting-list",
+    "candidacies list": "job-candidacy-list",
+}
+
+
+@contextmanager
+def _connection_mode(overrides: dict[str, Any]) -> Iterator[None]:
+    original = connection.settings_dict
+    connection.close()
+    connection.settings_dict = {
+        **original,
+        **overrides,
+        "OPTIONS": {**original["OPTIONS"], **overrides.get("OPTIONS", {})},
+    }
+
+    try:
+        yield
+    finally:
+        connection.close()
+        cast(DatabaseWrapper, connection).close_pool()
+        connection.settings_dict = original
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the list endpoints with a new database connection per request, "
+        "persistent connections and a psycopg connection pool, on the rows "
+        "of the database."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        repeat = options["repeat"]
+
+        if repeat <= 0:
+            raise CommandError("Repeat must be greater than 0.")
+
+        if connection.in_atomic_block:
+            raise CommandError("Cannot close connections inside a transaction.")
+
+        if not JobPosting.objects.exists():
+            raise CommandError(
+                "No job postings to benchmark, seed some with seed_demo_jobs."
+            )
+
+        client = APIClient()
+        # Never saved: the benchmark writes nothing.
+        client.force_authenticate(get_user_model()(username="benchmark"))
+
+        with override_settings(
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            # Time the work behind the responses, not cache hits.
+            API_COUNT_CACHE_TIMEOUT=0,
+            API_RESPONSE_CACHE_TIMEOUT=0,
+            API_STATS_CACHE_TIMEOUT=0,
+        ):
+            for label, url_name in ENDPOINTS.items():
+                path = reverse(url_name)
+                timings = {
+                    mode: self._measure(client, path, overrides, repeat)
+                    for mode, overrides in MODES.items()
+                }
+                self._report(label, timings)
+
+    def _measure(
+        self,
+        client: APIClient,
+        path: str,
+        overrides: dict[str, Any],
+        repeat: int,
+    ) -> float:
+        def request() -> None:
+            # The test client leaves connections open between requests:
+            # close them like the request_started and request_finished
+            # signals of a server would.
+            close_old_connections()
+            response = client.get(path)
+            close_old_connections()
+
+            if response.status_code >= 400:
+                raise CommandError(
+                    f"{path} answered {response.status_code}: "
+                    f"{response.content[:200]!r}"
+                )
+
+        with _connection_mode(overrides):
+            # Untimed first run, which opens the pool.
+            request()
+            timings = []
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                request()
+                timings.append(time.perf_counter() - start)
+
+        return statistics.median(timings) * 1_000
+
+    def _report(self, label: str, timings: dict[str, float]) -> None:
+        reference = timings["new connection"]
+        results = [f"new connection {reference:.2f} ms"] + [
+            f"{mode} {median:.2f} ms ({median - reference:+.2f} ms, "
+            f"{reference / median:.1f}x faster)"
+            for mode, median in timings.items()
+            if mode != "new connection"
+        ]
+
+        self.stdout.write(f"{label}: {', '.join(results)}")
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/benchmark_json_renderer.py
+
+import statistics
+import time
+from collections.abc import Callable
+from io import BytesIO
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.common.api.parsers import ORJSONParser
+from apps.common.api.renderers import ORJSONRenderer
+from apps.jobs.api.base_viewsets import ReadAfterWriteModelViewSet
+from apps.jobs.api.candidacies.views import JobCandidacyViewSet
+from apps.jobs.api.postings.views import JobPostingViewSet
+
+
+def _median_ms(run: Callable[[], object], repeat: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSON renderer and parser with the orjson ones on list "
+        "pages built from the first rows of the database."
+    )
+
+    viewsets: dict[str, type[ReadAfterWriteModelViewSet[Any]]] = {
+        "job postings": JobPostingViewSet,
+        "job candidacies": JobCandidacyViewSet,
+    }
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        page_size = options["page_size"]
+        repeat = options["repeat"]
+
+        if page_size <= 0:
+            raise CommandError("Page size must be greater than 0.")
+
+        if repeat <= 0:
+            raise CommandError("Repeat must be greater than 0.")
+
+        for label, viewset_class in self.viewsets.items():
+            viewset = viewset_class(action="list", kwargs={}, format_kwarg=None)
+            instances = list(viewset.get_queryset().order_by("pk")[:page_size])
+
+            if not instances:
+                raise CommandError(
+                    f"No {label} to benchmark, seed some with seed_demo_jobs."
+                )
+
+            results = viewset.list_serializer_class(instances, many=True).data
+            page = {"count": len(instances), "next": None, "results": results}
+
+            self._benchmark(label, page, repeat)
+
+    def _benchmark(self, label: str, page: dict[str, Any], repeat: int) -> None:
+        content = JSONRenderer().render(page)
+
+        if ORJSONRenderer().render(page) != content:
+            raise CommandError(f"Rendered {label} differ from JSONRenderer.")
+
+        timings = {
+            "render": (
+                _median_ms(lambda: JSONRenderer().render(page), repeat),
+                _median_ms(lambda: ORJSONRenderer().render(page), repeat),
+            ),
+            "parse": (
+                _median_ms(lambda: JSONParser().parse(BytesIO(content)), repeat),
+                _median_ms(lambda: ORJSONParser().parse(BytesIO(content)), repeat),
+            ),
+        }
+
+        for step, (reference, orjson) in timings.items():
+            self.stdout.write(
+                f"{label} {step}: {len(page['results'])} rows, "
+                f"{len(content) / 1_024:.0f} KiB, DRF {reference:.3f} ms, "
+                f"orjson {orjson:.3f} ms ({reference / orjson:.1f}x faster)"
+            )
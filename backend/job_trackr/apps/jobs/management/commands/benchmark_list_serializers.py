@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/benchmark_list_serializers.py
+
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db.models import QuerySet
+from rest_framework import serializers
+
+from apps.common.api.compiled import CompiledSerializer
+from apps.jobs.api.base_viewsets import ReadAfterWriteModelViewSet
+from apps.jobs.api.candidacies.views import JobCandidacyViewSet
+from apps.jobs.api.postings.views import JobPostingViewSet
+
+
+def _median_ms(run: Callable[[], object], repeat: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings) * 1_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the DRF list serializers of job postings and candidacies "
+        "with their compiled counterparts on the first rows of the database."
+    )
+
+    viewsets: dict[str, type[ReadAfterWriteModelViewSet[Any]]] = {
+        "job postings": JobPostingViewSet,
+        "job candidacies": JobCandidacyViewSet,
+    }
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows = options["rows"]
+        repeat = options["repeat"]
+
+        if rows <= 0:
+            raise CommandError("Rows must be greater than 0.")
+
+        if repeat <= 0:
+            raise CommandError("Repeat must be greater than 0.")
+
+        for label, viewset_class in self.viewsets.items():
+            viewset = viewset_class(action="list", kwargs={}, format_kwarg=None)
+            queryset = viewset.get_queryset().order_by("pk")[:rows]
+            serializer_class = viewset.list_serializer_class
+
+            if not queryset.exists():
+                raise CommandError(
+                    f"No {label} to benchmark, seed some with seed_demo_jobs."
+                )
+
+            self._benchmark(label, queryset, serializer_class, repeat)
+
+    def _benchmark(
+        self,
+        label: str,
+        queryset: QuerySet[Any],
+        serializer_class: type[serializers.BaseSerializer[Any]],
+        repeat: int,
+    ) -> None:
+        def serialize() -> object:
+            return serializer_class(list(queryset), many=True).data
+
+        def serialize_compiled() -> object:
+            compiled = CompiledSerializer(
+                cast(serializers.ModelSerializer[Any], serializer_class())
+            )
+            return compiled.serialize(list(compiled.values(queryset)))
+
+        if serialize() != serialize_compiled():
+            raise CommandError(f"Compiled {label} differ from the serializer.")
+
+        reference = _median_ms(serialize, repeat)
+        compiled = _median_ms(serialize_compiled, repeat)
+
+        self.stdout.write(
+            f"{label}: {queryset.count()} rows, serializer {reference:.2f} ms, "
+            f"compiled {compiled:.2f} ms ({reference / compiled:.1f}x faster)"
+        )
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/cluster_duplicate_postings.py
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.jobs.postings.dedupe import (
+    SIMILARITY_THRESHOLD,
+    cluster_duplicates,
+    index_missing_postings,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Index job postings without a MinHash signature, then print clusters "
+        "of likely duplicate postings."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=SIMILARITY_THRESHOLD,
+            help="Minimum estimated similarity of two duplicates (0 to 1).",
+        )
+        parser.add_argument(
+            "--reindex",
+            action="store_true",
+            help="Recompute the signatures of all postings.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1_000)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        threshold = options["threshold"]
+        chunk_size = options["chunk_size"]
+
+        if not 0 <= threshold <= 1:
+            raise CommandError("Threshold must be between 0 and 1.")
+
+        if chunk_size <= 0:
+            raise CommandError("Chunk size must be greater than 0.")
+
+        indexed = index_missing_postings(
+            reindex=options["reindex"],
+            chunk_size=chunk_size,
+        )
+        self.stdout.write(f"Indexed {indexed} job postings.")
+
+        clusters = cluster_duplicates(threshold=threshold)
+
+        for members in clusters:
+            self.stdout.write(" ".join(str(member) for member in members))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Found {len(clusters)} clusters covering "
+                f"{sum(map(len, clusters))} job postings."
+            )
+        )
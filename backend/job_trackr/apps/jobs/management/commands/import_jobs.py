@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/import_jobs.py
+
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import DataError
+
+from apps.jobs.activity.rollups import refresh_activity_rollups
+from apps.jobs.imports.importer import ImportResult, ImportStep, import_jobs
+from apps.jobs.imports.rules import COLUMNS
+from apps.jobs.imports.staging import ImportFileError, ImportFormat
+
+FORMATS_BY_SUFFIX = {
+    ".csv": ImportFormat.CSV,
+    ".ndjson": ImportFormat.NDJSON,
+    ".jsonl": ImportFormat.NDJSON,
+}
+
+STEP_MESSAGES = {
+    ImportStep.VALIDATE: "Validated {:,} rows.",
+    ImportStep.MERGE_POSTINGS: "Created or updated {:,} postings.",
+    ImportStep.MERGE_CANDIDACIES: "Created or updated {:,} candidacies.",
+}
+# Loading progress is written at every tenth of the file.
+PROGRESS_STEPS = 10
+
+
+class Command(BaseCommand):
+    help = (
+        "Import job postings, and optionally their candidacies, from a CSV or "
+        "NDJSON file. Postings are matched by normalized URL: existing ones "
+        f"are updated. Columns: {', '.join(COLUMNS)}."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=[choice.value for choice in ImportFormat],
+            help="Format of the file. Default: guessed from its extension.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and merge the rows, then roll everything back.",
+        )
+        parser.add_argument(
+            "--rejects",
+            type=Path,
+            help="Write every rejected row to this NDJSON file.",
+        )
+        parser.add_argument(
+            "--show-rejects",
+            type=int,
+            default=20,
+            help="Rejected rows written to the output.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = Path(options["path"])
+        file_format = self._format(path, options["format"])
+
+        try:
+            size = path.stat().st_size
+        except OSError as exc:
+            raise CommandError(f"Cannot read {path}: {exc.strerror}.") from exc
+
+        self._size = size
+        self._reported_steps = 0
+        self._start = time.perf_counter()
+        self.stdout.write(f"Importing {path} ({size / 1e6:.1f} MB).")
+
+        try:
+            with path.open("rb") as file:
+                result = import_jobs(
+                    file,
+                    file_format,
+                    dry_run=options["dry_run"],
+                    on_progress=self._progress,
+                )
+        except ImportFileError as exc:
+            raise CommandError(str(exc)) from exc
+        except DataError as exc:
+            raise CommandError(f"Cannot load {path}: {exc}".strip()) from exc
+
+        if not options["dry_run"] and (
+            result.postings_created or result.candidacies_created
+        ):
+            refresh_activity_rollups()
+
+        self._report(result, options)
+
+    def _format(self, path: Path, name: str | None) -> ImportFormat:
+        if name is not None:
+            return ImportFormat(name)
+
+        try:
+            return FORMATS_BY_SUFFIX[path.suffix.lower()]
+        except KeyError:
+            raise CommandError(
+                f"Cannot tell the format of {path.name}, use --format."
+            ) from None
+
+    def _progress(self, step: ImportStep, count: int) -> None:
+        elapsed = time.perf_counter() - self._start
+
+        if step != ImportStep.LOAD:
+            self.stdout.write(f"{STEP_MESSAGES[step].format(count)} ({elapsed:.1f} s)")
+            return
+
+        reached = count * PROGRESS_STEPS // max(self._size, 1)
+
+        if reached > self._reported_steps:
+            self._reported_steps = reached
+            self.stdout.write(
+                f"Loaded {count / 1e6:.1f} of {self._size / 1e6:.1f} MB "
+                f"({elapsed:.1f} s)."
+            )
+
+    def _report(self, result: ImportResult, options: dict[str, Any]) -> None:
+        if result.ignored_columns:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Ignored columns: {', '.join(result.ignored_columns)}."
+                )
+            )
+
+        for reject in result.rejects[: options["show_rejects"]]:
+            self.stdout.write(f"Line {reject.line}: {'; '.join(reject.errors)}")
+
+        hidden = len(result.rejects) - options["show_rejects"]
+        if hidden > 0:
+            self.stdout.write(f"... and {hidden:,} more rejected rows.")
+
+        if options["rejects"] is not None and result.rejects:
+            path = Path(options["rejects"])
+            with path.open("wb") as file:
+                for reject in result.rejects:
+                    file.write(orjson.dumps(reject._asdict()) + b"\n")
+            self.stdout.write(f"Rejected rows written to {path}.")
+
+        self.stdout.write(
+            f"Postings: {result.postings_created:,} created, "
+            f"{result.postings_updated:,} updated, "
+            f"{result.postings_unchanged:,} unchanged. "
+            f"Candidacies: {result.candidacies_created:,} created, "
+            f"{result.candidacies_updated:,} updated."
+        )
+
+        message = (
+            f"Imported {result.rows - len(result.rejects):,} of {result.rows:,} rows, "
+            f"{len(result.rejects):,} rejected, in {result.duration:.1f} s "
+            f"({result.rows / result.duration:,.0f} rows/s)."
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run, rolled back. {message}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(message))
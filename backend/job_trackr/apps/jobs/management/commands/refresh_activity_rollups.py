@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/management/commands/refresh_activity_rollups.py
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.jobs.activity.rollups import VIEW_NAME, refresh_activity_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the per-day and per-week activity rollups of job postings "
+        "and candidacies, without blocking readers."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--blocking",
+            action="store_true",
+            help=(
+                "Refresh without CONCURRENTLY: faster, but readers wait until "
+                "the refresh ends."
+            ),
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        start = time.perf_counter()
+        refresh_activity_rollups(concurrently=not options["blocking"])
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed {VIEW_NAME} in {elapsed:.2f} s.")
+        )
@@ -5,29 +5,33 @@ from typing import Any
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import IntegrityError
+
+from apps.jobs.activity.rollups import refresh_activity_rollups
+from apps.jobs.demo_data.bulk import SeedResult, seed_jobs
 
 
 class Command(BaseCommand):
-    help = "Seed demo job postings and candidacies."
+    help = (
+        "Seed demo job postings and candidacies. The same --seed always "
+        "produces the same rows."
+    )
 
     def add_arguments(self, parser: CommandParser) -> None:
         parser.add_argument("--postings", type=int, default=50)
         parser.add_argument("--candidacies", type=int, default=25)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes generating the rows.",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         if not settings.DEBUG:
             raise CommandError("This command can only be run with DEBUG=True.")
 
-        try:
-            from apps.jobs.demo_data.job_candidacy import DemoJobCandidacyFactory
-            from apps.jobs.demo_data.job_posting import DemoJobPostingFactory
-        except ImportError as exc:
-            raise CommandError(
-                "The seed_demo_jobs command requires test dependencies. "
-                "Install test dependencies before running this command, "
-                "e.g. with the test dependency group."
-            ) from exc
-
         postings_count = options["postings"]
         candidacies_count = options["candidacies"]
 
@@ -42,13 +46,34 @@ class Command(BaseCommand):
                 "Candidacies count cannot be greater than postings count."
             )
 
-        postings = DemoJobPostingFactory.create_batch(postings_count)
+        if options["workers"] <= 0:
+            raise CommandError("Workers must be greater than 0.")
+
+        try:
+            result = seed_jobs(
+                postings_count,
+                candidacies_count,
+                seed=options["seed"],
+                workers=options["workers"],
+                on_chunk=self._progress if options["verbosity"] >= 2 else None,
+            )
+        except IntegrityError as exc:
+            raise CommandError(
+                f"Postings of seed {options['seed']} already exist, use another --seed."
+            ) from exc
 
-        for posting in postings[:candidacies_count]:
-            DemoJobCandidacyFactory(job_posting=posting)
+        refresh_activity_rollups()
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Created {len(postings)} job postings and {candidacies_count} candidacies."
+                f"Created {result.postings} job postings, {result.candidacies} "
+                f"candidacies and {result.status_events} status events "
+                f"in {result.duration:.1f} s "
+                f"({result.rows / result.duration:,.0f} rows/s)."
             )
         )
+
+    def _progress(self, result: SeedResult) -> None:
+        self.stdout.write(
+            f"{result.postings} postings written ({result.duration:.1f} s)."
+        )
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/migrations/0006_add_search_vectors.py
+
+# Generated by Django 6.1.2 on 2026-10-18 11:55
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_rename_posted_at_field_posted_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobcandidacy',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.SearchVector('notes', config='simple', weight='D'), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.CombinedSearchVector(django.contrib.postgres.search.SearchVector('title', config='simple', weight='A'), '||', django.contrib.postgres.search.SearchVector('company', config='simple', weight='B'), django.contrib.postgres.search.SearchConfig('simple')), '||', django.contrib.postgres.search.SearchVector('location', config='simple', weight='C'), django.contrib.postgres.search.SearchConfig('simple')), '||', django.contrib.postgres.search.SearchVector('description', config='simple', weight='D'), django.contrib.postgres.search.SearchConfig('simple')), output_field=django.contrib.postgres.search.SearchVectorField()),
+        ),
+        migrations.AddIndex(
+            model_name='jobcandidacy',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='idx_job_cand_search'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='idx_job_post_search'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/migrations/0008_add_default_ordering_indexes.py
+
+# Generated by Django 6.1.2 on 2026-10-18 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_add_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobcandidacy',
+            index=models.Index(fields=['-applied_on', '-created_at', 'id'], name='idx_job_cand_default_order'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['-posted_on', '-created_at', 'id'], name='idx_job_post_default_order'),
+        ),
+    ]
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/migrations/0009_add_normalized_posting_fields.py
+
+# Generated by Django 6.1.2 on 2026-10-18 12:13
+
+import re
+import unicodedata
+from urllib.parse import urlparse, urlunparse
+
+from django.db import migrations, models
+
+# Frozen copies of the normalization rules in force when this migration was
+# written (apps.common.normalization), so that later changes to those rules
+# do not change what it does.
+
+
+def normalize_text(value):
+    value = value.strip().lower()
+    value = unicodedata.normalize("NFKD", value)
+    value = value.encode("ascii", "ignore").decode("ascii")
+    value = re.sub(r"\s+", " ", value)
+    return re.sub(r"[^\w\s+#./&-]", "", value)
+
+
+def normalize_url(value):
+    value = value.strip()
+    if not value:
+        return None
+
+    parsed = urlparse(value)
+    return urlunparse(
+        parsed._replace(
+            scheme=parsed.scheme.lower(),
+            netloc=parsed.netloc.lower(),
+            path=parsed.path.rstrip("/"),
+        )
+    )
+
+
+def backfill(apps, schema_editor, chunk_size=1_000):
+    """
+    Normalize every posting in primary key (creation) order. When several
+    postings normalize to the same URL, the oldest keeps it and the others
+    get a NULL `normalized_url`, as the column is unique.
+    """
+    JobPosting = apps.get_model("jobs", "JobPosting")
+    fields = ["normalized_title", "normalized_company", "normalized_url"]
+    last_pk = None
+
+    while True:
+        queryset = JobPosting.objects.order_by("pk").only(
+            "pk", "title", "company", "url", *fields
+        )
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+
+        chunk = list(queryset[:chunk_size])
+        if not chunk:
+            return
+
+        last_pk = chunk[-1].pk
+
+        for posting in chunk:
+            posting.normalized_title = normalize_text(posting.title)
+            posting.normalized_company = normalize_text(posting.company)
+            posting.normalized_url = normalize_url(posting.url)
+
+        # Only rows of earlier chunks have a normalized URL yet.
+        taken = set(
+            JobPosting.objects.filter(
+                normalized_url__in={posting.normalized_url for posting in chunk}
+            )
+            .exclude(pk__in=[posting.pk for posting in chunk])
+            .values_list("normalized_url", flat=True)
+        )
+
+        for posting in chunk:
+            if posting.normalized_url in taken:
+                posting.normalized_url = None
+            elif posting.normalized_url:
+                taken.add(posting.normalized_url)
+
+        JobPosting.objects.bulk_update(chunk, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_add_default_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobposting',
+            name='normalized_company',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='normalized_title',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='jobposting',
+            name='normalized_url',
+            field=models.CharField(blank=True, editable=False, max_length=2000, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['normalized_title'], name='idx_job_post_norm_title'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['normalized_company'], name='idx_job_post_norm_company'),
+        ),
+    ]
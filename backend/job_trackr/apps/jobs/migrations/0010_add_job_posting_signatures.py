@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/migrations/0010_add_job_posting_signatures.py
+
+# Generated by Django 6.1.2 on 2026-10-18 12:19
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_add_normalized_posting_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobPostingSignature',
+            fields=[
+                ('job_posting', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='jobs.jobposting')),
+                ('minhash', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField())),
+                ('buckets', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField())),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'job_posting_signature',
+                'indexes': [django.contrib.postgres.indexes.GinIndex(fields=['buckets'], name='idx_job_post_sig_buckets')],
+            },
+        ),
+    ]
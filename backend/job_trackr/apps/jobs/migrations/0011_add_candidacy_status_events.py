@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/migrations/0011_add_candidacy_status_events.py
+
+# Generated by Django 6.1.2 on 2026-10-18 12:44
+
+from itertools import batched
+
+import apps.common.uuid
+import django.db.models.deletion
+from django.db import migrations, models
+
+from apps.common.uuid import uuid7_default
+
+
+def backfill(apps, schema_editor):
+    """
+    Start the history of existing candidacies with their current status,
+    dated from their last update: earlier transitions were not recorded.
+    """
+    JobCandidacy = apps.get_model("jobs", "JobCandidacy")
+    CandidacyStatusEvent = apps.get_model("jobs", "CandidacyStatusEvent")
+
+    rows = JobCandidacy.objects.order_by().values_list("pk", "status", "updated_at")
+
+    for chunk in batched(rows.iterator(chunk_size=1_000), 1_000):
+        CandidacyStatusEvent.objects.bulk_create(
+            CandidacyStatusEvent(
+                id=uuid7_default(),
+                candidacy_id=pk,
+                status=status,
+                occurred_at=updated_at,
+            )
+            for pk, status, updated_at in chunk
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_add_job_posting_signatures'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CandidacyStatusEvent',
+            fields=[
+                ('id', models.UUIDField(default=apps.common.uuid.uuid7_default, editable=False, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('applied', 'Applied'), ('interview', 'Interview'), ('technical_test', 'Technical test'), ('offer', 'Offer'), ('rejected', 'Rejected'), ('withdrawn', 'Withdrawn')], max_length=50)),
+                ('occurred_at', models.DateTimeField()),
+                ('candidacy', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='jobs.jobcandidacy')),
+            ],
+            options={
+                'verbose_name': 'candidacy status event',
+                'verbose_name_plural': 'candidacy status events',
+                'db_table': 'job_candidacy_status_event',
+                'ordering': ['occurred_at', 'id'],
+                'indexes': [models.Index(fields=['candidacy', 'occurred_at'], name='idx_cand_event_cand_at'), models.Index(fields=['status', 'occurred_at'], name='idx_cand_event_status_at')],
+            },
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/migrations/0012_add_job_activity_rollups.py
+
+# Generated by Django 6.1.2 on 2026-10-18 12:49
+
+from django.db import migrations, models
+
+CREATE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW job_activity_rollup AS
+WITH activity AS (
+    SELECT
+        'posted' AS kind,
+        posted_on AS day,
+        platform,
+        '' AS status
+    FROM job_posting
+    WHERE posted_on IS NOT NULL
+    UNION ALL
+    SELECT
+        'applied',
+        candidacy.applied_on,
+        posting.platform,
+        candidacy.status
+    FROM job_candidacy AS candidacy
+    JOIN job_posting AS posting ON posting.id = candidacy.job_posting_id
+),
+dated AS (
+    SELECT *, date_trunc('week', day)::date AS week FROM activity
+)
+SELECT
+    CASE WHEN GROUPING(day) = 0 THEN 'day' ELSE 'week' END::varchar(10)
+        AS period,
+    COALESCE(day, week) AS period_start,
+    kind::varchar(10) AS kind,
+    platform::varchar(50) AS platform,
+    status::varchar(50) AS status,
+    COUNT(*) AS count
+FROM dated
+GROUP BY GROUPING SETS (
+    (kind, day, platform, status),
+    (kind, week, platform, status)
+)
+WITH DATA;
+
+-- Required by REFRESH ... CONCURRENTLY, and serves range reads by period.
+CREATE UNIQUE INDEX idx_job_activity_rollup
+    ON job_activity_rollup (period, period_start, kind, platform, status);
+"""
+
+DROP_VIEW_SQL = "DROP MATERIALIZED VIEW IF EXISTS job_activity_rollup;"
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_add_candidacy_status_events'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_VIEW_SQL, DROP_VIEW_SQL),
+        migrations.CreateModel(
+            name='JobActivityRollup',
+            fields=[
+                ('pk', models.CompositePrimaryKey('period', 'period_start', 'kind', 'platform', 'status', blank=True, editable=False, primary_key=True, serialize=False)),
+                ('period', models.CharField(choices=[('day', 'Day'), ('week', 'Week')], max_length=10)),
+                ('period_start', models.DateField()),
+                ('kind', models.CharField(choices=[('posted', 'Posted'), ('applied', 'Applied')], max_length=10)),
+                ('platform', models.CharField(blank=True, choices=[('linkedin', 'LinkedIn'), ('indeed', 'Indeed'), ('wttj', 'Welcome to the jungle'), ('career_page', 'Career page')], max_length=50)),
+                ('status', models.CharField(blank=True, choices=[('applied', 'Applied'), ('interview', 'Interview'), ('technical_test', 'Technical test'), ('offer', 'Offer'), ('rejected', 'Rejected'), ('withdrawn', 'Withdrawn')], max_length=50)),
+                ('count', models.BigIntegerField()),
+            ],
+            options={
+                'verbose_name': 'job activity rollup',
+                'db_table': 'job_activity_rollup',
+                'ordering': ['period', 'period_start', 'kind', 'platform', 'status'],
+                'managed': False,
+            },
+        ),
+    ]
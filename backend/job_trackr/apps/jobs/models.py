@@ -13,10 +13,17 @@ This allows internal refactoring of the domain structure without breaking
 external imports (e.g., FKs, services, tests).
 """
 
-from apps.jobs.candidacies.models import JobCandidacy  # noqa: F401
-from apps.jobs.postings.models import JobPosting  # noqa: F401
+from apps.jobs.activity.models import JobActivityRollup  # noqa: F401
+from apps.jobs.candidacies.models import (  # noqa: F401
+    CandidacyStatusEvent,
+    JobCandidacy,
+)
+from apps.jobs.postings.models import JobPosting, JobPostingSignature  # noqa: F401
 
 __all__ = [
     "JobPosting",
+    "JobPostingSignature",
     "JobCandidacy",
+    "CandidacyStatusEvent",
+    "JobActivityRollup",
 ]
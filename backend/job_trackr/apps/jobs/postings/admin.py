@@ -44,6 +44,9 @@ class JobPostingAdmin(admin.ModelAdmin[JobPosting]):
 
     readonly_fields = (
         "id",
+        "normalized_title",
+        "normalized_company",
+        "normalized_url",
         "created_at",
         "updated_at",
     )
@@ -87,6 +90,9 @@ class JobPostingAdmin(admin.ModelAdmin[JobPosting]):
             {
                 "fields": (
                     "id",
+                    "normalized_title",
+                    "normalized_company",
+                    "normalized_url",
                     "created_at",
                     "updated_at",
                 ),
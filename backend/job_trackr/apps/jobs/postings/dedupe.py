@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/postings/dedupe.py
+
+"""
+Near-duplicate detection of job postings.
+
+The same job is often published on several platforms with slightly
+different titles and descriptions. Each posting gets a MinHash signature of
+the word shingles of its normalized title, company and description, stored
+with its LSH buckets in `JobPostingSignature`. Finding the duplicates of a
+posting is a GIN lookup of the postings sharing a bucket, followed by a
+signature comparison of those few candidates.
+
+Computing a signature costs far more than writing the posting, so writes
+never do it. New postings have no signature, and writes that may change the
+text of a posting delete its signature (see apps.jobs.signals).
+`cluster_duplicate_postings` indexes postings that have no signature, in
+chunks, and groups the whole table into clusters; run it periodically.
+`find_duplicates` computes the signature of an unindexed posting on the fly.
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import batched
+from typing import NamedTuple
+from uuid import UUID
+
+from django.db import connection
+
+from apps.common import minhash
+from apps.common.normalization import normalize_text
+from apps.jobs.postings.models import JobPosting, JobPostingSignature
+
+# Fields the signature is computed from.
+SOURCE_FIELDS = ("title", "company", "description")
+
+# Estimated Jaccard similarity from which postings are likely duplicates.
+SIMILARITY_THRESHOLD = 0.5
+
+
+class Duplicate(NamedTuple):
+    job_posting_id: UUID
+    similarity: float
+
+
+def posting_shingles(posting: JobPosting) -> set[str]:
+    text = " ".join(
+        value
+        for value in (
+            normalize_text(getattr(posting, field)) for field in SOURCE_FIELDS
+        )
+        if value
+    )
+
+    return minhash.shingles(text)
+
+
+def build_signature(posting: JobPosting) -> JobPostingSignature | None:
+    values = minhash.signature(posting_shingles(posting))
+
+    if values is None:
+        return None
+
+    return JobPostingSignature(
+        job_posting=posting,
+        minhash=values,
+        buckets=minhash.lsh_buckets(values),
+    )
+
+
+def index_postings(postings: Iterable[JobPosting]) -> int:
+    """Create or replace the signatures of `postings` in one query."""
+    signatures = [
+        signature
+        for signature in map(build_signature, postings)
+        if signature is not None
+    ]
+
+    JobPostingSignature.objects.bulk_create(
+        signatures,
+        update_conflicts=True,
+        unique_fields=["job_posting"],
+        update_fields=["minhash", "buckets", "updated_at"],
+    )
+
+    return len(signatures)
+
+
+def drop_signatures(job_posting_ids: Iterable[UUID]) -> None:
+    """Delete the signatures of postings whose text may have changed."""
+    JobPostingSignature.objects.filter(
+        job_posting_id__in=list(job_posting_ids)
+    ).delete()
+
+
+def index_missing_postings(*, reindex: bool = False, chunk_size: int = 1_000) -> int:
+    """Index postings without a signature, or all postings with `reindex`."""
+    queryset = JobPosting.objects.order_by().only("pk", *SOURCE_FIELDS)
+
+    if not reindex:
+        queryset = queryset.filter(signature__isnull=True)
+
+    return sum(
+        index_postings(chunk)
+        for chunk in batched(queryset.iterator(chunk_size=chunk_size), chunk_size)
+    )
+
+
+def find_duplicates(
+    posting: JobPosting,
+    *,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> list[Duplicate]:
+    """Likely duplicates of `posting`, most similar first."""
+    signature = JobPostingSignature.objects.filter(job_posting=posting).first()
+
+    if signature is None:
+        signature = build_signature(posting)
+        if signature is None:
+            return []
+
+    candidates = (
+        JobPostingSignature.objects.filter(buckets__overlap=signature.buckets)
+        .exclude(job_posting=posting)
+        .values_list("job_posting_id", "minhash")
+    )
+
+    duplicates = [
+        Duplicate(job_posting_id, minhash.similarity(signature.minhash, values))
+        for job_posting_id, values in candidates
+    ]
+
+    return sorted(
+        (duplicate for duplicate in duplicates if duplicate.similarity >= threshold),
+        key=lambda duplicate: (-duplicate.similarity, duplicate.job_posting_id),
+    )
+
+
+def _bucket_groups() -> Iterator[list[UUID]]:
+    """Postings sharing each LSH bucket, for buckets with several postings."""
+    table = JobPostingSignature._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT array_agg(job_posting_id)
+            FROM {table}, unnest(buckets) AS bucket
+            GROUP BY bucket
+            HAVING count(*) > 1
+            """
+        )
+        for (group,) in cursor:
+            yield group
+
+
+def cluster_duplicates(
+    *,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> list[list[UUID]]:
+    """
+    Group all indexed postings into clusters of likely duplicates.
+
+    Candidate pairs come from shared buckets and are kept when their
+    estimated similarity reaches `threshold`; clusters are the connected
+    components of those pairs. Only signatures of postings that share a
+    bucket are loaded. Clusters are sorted by size, then by their oldest
+    posting, and their members by creation order (uuid7).
+    """
+    groups = list(_bucket_groups())
+    candidate_ids = {job_posting_id for group in groups for job_posting_id in group}
+
+    signatures = dict(
+        JobPostingSignature.objects.filter(job_posting_id__in=candidate_ids)
+        .values_list("job_posting_id", "minhash")
+        .iterator(chunk_size=2_000)
+    )
+
+    parents = {job_posting_id: job_posting_id for job_posting_id in candidate_ids}
+
+    def find(job_posting_id: UUID) -> UUID:
+        while parents[job_posting_id] != job_posting_id:
+            parents[job_posting_id] = parents[parents[job_posting_id]]
+            job_posting_id = parents[job_posting_id]
+        return job_posting_id
+
+    for group in groups:
+        for i, left in enumerate(group):
+            for right in group[i + 1 :]:
+                left_root, right_root = find(left), find(right)
+                if left_root == right_root:
+                    continue
+
+                score = minhash.similarity(signatures[left], signatures[right])
+                if score >= threshold:
+                    parents[max(left_root, right_root)] = min(left_root, right_root)
+
+    clusters: dict[UUID, list[UUID]] = {}
+    for job_posting_id in candidate_ids:
+        clusters.setdefault(find(job_posting_id), []).append(job_posting_id)
+
+    return sorted(
+        (sorted(members) for members in clusters.values() if len(members) > 1),
+        key=lambda members: (-len(members), members[0]),
+    )
@@ -1,10 +1,24 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/postings/models.py
 
+from collections.abc import Collection
+from typing import Any
+
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Upper
 
+from apps.common.normalization import normalize_url
+from apps.common.search import weighted_search_vector
 from apps.common.uuid import uuid7_default
 from apps.jobs.postings.choices import EmploymentType, Platforms, WorkMode
+from apps.jobs.postings.normalization import (
+    apply_normalization,
+    with_normalized_fields,
+)
 
 
 class JobPosting(models.Model):
@@ -41,9 +55,40 @@ class JobPosting(models.Model):
         blank=True,
     )
 
+    # Derived from title, company and url on every save, see
+    # apps.jobs.postings.normalization. Bulk writes must call
+    # `apply_normalization` themselves.
+    normalized_title = models.CharField(max_length=255, blank=True, editable=False)
+    normalized_company = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+    )
+    # NULL rather than "" when the posting has no URL, so that the unique
+    # index ignores it and can serve as an `ON CONFLICT` target.
+    normalized_url = models.CharField(
+        max_length=2000,
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Maintained by PostgreSQL on every write; never assigned from Python.
+    search_vector = models.GeneratedField(
+        expression=weighted_search_vector(
+            ("title", "A"),
+            ("company", "B"),
+            ("location", "C"),
+            ("description", "D"),
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         db_table = "job_posting"
         ordering = ["-posted_on", "-created_at"]
@@ -52,11 +97,112 @@ class JobPosting(models.Model):
             models.Index(fields=["easy_apply"], name="idx_job_post_easy"),
             models.Index(fields=["active_hiring"], name="idx_job_post_active"),
             models.Index(fields=["posted_on"], name="idx_job_post_posted"),
+            # Matches the default ordering plus the primary key tie-breaker
+            # used by keyset pagination, so each page is a single index seek.
+            models.Index(
+                fields=["-posted_on", "-created_at", "id"],
+                name="idx_job_post_default_order",
+            ),
             # Note: `company` is filtered using `icontains` (ILIKE '%...%'),
             # so this btree index is not used for that query pattern.
             # It is kept for potential exact/prefix queries and general use.
             models.Index(fields=["company"], name="idx_job_post_company"),
+            # Trigram indexes backing the `icontains` filters of
+            # JobPostingFilter. On PostgreSQL, Django compiles `icontains` to
+            # `UPPER(col::text) LIKE UPPER('%...%')`, so the indexed expression
+            # must be `UPPER(col)` for the planner to match it.
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="idx_job_post_title_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("company"), name="gin_trgm_ops"),
+                name="idx_job_post_company_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("location"), name="gin_trgm_ops"),
+                name="idx_job_post_location_trgm",
+            ),
+            GinIndex(fields=["search_vector"], name="idx_job_post_search"),
+            models.Index(
+                fields=["normalized_title"],
+                name="idx_job_post_norm_title",
+            ),
+            models.Index(
+                fields=["normalized_company"],
+                name="idx_job_post_norm_company",
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.title} at {self.company}"
+
+    def validate_unique(self, exclude: Collection[str] | None = None) -> None:
+        """
+        Check the uniqueness of `normalized_url` from the current `url`.
+
+        Forms exclude non-editable fields from unique checks, and the stored
+        value may be stale until `save()`, so clashes are reported on `url`.
+        """
+        exclude = {*(exclude or ()), "normalized_url"}
+        errors: dict[str, list[ValidationError]] = {}
+
+        try:
+            super().validate_unique(exclude=exclude)
+        except ValidationError as exc:
+            errors = exc.update_error_dict(errors)
+
+        normalized_url = normalize_url(self.url)
+        if "url" not in exclude and normalized_url is not None:
+            duplicates = JobPosting.objects.filter(normalized_url=normalized_url)
+            if duplicates.exclude(pk=self.pk).exists():
+                errors.setdefault("url", []).append(
+                    ValidationError(
+                        "A job posting with this URL already exists.",
+                        code="unique",
+                    )
+                )
+
+        if errors:
+            raise ValidationError(errors)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        apply_normalization(self)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = with_normalized_fields(update_fields)
+
+        super().save(*args, **kwargs)
+
+
+class JobPostingSignature(models.Model):
+    """
+    MinHash signature and LSH buckets of a posting, see
+    apps.jobs.postings.dedupe.
+
+    Kept out of `job_posting` so that list queries do not read ~1 KB of
+    signature per row.
+    """
+
+    job_posting = models.OneToOneField(
+        JobPosting,
+        primary_key=True,
+        related_name="signature",
+        on_delete=models.CASCADE,
+    )
+
+    minhash = ArrayField(models.BigIntegerField())
+    buckets = ArrayField(models.BigIntegerField())
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "job_posting_signature"
+        indexes = [
+            # Serves `buckets && ARRAY[...]` candidate lookups.
+            GinIndex(fields=["buckets"], name="idx_job_post_sig_buckets"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Signature of {self.job_posting_id}"
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/postings/normalization.py
+
+"""
+Persisted normalized columns of `JobPosting`.
+
+`normalized_title`, `normalized_company` and `normalized_url` mirror their
+source fields through `apps.common.normalization`, so duplicate lookups and
+exact matches are index probes instead of Python passes over every row.
+Empty values are stored as "", or NULL for nullable columns.
+"""
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.db.models import Model
+
+from apps.common.normalization import normalize_text, normalize_url
+
+# normalized field -> (source field, normalizer)
+NORMALIZED_FIELDS: dict[str, tuple[str, Callable[[str | None], str | None]]] = {
+    "normalized_title": ("title", normalize_text),
+    "normalized_company": ("company", normalize_text),
+    "normalized_url": ("url", normalize_url),
+}
+
+
+def apply_normalization(posting: Any) -> None:
+    """Set the normalized fields of `posting` from its source fields."""
+    for normalized_field, (source_field, normalizer) in NORMALIZED_FIELDS.items():
+        value = normalizer(getattr(posting, source_field))
+        setattr(posting, normalized_field, value or _empty(posting, normalized_field))
+
+
+def _empty(posting: Any, field_name: str) -> str | None:
+    # Looked up on the instance's model, which may be a historical model in
+    # data migrations.
+    return None if posting._meta.get_field(field_name).null else ""
+
+
+def with_normalized_fields(update_fields: Iterable[str]) -> set[str]:
+    """Extend `update_fields` with the normalized fields of updated sources."""
+    fields = set(update_fields)
+
+    for normalized_field, (source_field, _normalizer) in NORMALIZED_FIELDS.items():
+        if source_field in fields:
+            fields.add(normalized_field)
+
+    return fields
+
+
+def backfill_normalized_fields(
+    model: type[Model],
+    *,
+    chunk_size: int = 1_000,
+    on_chunk: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Recompute the normalized fields of every posting, `chunk_size` rows at a
+    time, and return the number of updated rows.
+
+    `model` is a parameter so data migrations can pass their historical model.
+
+    Rows are walked in primary key order, i.e. creation order for uuid7
+    keys. When several postings normalize to the same URL, the oldest keeps
+    it and the others get an empty `normalized_url`, as the column is unique.
+    """
+    manager = model._default_manager
+    fields = [source for source, _normalizer in NORMALIZED_FIELDS.values()]
+    updated = 0
+    last_pk = None
+
+    while True:
+        queryset = manager.order_by("pk").only("pk", *fields, *NORMALIZED_FIELDS)
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+
+        chunk = list(queryset[:chunk_size])
+        if not chunk:
+            return updated
+
+        last_pk = chunk[-1].pk
+        previous = {
+            posting.pk: [getattr(posting, field) for field in NORMALIZED_FIELDS]
+            for posting in chunk
+        }
+
+        for posting in chunk:
+            apply_normalization(posting)
+
+        _release_duplicate_urls(manager, chunk)
+
+        changed = [
+            posting
+            for posting in chunk
+            if previous[posting.pk]
+            != [getattr(posting, field) for field in NORMALIZED_FIELDS]
+        ]
+        manager.bulk_update(changed, list(NORMALIZED_FIELDS))
+        updated += len(changed)
+
+        if on_chunk is not None:
+            on_chunk(len(changed))
+
+
+def _release_duplicate_urls(manager: Any, chunk: list[Any]) -> None:
+    """
+    Give each normalized URL of `chunk` to its oldest posting.
+
+    Rows before the chunk are already up to date, so their URLs are taken.
+    Rows from the chunk on may still hold URLs from a previous run: those
+    holding a URL that moves to another posting here are cleared first, and
+    renormalized with their own chunk.
+    """
+    first_pk = chunk[0].pk
+    urls = {posting.normalized_url for posting in chunk if posting.normalized_url}
+
+    taken = set(
+        manager.filter(pk__lt=first_pk, normalized_url__in=urls).values_list(
+            "normalized_url", flat=True
+        )
+    )
+
+    for posting in chunk:
+        if not posting.normalized_url:
+            continue
+
+        if posting.normalized_url in taken:
+            posting.normalized_url = _empty(posting, "normalized_url")
+        else:
+            taken.add(posting.normalized_url)
+
+    owners = {
+        posting.normalized_url: posting.pk
+        for posting in chunk
+        if posting.normalized_url
+    }
+    stale_pks = [
+        pk
+        for pk, url in manager.filter(
+            pk__gte=first_pk, normalized_url__in=owners
+        ).values_list("pk", "normalized_url")
+        if owners[url] != pk
+    ]
+    if stale_pks:
+        manager.filter(pk__in=stale_pks).update(
+            normalized_url=_empty(chunk[0], "normalized_url")
+        )
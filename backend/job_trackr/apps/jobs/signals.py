@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/signals.py
+
+from typing import Any
+
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.common.cache import bump_model_version
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.postings.dedupe import SOURCE_FIELDS, drop_signatures
+from apps.jobs.postings.models import JobPosting
+
+
+@receiver(post_save, sender=JobPosting)
+@receiver(post_delete, sender=JobPosting)
+@receiver(post_save, sender=JobCandidacy)
+@receiver(post_delete, sender=JobCandidacy)
+def bump_cache_version_on_write(
+    sender: type[Model],
+    using: str,
+    **kwargs: Any,
+) -> None:
+    bump_model_version(sender, using=using)
+
+
+@receiver(post_save, sender=JobPosting)
+def drop_stale_posting_signature(
+    sender: type[JobPosting],
+    instance: JobPosting,
+    created: bool,
+    update_fields: frozenset[str] | None = None,
+    **kwargs: Any,
+) -> None:
+    # New postings have no signature yet. Both are left to
+    # `cluster_duplicate_postings`, see apps.jobs.postings.dedupe.
+    if created:
+        return
+
+    if update_fields is not None and not update_fields & set(SOURCE_FIELDS):
+        return
+
+    drop_signatures([instance.pk])
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/stats.py
+
+"""
+Dashboard statistics of job candidacies.
+
+Counts by status, by platform, work mode and employment type of the job
+posting, and by ISO week of application all come from one statement:
+`GROUPING SETS` aggregates each dimension (and the grand total) in a
+single pass over the joined tables, and `FILTER` aggregates break every
+bucket down by candidacy status.
+
+Buckets list every choice of their dimension, empty or not, in the
+choices' order; values outside the choices (e.g. a blank platform) follow.
+Weeks only list those with applications.
+"""
+
+from datetime import date, datetime
+from typing import Any
+
+from django.db import connection, models
+
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.postings.choices import EmploymentType, Platforms, WorkMode
+from apps.jobs.postings.models import JobPosting
+
+# Dimension name, grouped SQL expression and choices (None for weeks).
+DIMENSIONS: list[tuple[str, str, type[models.TextChoices] | None]] = [
+    ("status", "candidacy.status", CandidacyStatus),
+    ("platform", "posting.platform", Platforms),
+    ("work_mode", "posting.work_mode", WorkMode),
+    ("employment_type", "posting.employment_type", EmploymentType),
+    ("week", "date_trunc('week', candidacy.applied_on)::date", None),
+]
+
+
+def _statuses(counts: dict[str, int]) -> dict[str, int]:
+    return {status: counts.get(status, 0) for status in CandidacyStatus.values}
+
+
+def _choice_buckets(
+    choices: type[models.TextChoices],
+    rows: dict[Any, dict[str, Any]],
+    *,
+    with_statuses: bool,
+) -> list[dict[str, Any]]:
+    labels = dict(choices.choices)
+    values = [*labels, *sorted(set(rows) - set(labels))]
+
+    buckets = []
+    for value in values:
+        row = rows.get(value, {"count": 0, "statuses": {}})
+        bucket: dict[str, Any] = {
+            "value": value,
+            "label": str(labels.get(value, value)),
+            "count": row["count"],
+        }
+        if with_statuses:
+            bucket["statuses"] = _statuses(row["statuses"])
+        buckets.append(bucket)
+
+    return buckets
+
+
+def _week_buckets(rows: dict[date, dict[str, Any]]) -> list[dict[str, Any]]:
+    buckets = []
+
+    for start in sorted(rows):
+        year, week, _ = start.isocalendar()
+        buckets.append(
+            {
+                "week": f"{year}-W{week:02d}",
+                "start": start,
+                "count": rows[start]["count"],
+                "statuses": _statuses(rows[start]["statuses"]),
+            }
+        )
+
+    return buckets
+
+
+def job_stats() -> dict[str, Any]:
+    """Candidacy counts by dimension, and when the data last changed."""
+    statuses = CandidacyStatus.values
+    status_counts = ", ".join(
+        "COUNT(*) FILTER (WHERE candidacy.status = %s)" for _ in statuses
+    )
+    expressions = [expression for _, expression, _ in DIMENSIONS]
+    grouping_sets = ", ".join(f"({expression})" for expression in expressions)
+    # One GROUPING() per dimension: 0 when the row groups by it.
+    groupings = ", ".join(f"GROUPING({expression})" for expression in expressions)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT
+                {groupings},
+                {", ".join(expressions)},
+                COUNT(*),
+                {status_counts},
+                MAX(GREATEST(candidacy.updated_at, posting.updated_at))
+            FROM {JobCandidacy._meta.db_table} AS candidacy
+            JOIN {JobPosting._meta.db_table} AS posting
+                ON posting.id = candidacy.job_posting_id
+            GROUP BY GROUPING SETS ({grouping_sets}, ())
+            """,
+            statuses,
+        )
+        rows = cursor.fetchall()
+
+    size = len(DIMENSIONS)
+    dimensions: dict[str, dict[Any, dict[str, Any]]] = {
+        name: {} for name, _, _ in DIMENSIONS
+    }
+    total: dict[str, Any] = {"count": 0, "statuses": {}}
+    updated_at: datetime | None = None
+
+    for row in rows:
+        flags = row[:size]
+        keys = row[size : 2 * size]
+        count = row[2 * size]
+        counts = dict(zip(statuses, row[2 * size + 1 : -1], strict=True))
+        entry = {"count": count, "statuses": counts}
+
+        if all(flags):
+            total = entry
+            updated_at = row[-1]
+            continue
+
+        index = flags.index(0)
+        dimensions[DIMENSIONS[index][0]][keys[index]] = entry
+
+    stats: dict[str, Any] = {
+        "count": total["count"],
+        "statuses": _statuses(total["statuses"]),
+        "updated_at": updated_at,
+    }
+
+    for name, _, choices in DIMENSIONS:
+        if choices is None:
+            stats[f"by_{name}"] = _week_buckets(dimensions[name])
+        else:
+            stats[f"by_{name}"] = _choice_buckets(
+                choices,
+                dimensions[name],
+                # Status buckets would only repeat their own count.
+                with_statuses=choices is not CandidacyStatus,
+            )
+
+    return stats
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/activity/test_job_activity_rollups.py
+
+from datetime import date
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.jobs.activity.choices import ActivityPeriod
+from apps.jobs.activity.models import JobActivityRollup
+from apps.jobs.activity.rollups import activity_history, refresh_activity_rollups
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def activity():
+    # Monday and Sunday of ISO week 10, then Monday of week 11.
+    JobCandidacyFactory(
+        status=CandidacyStatus.APPLIED,
+        applied_on=date(2026, 3, 2),
+        job_posting__platform="linkedin",
+        job_posting__posted_on=date(2026, 3, 2),
+    )
+    JobCandidacyFactory(
+        status=CandidacyStatus.APPLIED,
+        applied_on=date(2026, 3, 8),
+        job_posting__platform="linkedin",
+        job_posting__posted_on=date(2026, 3, 2),
+    )
+    JobCandidacyFactory(
+        status=CandidacyStatus.REJECTED,
+        applied_on=date(2026, 3, 9),
+        job_posting__platform="indeed",
+        job_posting__posted_on=None,
+    )
+
+
+def counts(period):
+    return {
+        (row.period_start, row.kind, row.platform, row.status): row.count
+        for row in activity_history(period, since=date(2026, 1, 1))
+    }
+
+
+def test_refresh_computes_daily_and_weekly_counts(activity):
+    refresh_activity_rollups()
+
+    assert counts(ActivityPeriod.DAY) == {
+        (date(2026, 3, 2), "posted", "linkedin", ""): 2,
+        (date(2026, 3, 2), "applied", "linkedin", "applied"): 1,
+        (date(2026, 3, 8), "applied", "linkedin", "applied"): 1,
+        (date(2026, 3, 9), "applied", "indeed", "rejected"): 1,
+    }
+    assert counts(ActivityPeriod.WEEK) == {
+        (date(2026, 3, 2), "posted", "linkedin", ""): 2,
+        (date(2026, 3, 2), "applied", "linkedin", "applied"): 2,
+        (date(2026, 3, 9), "applied", "indeed", "rejected"): 1,
+    }
+
+
+def test_rollups_change_only_on_refresh(activity):
+    refresh_activity_rollups()
+    JobPostingFactory(platform="wttj", posted_on=date(2026, 3, 3))
+
+    assert not JobActivityRollup.objects.filter(platform="wttj").exists()
+
+    refresh_activity_rollups(concurrently=False)
+
+    assert JobActivityRollup.objects.filter(platform="wttj").count() == 2
+
+
+def test_refresh_command(activity):
+    stdout = StringIO()
+    call_command("refresh_activity_rollups", stdout=stdout)
+
+    assert "Refreshed job_activity_rollup" in stdout.getvalue()
+    assert counts(ActivityPeriod.WEEK)
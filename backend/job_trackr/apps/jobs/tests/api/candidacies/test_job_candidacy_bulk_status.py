@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_bulk_status.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.common.cache import get_model_versions
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.candidacies.models import JobCandidacy
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("job-candidacy-bulk-status")
+
+
+def test_bulk_status_by_ids(authenticated_client, django_assert_num_queries):
+    candidacies = JobCandidacyFactory.create_batch(3, status=CandidacyStatus.APPLIED)
+    other = JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+    selected = candidacies[:2]
+
+    # One UPDATE ... RETURNING and one status event INSERT, inside a
+    # savepoint.
+    with django_assert_num_queries(4):
+        response = authenticated_client.post(
+            URL,
+            {
+                "status": "rejected",
+                "ids": [str(candidacy.id) for candidacy in selected],
+            },
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data == {
+        "status": "rejected",
+        "count": 2,
+        "ids": sorted(str(candidacy.id) for candidacy in selected),
+    }
+
+    for candidacy in selected:
+        previous_updated_at = candidacy.updated_at
+        candidacy.refresh_from_db()
+        assert candidacy.status == CandidacyStatus.REJECTED
+        assert candidacy.updated_at > previous_updated_at
+
+    other.refresh_from_db()
+    assert other.status == CandidacyStatus.APPLIED
+
+
+def test_bulk_status_by_filter(authenticated_client):
+    linkedin = JobCandidacyFactory(
+        status=CandidacyStatus.APPLIED,
+        job_posting__platform="linkedin",
+    )
+    JobCandidacyFactory(
+        status=CandidacyStatus.INTERVIEW, job_posting__platform="linkedin"
+    )
+    JobCandidacyFactory(status=CandidacyStatus.APPLIED, job_posting__platform="indeed")
+
+    response = authenticated_client.post(
+        URL,
+        {
+            "status": "rejected",
+            "filter": {"status": "applied", "platform": "linkedin"},
+        },
+        format="json",
+    )
+
+    assert response.data["ids"] == [str(linkedin.id)]
+    assert JobCandidacy.objects.filter(status="rejected").count() == 1
+
+
+def test_bulk_status_skips_candidacies_already_in_status(authenticated_client):
+    candidacy = JobCandidacyFactory(status=CandidacyStatus.REJECTED)
+
+    response = authenticated_client.post(
+        URL,
+        {"status": "rejected", "ids": [str(candidacy.id)]},
+        format="json",
+    )
+
+    assert response.data["count"] == 0
+    assert response.data["ids"] == []
+
+
+def test_bulk_status_invalidates_cached_responses(authenticated_client):
+    candidacy = JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+    versions = get_model_versions([JobCandidacy])
+
+    authenticated_client.post(
+        URL,
+        {"status": "offer", "ids": [str(candidacy.id)]},
+        format="json",
+    )
+
+    assert get_model_versions([JobCandidacy]) != versions
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"ids": ["0190d6c2-5a3b-7cc1-8f37-8d3f1c1b2a10"]},
+        {"status": "hired", "ids": ["0190d6c2-5a3b-7cc1-8f37-8d3f1c1b2a10"]},
+        {"status": "rejected"},
+        {"status": "rejected", "ids": []},
+        {"status": "rejected", "ids": ["not-a-uuid"]},
+        {"status": "rejected", "filter": {}},
+        {"status": "rejected", "filter": {"company": "ACME"}},
+        {"status": "rejected", "filter": {"status": "unknown"}},
+        {"status": "rejected", "filter": {"status": ""}},
+        {"status": "rejected", "filter": {"platform": "", "work_mode": None}},
+        {
+            "status": "rejected",
+            "ids": ["0190d6c2-5a3b-7cc1-8f37-8d3f1c1b2a10"],
+            "filter": {"status": "applied"},
+        },
+    ],
+)
+def test_bulk_status_rejects_invalid_payloads(authenticated_client, payload):
+    JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+
+    response = authenticated_client.post(URL, payload, format="json")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not JobCandidacy.objects.filter(status="rejected").exists()
+
+
+def test_bulk_status_requires_authentication(api_client):
+    response = api_client.post(URL, {"status": "rejected"}, format="json")
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
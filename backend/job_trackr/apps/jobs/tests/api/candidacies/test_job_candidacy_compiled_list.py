@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_compiled_list.py
+
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from apps.jobs.api.candidacies.views import JobCandidacyViewSet
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"cursor": "", "page_size": 1},
+        {"fields": "job_posting,status_label"},
+        {"omit": "job_posting"},
+        {"search": "python"},
+        {"status": "interview"},
+    ],
+)
+def test_compiled_list_is_byte_identical(
+    authenticated_client,
+    settings,
+    monkeypatch,
+    params,
+):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    JobCandidacyFactory(
+        status="interview",
+        applied_on=date(2026, 5, 1),
+        notes="Call back after the technical test. " * 10,
+        job_posting__title="Python Developer",
+    )
+    JobCandidacyFactory(status="applied", notes="")
+    url = reverse("job-candidacy-list")
+
+    compiled = authenticated_client.get(url, params)
+
+    monkeypatch.setattr(JobCandidacyViewSet, "compile_list_serializer", False)
+    reference = authenticated_client.get(url, params)
+
+    assert compiled.status_code == reference.status_code == 200
+    assert compiled.content == reference.content
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_conditional_get.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize("url_name", ["job-candidacy-list", "job-candidacy-detail"])
+def test_etag_changes_with_job_posting(authenticated_client, url_name):
+    candidacy = JobCandidacyFactory()
+    args = [candidacy.id] if url_name.endswith("detail") else []
+    url = reverse(url_name, args=args)
+    etag = authenticated_client.get(url)["ETag"]
+
+    assert authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == (
+        status.HTTP_304_NOT_MODIFIED
+    )
+
+    candidacy.job_posting.title = "Renamed"
+    candidacy.job_posting.save()
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
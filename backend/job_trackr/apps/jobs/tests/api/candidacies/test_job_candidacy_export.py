@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_export.py
+
+import csv
+import io
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_export_job_candidacies_as_csv(authenticated_client):
+    candidacy = JobCandidacyFactory(
+        job_posting=JobPostingFactory(title="Data Engineer", company="ACME"),
+        notes="Line one\nLine two",
+    )
+
+    response = authenticated_client.get(reverse("job-candidacy-export"))
+    content = b"".join(response.streaming_content).decode()
+    [row] = list(csv.DictReader(io.StringIO(content)))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Disposition"] == (
+        'attachment; filename="job-candidacies.csv"'
+    )
+    assert row["id"] == str(candidacy.id)
+    assert row["job_posting_id"] == str(candidacy.job_posting_id)
+    assert row["job_posting_title"] == "Data Engineer"
+    assert row["job_posting_company"] == "ACME"
+    assert row["notes"] == "Line one\nLine two"
+    assert row["applied_on"] == candidacy.applied_on.isoformat()
+
+
+def test_export_job_candidacies_honours_filters(authenticated_client):
+    expected = JobCandidacyFactory(status=CandidacyStatus.INTERVIEW)
+    JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+
+    response = authenticated_client.get(
+        reverse("job-candidacy-export"),
+        {"status": CandidacyStatus.INTERVIEW, "export_format": "ndjson"},
+    )
+    content = b"".join(response.streaming_content).decode()
+    rows = [json.loads(line) for line in content.splitlines()]
+
+    assert [row["id"] for row in rows] == [str(expected.id)]
+    assert rows[0]["status"] == CandidacyStatus.INTERVIEW
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_fieldsets.py
+
+import pytest
+from django.urls import reverse
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_fields_with_nested_job_posting(
+    authenticated_client,
+    settings,
+    django_assert_num_queries,
+):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    JobCandidacyFactory.create_batch(3)
+
+    with django_assert_num_queries(2):
+        response = authenticated_client.get(
+            reverse("job-candidacy-list"),
+            {"fields": "id,status_label,job_posting"},
+        )
+
+    item = response.data["results"][0]
+
+    assert item.keys() == {"id", "status_label", "job_posting"}
+    assert item["job_posting"].keys() == {"id", "title", "company", "location"}
+
+
+def test_omit_notes_preview(authenticated_client):
+    JobCandidacyFactory()
+
+    response = authenticated_client.get(
+        reverse("job-candidacy-list"),
+        {"omit": "notes_preview,job_posting"},
+    )
+
+    assert "notes_preview" not in response.data["results"][0]
+    assert "job_posting" not in response.data["results"][0]
+    assert "status" in response.data["results"][0]
+
+
+def test_fields_with_cursor_pagination(authenticated_client):
+    candidacies = JobCandidacyFactory.create_batch(3)
+    url = reverse("job-candidacy-list")
+
+    # The ordering fields and the primary key the cursors are built from
+    # are not part of the requested fields.
+    first = authenticated_client.get(
+        url, {"cursor": "", "fields": "id", "page_size": 2}
+    )
+    second = authenticated_client.get(first.data["next"])
+
+    assert first.status_code == 200
+    assert [item.keys() for item in first.data["results"]] == [{"id"}, {"id"}]
+    assert {item["id"] for item in first.data["results"] + second.data["results"]} == {
+        str(candidacy.id) for candidacy in candidacies
+    }
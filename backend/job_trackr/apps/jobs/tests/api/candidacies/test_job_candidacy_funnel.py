@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_funnel.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.candidacies.models import CandidacyStatusEvent
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("job-candidacy-funnel")
+
+START = datetime(2026, 3, 2, 9, tzinfo=timezone.UTC)
+DAY = 86_400.0
+
+
+def candidacy_with_history(*steps):
+    """Candidacy that went through `(status, day)` steps, in order."""
+    candidacy = JobCandidacyFactory(status=steps[-1][0])
+    candidacy.status_events.all().delete()
+
+    CandidacyStatusEvent.objects.bulk_create(
+        CandidacyStatusEvent(
+            candidacy=candidacy,
+            status=status,
+            occurred_at=START + timedelta(days=day),
+        )
+        for status, day in steps
+    )
+
+    return candidacy
+
+
+@pytest.fixture
+def histories():
+    return [
+        # Skips the technical test.
+        candidacy_with_history(
+            (CandidacyStatus.APPLIED, 0),
+            (CandidacyStatus.INTERVIEW, 2),
+            (CandidacyStatus.OFFER, 6),
+        ),
+        candidacy_with_history(
+            (CandidacyStatus.APPLIED, 0),
+            (CandidacyStatus.INTERVIEW, 4),
+            (CandidacyStatus.REJECTED, 5),
+        ),
+        candidacy_with_history(
+            (CandidacyStatus.APPLIED, 0),
+            (CandidacyStatus.WITHDRAWN, 1),
+        ),
+        candidacy_with_history((CandidacyStatus.APPLIED, 0)),
+    ]
+
+
+def by_status(entries):
+    return {entry["status"]: entry for entry in entries}
+
+
+def test_funnel_stage_conversion(authenticated_client, histories):
+    response = authenticated_client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["candidacies"] == 4
+
+    stages = response.data["stages"]
+    assert [stage["status"] for stage in stages] == [
+        "applied",
+        "interview",
+        "technical_test",
+        "offer",
+    ]
+    assert [stage["reached"] for stage in stages] == [4, 2, 1, 1]
+    assert [stage["entered"] for stage in stages] == [4, 2, 0, 1]
+    assert [stage["conversion"] for stage in stages] == [None, 0.5, 0.5, 1.0]
+
+    outcomes = by_status(response.data["outcomes"])
+    assert outcomes["rejected"]["entered"] == 1
+    assert outcomes["rejected"]["rate"] == 0.25
+    assert outcomes["withdrawn"]["label"] == "Withdrawn"
+
+
+def test_funnel_median_durations(authenticated_client, histories):
+    response = authenticated_client.get(URL)
+
+    stages = by_status(response.data["stages"])
+    outcomes = by_status(response.data["outcomes"])
+
+    # Left after 2, 4 and 1 days; the last candidacy is still applied.
+    assert stages["applied"]["median_duration_seconds"] == 2 * DAY
+    assert stages["applied"]["median_time_to_reach_seconds"] == 0
+    assert stages["interview"]["median_duration_seconds"] == 2.5 * DAY
+    assert stages["interview"]["median_time_to_reach_seconds"] == 3 * DAY
+    assert stages["technical_test"]["median_duration_seconds"] is None
+    assert stages["offer"]["median_time_to_reach_seconds"] == 6 * DAY
+    assert outcomes["withdrawn"]["median_time_to_reach_seconds"] == DAY
+
+
+def test_funnel_follows_filters(authenticated_client, histories):
+    response = authenticated_client.get(URL, {"status": "applied"})
+
+    assert response.data["candidacies"] == 1
+    assert [stage["reached"] for stage in response.data["stages"]] == [1, 0, 0, 0]
+
+
+def test_funnel_without_candidacies(authenticated_client):
+    response = authenticated_client.get(URL)
+
+    assert response.data["candidacies"] == 0
+    assert all(stage["conversion"] is None for stage in response.data["stages"])
+    assert all(outcome["rate"] is None for outcome in response.data["outcomes"])
+
+
+def test_funnel_is_computed_in_one_query(
+    authenticated_client, histories, django_assert_num_queries
+):
+    # Validators, then the funnel itself.
+    with django_assert_num_queries(2):
+        authenticated_client.get(URL)
+
+
+def test_funnel_requires_authentication(api_client):
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_previews.py
+
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.text import Truncator
+
+from apps.jobs.api.candidacies.serializers import NOTES_PREVIEW_LENGTH
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "notes",
+    [
+        "",
+        "a" * NOTES_PREVIEW_LENGTH,
+        "a" * (NOTES_PREVIEW_LENGTH + 1),
+        "Relancer le recruteur après l'entretien. " * 5,
+    ],
+)
+def test_list_preview_matches_truncator(authenticated_client, notes):
+    JobCandidacyFactory(notes=notes)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(reverse("job-candidacy-list"))
+
+    [sql] = [query["sql"] for query in queries if "LIMIT" in query["sql"]]
+    selected = re.sub(r'CASE .*? END AS "notes_preview"', "", sql)
+
+    assert response.data["results"][0]["notes_preview"] == (
+        Truncator(notes).chars(NOTES_PREVIEW_LENGTH)
+    )
+    assert '"job_candidacy"."notes"' not in selected
+    assert '"job_posting"."description"' not in selected
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/candidacies/test_job_candidacy_write_queries.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_create_does_not_refetch(authenticated_client, django_assert_num_queries):
+    job_posting = JobPostingFactory(title="Data Engineer")
+
+    # Job posting lookup, existing candidacy check, INSERT, status event.
+    with django_assert_num_queries(4):
+        response = authenticated_client.post(
+            reverse("job-candidacy-list"),
+            {"job_posting": str(job_posting.id), "notes": "Call back. " * 20},
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["job_posting"]["title"] == "Data Engineer"
+    assert response.data["notes_preview"].endswith("…")
+
+
+@pytest.mark.parametrize("method", ["put", "patch"])
+def test_update_does_not_refetch(
+    authenticated_client,
+    django_assert_num_queries,
+    method,
+):
+    candidacy = JobCandidacyFactory(notes="Old notes")
+
+    # Object lookup, job posting lookup, existing candidacy check, UPDATE,
+    # status event.
+    with django_assert_num_queries(5):
+        response = getattr(authenticated_client, method)(
+            reverse("job-candidacy-detail", args=[candidacy.id]),
+            {
+                "job_posting": str(candidacy.job_posting_id),
+                "status": "interview",
+                "notes": "New notes",
+            },
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["status_label"] == "Interview"
+    assert response.data["notes_preview"] == "New notes"
+    assert response.data["job_posting"]["id"] == str(candidacy.job_posting_id)
@@ -3,9 +3,16 @@
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Cached responses and counts outlive the rolled back test transaction.
+    cache.clear()
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     return APIClient()
@@ -0,0 +1,179 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_bulk.py
+
+import json
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.api.postings.views import JobPostingViewSet
+from apps.jobs.postings.dedupe import index_postings
+from apps.jobs.postings.models import JobPosting, JobPostingSignature
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def job_posting_row(n: int = 0, **overrides):
+    return {
+        "title": f"Backend Engineer {n}",
+        "company": "ACME",
+        "location": "Paris",
+        "url": f"https://example.com/jobs/{n}",
+        **overrides,
+    }
+
+
+def post_bulk(client, rows):
+    return client.post(reverse("job-posting-bulk"), rows, format="json")
+
+
+def test_bulk_creates_job_postings(authenticated_client):
+    response = post_bulk(
+        authenticated_client,
+        [job_posting_row(1), job_posting_row(2, url="")],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["created"] == 2
+    assert response.data["updated"] == 0
+    assert response.data["invalid"] == 0
+    assert [result["status"] for result in response.data["results"]] == [
+        "created",
+        "created",
+    ]
+
+    created = JobPosting.objects.get(pk=response.data["results"][0]["id"])
+    assert created.title == "Backend Engineer 1"
+    assert created.normalized_url == "https://example.com/jobs/1"
+
+
+def test_bulk_updates_posting_with_same_normalized_url(authenticated_client):
+    existing = JobPostingFactory(url="https://example.com/jobs/1", salary="40k")
+
+    response = post_bulk(
+        authenticated_client,
+        [job_posting_row(1, url="HTTPS://EXAMPLE.com/jobs/1/", title="Staff Engineer")],
+    )
+
+    assert response.data["results"] == [
+        {"index": 0, "status": "updated", "id": str(existing.id)}
+    ]
+
+    existing.refresh_from_db()
+    assert JobPosting.objects.count() == 1
+    assert existing.title == "Staff Engineer"
+    assert existing.normalized_title == "staff engineer"
+    assert existing.url == "HTTPS://EXAMPLE.com/jobs/1/"
+    # Rows replace the posting, like a PUT.
+    assert existing.salary == ""
+
+
+def test_bulk_drops_signatures_of_updated_postings(authenticated_client):
+    existing = JobPostingFactory(url="https://example.com/jobs/1")
+    index_postings([existing])
+
+    post_bulk(authenticated_client, [job_posting_row(1), job_posting_row(2)])
+
+    # Left to `cluster_duplicate_postings`, with those of new postings.
+    assert not JobPostingSignature.objects.exists()
+
+
+def test_bulk_reports_invalid_rows_and_writes_valid_ones(authenticated_client):
+    response = post_bulk(
+        authenticated_client,
+        [
+            job_posting_row(1),
+            job_posting_row(2, title=""),
+            "not an object",
+            job_posting_row(3, platform="unknown"),
+            job_posting_row(4, url="https://example.com/jobs/1/"),
+        ],
+    )
+
+    results = response.data["results"]
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["created"] == 1
+    assert response.data["invalid"] == 4
+    assert [result["status"] for result in results] == [
+        "created",
+        "invalid",
+        "invalid",
+        "invalid",
+        "invalid",
+    ]
+    assert "title" in results[1]["errors"]
+    assert "non_field_errors" in results[2]["errors"]
+    assert "platform" in results[3]["errors"]
+    assert "url" in results[4]["errors"]
+    assert JobPosting.objects.count() == 1
+
+
+def test_bulk_accepts_ndjson(authenticated_client):
+    body = "\n".join(json.dumps(job_posting_row(n)) for n in range(3)) + "\n\n"
+
+    response = authenticated_client.post(
+        reverse("job-posting-bulk"),
+        body,
+        content_type="application/x-ndjson",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["created"] == 3
+
+
+def test_bulk_rejects_malformed_ndjson(authenticated_client):
+    body = json.dumps(job_posting_row(1)) + "\n{not json\n"
+
+    response = authenticated_client.post(
+        reverse("job-posting-bulk"),
+        body,
+        content_type="application/x-ndjson",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "line 2" in response.data["detail"]
+    assert not JobPosting.objects.exists()
+
+
+def test_bulk_rejects_non_list_body(authenticated_client):
+    response = post_bulk(authenticated_client, job_posting_row(1))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_bulk_rejects_too_many_rows(authenticated_client, monkeypatch):
+    monkeypatch.setattr(JobPostingViewSet, "bulk_max_rows", 2)
+
+    response = post_bulk(authenticated_client, [job_posting_row(n) for n in range(3)])
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not JobPosting.objects.exists()
+
+
+def test_bulk_writes_in_chunks(authenticated_client, monkeypatch):
+    monkeypatch.setattr(JobPostingViewSet, "bulk_chunk_size", 100)
+    rows = [job_posting_row(n) for n in range(250)]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = post_bulk(authenticated_client, rows)
+
+    inserts = [
+        query
+        for query in queries
+        if query["sql"].startswith('INSERT INTO "job_posting"')
+    ]
+
+    assert response.data["created"] == 250
+    assert len(inserts) == 3
+    assert len(queries) < 15
+
+
+def test_bulk_requires_authentication(api_client):
+    response = post_bulk(api_client, [job_posting_row(1)])
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_compiled_list.py
+
+from datetime import date
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from rest_framework import serializers
+
+from apps.common.api.compiled import CompiledSerializer
+from apps.jobs.api.postings.views import JobPostingViewSet
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def job_postings():
+    postings = [
+        JobPostingFactory(
+            title="Python Developer",
+            description="Django and PostgreSQL. " * 20,
+            salary="50k",
+            easy_apply=True,
+            platform="linkedin",
+            employment_type="full_time",
+            work_mode="remote",
+            posted_on=date(2026, 5, 1),
+        ),
+        JobPostingFactory(
+            title="Data Engineer",
+            description="Short",
+            platform="wttj",
+            work_mode="hybrid",
+            posted_on=date(2026, 5, 1),
+        ),
+        JobPostingFactory(title="Backend Engineer"),
+    ]
+    JobCandidacyFactory(job_posting=postings[0])
+    return postings
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"page_size": 100},
+        {"page": 2, "page_size": 2},
+        {"cursor": ""},
+        {"cursor": "", "page_size": 1, "ordering": "title"},
+        {"fields": "id,platform_label,candidacy_id"},
+        {"omit": "description_preview,work_mode_label"},
+        {"search": "python"},
+        {"search": "engineer", "cursor": ""},
+        {"platform": "wttj"},
+        {"has_candidacy": "true"},
+    ],
+)
+def test_compiled_list_is_byte_identical(
+    authenticated_client,
+    settings,
+    monkeypatch,
+    job_postings,
+    params,
+):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    url = reverse("job-posting-list")
+
+    compiled = authenticated_client.get(url, params)
+
+    monkeypatch.setattr(JobPostingViewSet, "compile_list_serializer", False)
+    reference = authenticated_client.get(url, params)
+
+    assert compiled.status_code == reference.status_code == 200
+    assert compiled.content == reference.content
+
+
+def test_compiled_cursor_pages_follow_each_other(authenticated_client, job_postings):
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"cursor": "", "page_size": 2},
+    )
+    next_page = authenticated_client.get(response.data["next"])
+
+    titles = [item["title"] for item in response.data["results"]]
+    titles += [item["title"] for item in next_page.data["results"]]
+
+    assert sorted(titles) == sorted(posting.title for posting in job_postings)
+
+
+def test_unsupported_fields_are_rejected():
+    class Serializer(serializers.ModelSerializer[JobPosting]):
+        summary = serializers.SerializerMethodField()
+
+        class Meta:
+            model = JobPosting
+            fields = ["id", "summary"]
+
+    with pytest.raises(ImproperlyConfigured):
+        CompiledSerializer(Serializer())
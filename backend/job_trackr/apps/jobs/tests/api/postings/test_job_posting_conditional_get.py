@@ -0,0 +1,192 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_conditional_get.py
+
+import pytest
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def detail_url():
+    return reverse("job-posting-detail", args=[JobPostingFactory().id])
+
+
+def test_detail_has_validators(authenticated_client):
+    job_posting = JobPostingFactory()
+
+    response = authenticated_client.get(
+        reverse("job-posting-detail", args=[job_posting.id])
+    )
+
+    assert response["ETag"].startswith('"')
+    assert response["Last-Modified"] == http_date(job_posting.updated_at.timestamp())
+
+
+def test_detail_if_none_match_returns_not_modified(authenticated_client, detail_url):
+    etag = authenticated_client.get(detail_url)["ETag"]
+
+    response = authenticated_client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+def test_detail_if_modified_since_returns_not_modified(
+    authenticated_client,
+    detail_url,
+):
+    last_modified = authenticated_client.get(detail_url)["Last-Modified"]
+
+    response = authenticated_client.get(
+        detail_url,
+        HTTP_IF_MODIFIED_SINCE=last_modified,
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_detail_etag_changes_on_update(authenticated_client):
+    job_posting = JobPostingFactory()
+    url = reverse("job-posting-detail", args=[job_posting.id])
+    etag = authenticated_client.get(url)["ETag"]
+
+    job_posting.title = "Staff Engineer"
+    job_posting.save()
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+def test_detail_etag_changes_with_candidacy(authenticated_client):
+    job_posting = JobPostingFactory()
+    url = reverse("job-posting-detail", args=[job_posting.id])
+    etag = authenticated_client.get(url)["ETag"]
+
+    JobCandidacyFactory(job_posting=job_posting)
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_detail_etag_depends_on_representation(authenticated_client, detail_url):
+    json_etag = authenticated_client.get(detail_url)["ETag"]
+    html_etag = authenticated_client.get(detail_url, HTTP_ACCEPT="text/html")["ETag"]
+
+    assert json_etag != html_etag
+
+
+def test_list_has_etag_only(authenticated_client):
+    JobPostingFactory()
+
+    response = authenticated_client.get(reverse("job-posting-list"))
+
+    assert "ETag" in response
+    assert "Last-Modified" not in response
+
+
+def test_list_not_modified_skips_page_query(
+    authenticated_client,
+    settings,
+    django_assert_num_queries,
+):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    JobPostingFactory.create_batch(3)
+    url = reverse("job-posting-list")
+    etag = authenticated_client.get(url)["ETag"]
+
+    # Only the validator aggregate.
+    with django_assert_num_queries(1):
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_list_not_modified_from_response_cache(
+    authenticated_client,
+    django_assert_num_queries,
+):
+    JobPostingFactory()
+    url = reverse("job-posting-list")
+    etag = authenticated_client.get(url)["ETag"]
+
+    with django_assert_num_queries(0):
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["X-Cache"] == "HIT"
+
+
+def test_list_etag_depends_on_query(authenticated_client):
+    JobPostingFactory(platform="linkedin")
+    url = reverse("job-posting-list")
+
+    etags = {
+        authenticated_client.get(url, params)["ETag"]
+        for params in [{}, {"platform": "linkedin"}, {"page_size": 5}]
+    }
+
+    assert len(etags) == 3
+
+
+def test_list_etag_changes_on_delete(authenticated_client):
+    older, newer = JobPostingFactory.create_batch(2)
+    url = reverse("job-posting-list")
+    etag = authenticated_client.get(url)["ETag"]
+
+    # Deleting the older posting leaves MAX(updated_at) unchanged.
+    older.delete()
+    response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 1
+
+
+def test_cursor_list_not_modified_without_aggregate(
+    authenticated_client,
+    settings,
+    django_assert_num_queries,
+):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    JobPostingFactory.create_batch(3)
+    url = reverse("job-posting-list")
+    etag = authenticated_client.get(url, {"cursor": ""})["ETag"]
+
+    # Only the page query: no aggregate over every matching row.
+    with django_assert_num_queries(1):
+        response = authenticated_client.get(
+            url, {"cursor": ""}, HTTP_IF_NONE_MATCH=etag
+        )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_cursor_list_etag_changes_with_page_rows(authenticated_client):
+    job_posting = JobPostingFactory()
+    url = reverse("job-posting-list")
+    etag = authenticated_client.get(url, {"cursor": ""})["ETag"]
+
+    JobCandidacyFactory(job_posting=job_posting)
+    response = authenticated_client.get(url, {"cursor": ""}, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"][0]["candidacy_id"] is not None
+
+
+def test_cursor_list_etag_changes_on_delete(authenticated_client):
+    older, newer = JobPostingFactory.create_batch(2)
+    url = reverse("job-posting-list")
+    etag = authenticated_client.get(url, {"cursor": ""})["ETag"]
+
+    older.delete()
+    response = authenticated_client.get(url, {"cursor": ""}, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.data["results"]) == 1
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_cursor_pagination.py
+
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from apps.common.api.pagination import Cursor, encode_cursor
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def job_postings():
+    # Many ties and NULLs on `posted_on`, the first ordering field.
+    return [
+        JobPostingFactory(posted_on=posted_on)
+        for posted_on in [None, None, date(2026, 7, 1), date(2026, 7, 2)] * 4
+    ]
+
+
+def collect_pages(client, url, params=None, direction="next") -> list[list[str]]:
+    pages = []
+    response = client.get(url, params)
+
+    # Bounded so that a cursor that does not move fails instead of looping.
+    for _ in range(50):
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.data["results"]])
+
+        if response.data[direction] is None:
+            return pages
+
+        response = client.get(response.data[direction])
+
+    pytest.fail(f"Pagination did not end: {pages}")
+
+
+def expected_ids(*ordering: str) -> list[str]:
+    return [
+        str(pk)
+        for pk in JobPosting.objects.order_by(*ordering, "pk").values_list(
+            "pk", flat=True
+        )
+    ]
+
+
+def test_cursor_pagination_keeps_the_response_shape(authenticated_client, job_postings):
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"cursor": "", "page_size": 5},
+    )
+
+    assert response.status_code == 200
+    assert response.data.keys() == {"count", "next", "previous", "results"}
+    assert response.data["count"] is None
+    assert response.data["previous"] is None
+    assert len(response.data["results"]) == 5
+
+
+def test_cursor_pagination_walks_default_ordering(authenticated_client, job_postings):
+    pages = collect_pages(
+        authenticated_client,
+        reverse("job-posting-list"),
+        {"cursor": "", "page_size": 5},
+    )
+
+    assert [len(page) for page in pages] == [5, 5, 5, 1]
+    assert sum(pages, []) == expected_ids("-posted_on", "-created_at")
+
+
+@pytest.mark.parametrize(
+    "ordering", ["posted_on", "-posted_on", "company", "-platform"]
+)
+def test_cursor_pagination_walks_requested_ordering(
+    authenticated_client,
+    job_postings,
+    ordering,
+):
+    pages = collect_pages(
+        authenticated_client,
+        reverse("job-posting-list"),
+        {"cursor": "", "page_size": 3, "ordering": ordering},
+    )
+
+    assert sum(pages, []) == expected_ids(ordering)
+
+
+def test_cursor_pagination_walks_back_with_previous_links(
+    authenticated_client,
+    job_postings,
+):
+    url = reverse("job-posting-list")
+    forward = collect_pages(authenticated_client, url, {"cursor": "", "page_size": 5})
+
+    last_page = authenticated_client.get(url, {"cursor": "", "page_size": 5})
+    while last_page.data["next"] is not None:
+        last_page = authenticated_client.get(last_page.data["next"])
+
+    backward = collect_pages(
+        authenticated_client, last_page.data["previous"], direction="previous"
+    )
+
+    assert backward == forward[-2::-1]
+
+
+def test_cursor_pagination_follows_search_rank(authenticated_client):
+    JobPostingFactory(description="Python")
+    JobPostingFactory(title="Python Developer")
+    JobPostingFactory(company="Python Software")
+
+    pages = collect_pages(
+        authenticated_client,
+        reverse("job-posting-list"),
+        {"cursor": "", "page_size": 1, "search": "python"},
+    )
+
+    titles = [JobPosting.objects.get(pk=page[0]).title for page in pages]
+
+    assert len(pages) == 3
+    assert titles[0] == "Python Developer"
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "W10"])
+def test_cursor_pagination_rejects_invalid_cursor(authenticated_client, cursor):
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"cursor": cursor},
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "position",
+    [
+        ("not-a-date", None, "0190d6c2-5a3b-7cc1-8f37-8d3f1c1b2a10"),
+        (None, "2026-07-01T10:00:00+00:00", "not-a-uuid"),
+        (None, ["2026-07-01"], "0190d6c2-5a3b-7cc1-8f37-8d3f1c1b2a10"),
+    ],
+)
+def test_cursor_pagination_rejects_tampered_positions(authenticated_client, position):
+    cursor = Cursor(("-posted_on", "-created_at", "pk"), position)
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"cursor": encode_cursor(cursor)},
+    )
+
+    assert response.status_code == 404
+
+
+def test_cursor_pagination_rejects_cursor_from_another_ordering(
+    authenticated_client,
+    job_postings,
+):
+    url = reverse("job-posting-list")
+
+    response = authenticated_client.get(url, {"cursor": "", "page_size": 5})
+    next_cursor = response.data["next"].split("cursor=")[1].split("&")[0]
+
+    response = authenticated_client.get(
+        url,
+        {"cursor": next_cursor, "page_size": 5, "ordering": "company"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_cursor_pagination_on_candidacies(authenticated_client):
+    candidacies = [
+        JobCandidacyFactory(applied_on=date(2026, 7, day % 3 + 1)) for day in range(7)
+    ]
+
+    pages = collect_pages(
+        authenticated_client,
+        reverse("job-candidacy-list"),
+        {"cursor": "", "page_size": 2},
+    )
+
+    assert [len(page) for page in pages] == [2, 2, 2, 1]
+    assert set(sum(pages, [])) == {str(candidacy.id) for candidacy in candidacies}
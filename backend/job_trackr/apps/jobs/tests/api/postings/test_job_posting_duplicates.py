@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_duplicates.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.postings.dedupe import index_missing_postings
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+DESCRIPTION = " ".join(
+    f"Responsibility {n} of the role is described in this sentence." for n in range(10)
+)
+
+
+def test_duplicates_returns_similar_postings(authenticated_client):
+    original = JobPostingFactory(title="Data Engineer", description=DESCRIPTION)
+    repost = JobPostingFactory(
+        title="Data Engineer (F/M)",
+        description=DESCRIPTION + " Apply now.",
+    )
+    JobPostingFactory(title="Data Engineer", description="Unrelated text.")
+    index_missing_postings()
+
+    response = authenticated_client.get(
+        reverse("job-posting-duplicates", args=[original.id])
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["job_posting"]["id"] for item in response.data] == [str(repost.id)]
+    assert 0.5 <= response.data[0]["similarity"] <= 1
+    assert "description_preview" in response.data[0]["job_posting"]
+
+
+def test_duplicates_honours_min_similarity(authenticated_client):
+    original = JobPostingFactory(description=DESCRIPTION)
+    JobPostingFactory(description=DESCRIPTION + " Apply now.")
+    index_missing_postings()
+
+    response = authenticated_client.get(
+        reverse("job-posting-duplicates", args=[original.id]),
+        {"min_similarity": 1},
+    )
+
+    assert response.data == []
+
+
+@pytest.mark.parametrize("value", ["high", "1.5", "-0.1"])
+def test_duplicates_rejects_invalid_min_similarity(authenticated_client, value):
+    job_posting = JobPostingFactory()
+
+    response = authenticated_client.get(
+        reverse("job-posting-duplicates", args=[job_posting.id]),
+        {"min_similarity": value},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_duplicates_of_unknown_posting(authenticated_client):
+    response = authenticated_client.get(
+        reverse(
+            "job-posting-duplicates",
+            args=["00000000-0000-0000-0000-000000000000"],
+        )
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_export.py
+
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def read_csv(response) -> list[dict[str, str]]:
+    content = b"".join(response.streaming_content).decode()
+    return list(csv.DictReader(io.StringIO(content)))
+
+
+def read_ndjson(response) -> list[dict]:
+    content = b"".join(response.streaming_content).decode()
+    return [json.loads(line) for line in content.splitlines()]
+
+
+def test_export_job_postings_as_csv(authenticated_client):
+    job_posting = JobPostingFactory(
+        title="Backend, Python",
+        easy_apply=True,
+        posted_on=date(2026, 7, 1),
+    )
+    candidacy = JobCandidacyFactory(job_posting=job_posting)
+
+    response = authenticated_client.get(reverse("job-posting-export"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    assert response["Content-Disposition"] == (
+        'attachment; filename="job-postings.csv"'
+    )
+
+    [row] = read_csv(response)
+
+    assert row["id"] == str(job_posting.id)
+    assert row["title"] == "Backend, Python"
+    assert row["easy_apply"] == "true"
+    assert row["posted_on"] == "2026-07-01"
+    assert row["candidacy_id"] == str(candidacy.id)
+
+
+def test_export_job_postings_as_ndjson(authenticated_client):
+    JobPostingFactory.create_batch(3)
+
+    response = authenticated_client.get(
+        reverse("job-posting-export"),
+        {"export_format": "ndjson"},
+    )
+
+    rows = read_ndjson(response)
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert len(rows) == 3
+    assert rows[0]["candidacy_id"] is None
+    assert rows[0]["posted_on"] is None
+
+
+def test_export_job_postings_as_json(authenticated_client):
+    job_postings = JobPostingFactory.create_batch(3)
+
+    response = authenticated_client.get(
+        reverse("job-posting-export"),
+        {"export_format": "json"},
+    )
+
+    rows = json.loads(b"".join(response.streaming_content))
+
+    assert response["Content-Type"] == "application/json"
+    assert response["Content-Disposition"] == (
+        'attachment; filename="job-postings.json"'
+    )
+    assert {row["id"] for row in rows} == {str(posting.id) for posting in job_postings}
+    assert rows[0]["created_at"].endswith("Z")
+
+
+def test_export_no_job_postings_as_json(authenticated_client):
+    response = authenticated_client.get(
+        reverse("job-posting-export"),
+        {"export_format": "json"},
+    )
+
+    assert b"".join(response.streaming_content) == b"[]"
+
+
+def test_export_job_postings_is_not_paginated(authenticated_client):
+    JobPostingFactory.create_batch(120)
+
+    response = authenticated_client.get(
+        reverse("job-posting-export"),
+        {"export_format": "ndjson"},
+    )
+
+    assert len(read_ndjson(response)) == 120
+
+
+def test_export_job_postings_honours_filters_search_and_ordering(
+    authenticated_client,
+):
+    JobPostingFactory(title="Python Developer", company="B Corp", platform="linkedin")
+    JobPostingFactory(title="Python Engineer", company="A Corp", platform="linkedin")
+    JobPostingFactory(title="Python Lead", company="C Corp", platform="indeed")
+    JobPostingFactory(title="Java Developer", company="D Corp", platform="linkedin")
+
+    response = authenticated_client.get(
+        reverse("job-posting-export"),
+        {"search": "python", "platform": "linkedin", "ordering": "company"},
+    )
+
+    assert [row["company"] for row in read_csv(response)] == ["A Corp", "B Corp"]
+
+
+def test_export_job_postings_rejects_unknown_format(authenticated_client):
+    response = authenticated_client.get(
+        reverse("job-posting-export"),
+        {"export_format": "xlsx"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_export_job_postings_requires_authentication(api_client):
+    response = api_client.get(reverse("job-posting-export"))
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
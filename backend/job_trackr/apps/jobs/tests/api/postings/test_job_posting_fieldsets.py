@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_fieldsets.py
+
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def page_query(queries) -> str:
+    [sql] = [
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith("SELECT") and "LIMIT" in query["sql"]
+    ]
+    # The preview annotation reads `description` to truncate it in SQL.
+    return re.sub(r'CASE .*? END AS "description_preview"', "", sql)
+
+
+def test_fields_trims_list_items(authenticated_client):
+    JobPostingFactory(platform="linkedin")
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"fields": "id,title,platform_label"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["results"][0].keys() == {"id", "title", "platform_label"}
+    assert response.data["results"][0]["platform_label"] == "LinkedIn"
+
+
+def test_fields_loads_only_needed_columns(authenticated_client):
+    JobPostingFactory(description="Long text " * 100)
+
+    with CaptureQueriesContext(connection) as queries:
+        authenticated_client.get(
+            reverse("job-posting-list"),
+            {"fields": "id,title,candidacy_id"},
+        )
+
+    sql = page_query(queries)
+
+    assert '"job_posting"."title"' in sql
+    assert '"job_posting"."description"' not in sql
+    assert '"job_posting"."company"' not in sql
+
+
+def test_fields_keeps_one_query_per_page(
+    authenticated_client,
+    settings,
+    django_assert_num_queries,
+):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    for job_posting in JobPostingFactory.create_batch(3):
+        JobCandidacyFactory(job_posting=job_posting)
+
+    # Validators and page; the count reuses the validator aggregate.
+    with django_assert_num_queries(2):
+        response = authenticated_client.get(
+            reverse("job-posting-list"),
+            {"fields": "title,candidacy_id,description_preview"},
+        )
+
+    assert all(item["candidacy_id"] for item in response.data["results"])
+
+
+def test_omit_defers_unused_columns(authenticated_client):
+    JobPostingFactory(description="Long text " * 100)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.get(
+            reverse("job-posting-list"),
+            {"omit": "description_preview,salary"},
+        )
+
+    item = response.data["results"][0]
+    sql = page_query(queries)
+
+    assert "description_preview" not in item
+    assert "salary" not in item
+    assert "title" in item
+    assert '"job_posting"."description"' not in sql
+    assert '"job_posting"."title"' in sql
+
+
+def test_fields_on_detail(authenticated_client):
+    job_posting = JobPostingFactory(description="Full description")
+
+    response = authenticated_client.get(
+        reverse("job-posting-detail", args=[job_posting.id]),
+        {"fields": "id,description"},
+    )
+
+    assert response.data == {
+        "id": str(job_posting.id),
+        "description": "Full description",
+    }
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"fields": "id,unknown"},
+        {"omit": "unknown"},
+        {"fields": ","},
+        {"fields": "id", "omit": "title"},
+    ],
+)
+def test_invalid_fieldsets_are_rejected(authenticated_client, params):
+    response = authenticated_client.get(reverse("job-posting-list"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_fields_is_ignored_on_writes(authenticated_client):
+    response = authenticated_client.post(
+        f"{reverse('job-posting-list')}?fields=id",
+        {"title": "Backend Engineer", "company": "ACME", "location": "Paris"},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert "title" in response.data
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_normalized_fields.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.api.postings.serializers import JobPostingWriteSerializer
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def job_posting_payload(**overrides):
+    return {
+        "title": "Backend Engineer",
+        "company": "ACME",
+        "location": "Paris",
+        **overrides,
+    }
+
+
+def test_filter_job_postings_by_exact_company(authenticated_client):
+    expected = JobPostingFactory(company="Société Générale")
+    JobPostingFactory(company="Société Générale Assurances")
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"company_exact": "  societe   GENERALE"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.data["results"]] == [str(expected.id)]
+
+
+def test_create_job_posting_rejects_duplicate_url(authenticated_client):
+    JobPostingFactory(url="https://example.com/jobs/1")
+
+    response = authenticated_client.post(
+        reverse("job-posting-list"),
+        job_posting_payload(url="https://EXAMPLE.com/jobs/1/"),
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["url"] == ["A job posting with this URL already exists."]
+
+
+def test_create_job_posting_reports_concurrent_duplicate_url(
+    authenticated_client,
+    monkeypatch,
+):
+    JobPostingFactory(url="https://example.com/jobs/1")
+    # The other posting is saved after validation ran.
+    monkeypatch.setattr(
+        JobPostingWriteSerializer,
+        "validate_url",
+        lambda self, url: url,
+    )
+
+    response = authenticated_client.post(
+        reverse("job-posting-list"),
+        job_posting_payload(url="https://EXAMPLE.com/jobs/1/"),
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["url"] == ["A job posting with this URL already exists."]
+
+
+def test_update_job_posting_reports_concurrent_duplicate_url(
+    authenticated_client,
+    monkeypatch,
+):
+    JobPostingFactory(url="https://example.com/jobs/1")
+    job_posting = JobPostingFactory(url="https://example.com/jobs/2")
+    monkeypatch.setattr(
+        JobPostingWriteSerializer,
+        "validate_url",
+        lambda self, url: url,
+    )
+
+    response = authenticated_client.patch(
+        reverse("job-posting-detail", args=[job_posting.id]),
+        {"url": "https://example.com/jobs/1"},
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.data["url"] == ["A job posting with this URL already exists."]
+
+
+def test_update_job_posting_keeps_its_own_url(authenticated_client):
+    job_posting = JobPostingFactory(url="https://example.com/jobs/1")
+
+    response = authenticated_client.put(
+        reverse("job-posting-detail", args=[job_posting.id]),
+        job_posting_payload(url="https://example.com/jobs/1/"),
+        format="json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_create_job_postings_without_url(authenticated_client):
+    url = reverse("job-posting-list")
+
+    first = authenticated_client.post(url, job_posting_payload(), format="json")
+    second = authenticated_client.post(url, job_posting_payload(), format="json")
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_201_CREATED
@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_pagination_counts.py
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from apps.common.cache import bump_model_version
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def disable_response_cache(settings):
+    # Cached responses would skip the count queries under test.
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+
+
+@pytest.fixture
+def count_strategy(settings):
+    def set_strategy(strategy: str, **overrides) -> None:
+        settings.API_COUNT_STRATEGY = strategy
+        for name, value in overrides.items():
+            setattr(settings, name, value)
+
+    return set_strategy
+
+
+def analyze_job_postings() -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {JobPosting._meta.db_table}")
+
+
+def test_exact_count_has_no_approximation_flag(authenticated_client):
+    JobPostingFactory.create_batch(3)
+
+    response = authenticated_client.get(reverse("job-posting-list"))
+
+    assert response.data["count"] == 3
+    assert "count_is_approximate" not in response.data
+
+
+def test_cached_count_skips_count_query_on_repeat(
+    authenticated_client,
+    count_strategy,
+    django_assert_num_queries,
+):
+    count_strategy("cached")
+    JobPostingFactory.create_batch(3, platform="linkedin")
+    url = reverse("job-posting-list")
+
+    # Page query, plus the COUNT(*) that gets cached. Validators come from
+    # the page rows.
+    with django_assert_num_queries(2):
+        first = authenticated_client.get(url, {"platform": "linkedin"})
+
+    with django_assert_num_queries(1):
+        second = authenticated_client.get(url, {"platform": "linkedin"})
+
+    assert first.data["count"] == second.data["count"] == 3
+
+
+def test_cached_count_is_keyed_on_filters(authenticated_client, count_strategy):
+    count_strategy("cached")
+    JobPostingFactory(title="Python Developer")
+    JobPostingFactory(title="Data Analyst")
+    url = reverse("job-posting-list")
+
+    assert authenticated_client.get(url).data["count"] == 2
+    assert authenticated_client.get(url, {"title": "python"}).data["count"] == 1
+
+
+def test_cached_count_is_invalidated_by_writes(authenticated_client, count_strategy):
+    count_strategy("cached")
+    posting = JobPostingFactory()
+    url = reverse("job-posting-list")
+
+    assert authenticated_client.get(url, {"has_candidacy": True}).data["count"] == 0
+
+    JobCandidacyFactory(job_posting=posting)
+
+    assert authenticated_client.get(url, {"has_candidacy": True}).data["count"] == 1
+
+    posting.delete()
+
+    assert authenticated_client.get(url, {"has_candidacy": True}).data["count"] == 0
+
+
+def test_cached_count_requires_explicit_bump_after_bulk_writes(
+    authenticated_client,
+    count_strategy,
+):
+    count_strategy("cached")
+    JobPostingFactory()
+    url = reverse("job-posting-list")
+
+    assert authenticated_client.get(url).data["count"] == 1
+
+    # bulk_create does not send post_save.
+    JobPosting.objects.bulk_create([JobPosting(title="T", company="C", location="L")])
+    assert authenticated_client.get(url).data["count"] == 1
+
+    bump_model_version(JobPosting)
+    assert authenticated_client.get(url).data["count"] == 2
+
+
+def test_estimated_count_is_exact_below_threshold(authenticated_client, count_strategy):
+    count_strategy("estimated", API_COUNT_ESTIMATE_THRESHOLD=1_000)
+    JobPostingFactory.create_batch(3)
+    analyze_job_postings()
+
+    response = authenticated_client.get(reverse("job-posting-list"))
+
+    assert response.data["count"] == 3
+    assert response.data["count_is_approximate"] is False
+
+
+def test_estimated_count_uses_table_statistics_without_filters(
+    authenticated_client,
+    count_strategy,
+):
+    count_strategy("estimated", API_COUNT_ESTIMATE_THRESHOLD=10)
+    JobPostingFactory.create_batch(30)
+    analyze_job_postings()
+
+    response = authenticated_client.get(reverse("job-posting-list"))
+
+    assert response.data["count"] == 30
+    assert response.data["count_is_approximate"] is True
+
+
+def test_estimated_count_uses_planner_estimate_with_filters(
+    authenticated_client,
+    count_strategy,
+):
+    count_strategy("estimated", API_COUNT_ESTIMATE_THRESHOLD=1)
+    JobPostingFactory.create_batch(30, platform="linkedin")
+    analyze_job_postings()
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"platform": "linkedin"},
+    )
+
+    assert response.data["count"] >= 1
+    assert response.data["count_is_approximate"] is True
+
+
+def test_estimated_count_serves_pages_past_the_estimate(
+    authenticated_client,
+    count_strategy,
+):
+    count_strategy("estimated", API_COUNT_ESTIMATE_THRESHOLD=10)
+    JobPostingFactory.create_batch(30)
+    analyze_job_postings()
+    # Rows added after ANALYZE are not in the estimate yet.
+    JobPostingFactory.create_batch(10)
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"page": 4, "page_size": 10},
+    )
+
+    assert response.status_code == 200
+    assert len(response.data["results"]) == 10
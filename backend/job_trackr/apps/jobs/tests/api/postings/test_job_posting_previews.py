@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_previews.py
+
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.text import Truncator
+
+from apps.jobs.api.postings.serializers import (
+    DESCRIPTION_PREVIEW_LENGTH,
+    JobPostingListSerializer,
+)
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "",
+        "Short description",
+        "a" * (DESCRIPTION_PREVIEW_LENGTH - 1),
+        "a" * DESCRIPTION_PREVIEW_LENGTH,
+        "a" * (DESCRIPTION_PREVIEW_LENGTH + 1),
+        "Ingénieur backend, équipe données. " * 20,
+        "Line one\nLine two " * 30,
+    ],
+)
+def test_list_preview_matches_truncator(authenticated_client, description):
+    JobPostingFactory(description=description)
+
+    response = authenticated_client.get(reverse("job-posting-list"))
+
+    assert response.data["results"][0]["description_preview"] == (
+        Truncator(description).chars(DESCRIPTION_PREVIEW_LENGTH)
+    )
+
+
+def test_list_does_not_load_descriptions(authenticated_client):
+    JobPostingFactory(description="Long text " * 1_000)
+
+    with CaptureQueriesContext(connection) as queries:
+        authenticated_client.get(reverse("job-posting-list"))
+
+    [sql] = [query["sql"] for query in queries if "LIMIT" in query["sql"]]
+    selected = re.sub(r'CASE .*? END AS "description_preview"', "", sql)
+
+    assert 'AS "description_preview"' in sql
+    assert '"job_posting"."description"' not in selected
+    assert '"job_candidacy"."notes"' not in selected
+
+
+def test_detail_still_has_full_description(authenticated_client):
+    description = "Long text " * 100
+    job_posting = JobPostingFactory(description=description)
+
+    response = authenticated_client.get(
+        reverse("job-posting-detail", args=[job_posting.id])
+    )
+
+    assert response.data["description"] == description
+    assert response.data["description_preview"] == (
+        Truncator(description).chars(DESCRIPTION_PREVIEW_LENGTH)
+    )
+
+
+def test_preview_of_instances_without_annotation():
+    job_posting = JobPostingFactory(description="Long text " * 100)
+
+    data = JobPostingListSerializer(job_posting).data
+
+    assert data["description_preview"] == (
+        Truncator(job_posting.description).chars(DESCRIPTION_PREVIEW_LENGTH)
+    )
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_query_plans.py
+
+import pytest
+
+from apps.jobs.api.postings.filters import JobPostingFilter
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.tests.helpers.query_plans import (
+    assert_no_seq_scan,
+    seed_job_postings,
+    seeded_job_posting_fields,
+)
+
+pytestmark = pytest.mark.django_db
+
+# On small tables a sequential scan is genuinely cheaper, so the planner
+# would be right to ignore the indexes.
+SEEDED_POSTINGS = 20_000
+
+
+@pytest.fixture(scope="module")
+def seeded_postings(django_db_setup, django_db_blocker):
+    # Seed once for the whole module: the rows are committed outside the
+    # per-test transaction and removed when the module is done.
+    with django_db_blocker.unblock():
+        seed_job_postings(SEEDED_POSTINGS)
+        yield
+        JobPosting.objects.all().delete()
+
+
+@pytest.mark.parametrize("filter_name", ["title", "company", "location"])
+def test_icontains_filters_use_trigram_indexes(seeded_postings, filter_name):
+    # Distinctive part of a seeded value, e.g. "kwnvtl" in "SRE kwnvtl".
+    filter_value = seeded_job_posting_fields(1234)[filter_name].split()[-1]
+
+    filterset = JobPostingFilter(
+        data={filter_name: filter_value},
+        queryset=JobPosting.objects.all(),
+    )
+
+    assert filterset.is_valid(), filterset.errors
+    assert filterset.qs.exists()
+
+    assert_no_seq_scan(filterset.qs)
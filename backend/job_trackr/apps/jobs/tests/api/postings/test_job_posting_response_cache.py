@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_response_cache.py
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.common.api.response_cache import get_response_cache_stats
+from apps.common.cache import bump_model_version, get_model_versions
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_list_response_is_cached(
+    authenticated_client,
+    django_assert_num_queries,
+):
+    JobPostingFactory.create_batch(2)
+    url = reverse("job-posting-list")
+
+    first = authenticated_client.get(url)
+
+    with django_assert_num_queries(0):
+        second = authenticated_client.get(url)
+
+    assert first["X-Cache"] == "MISS"
+    assert second["X-Cache"] == "HIT"
+    assert second.json() == first.json()
+    assert get_response_cache_stats(["job-posting"]) == {
+        "job-posting": {"hits": 1, "misses": 1}
+    }
+
+
+def test_detail_response_is_cached(authenticated_client):
+    job_posting = JobPostingFactory()
+    url = reverse("job-posting-detail", args=[job_posting.id])
+
+    authenticated_client.get(url)
+    response = authenticated_client.get(url)
+
+    assert response["X-Cache"] == "HIT"
+    assert response.data["id"] == str(job_posting.id)
+
+
+def test_cache_key_ignores_query_parameter_order(authenticated_client):
+    JobPostingFactory(platform="linkedin")
+    url = reverse("job-posting-list")
+
+    authenticated_client.get(url, {"platform": "linkedin", "page_size": 5})
+    response = authenticated_client.get(f"{url}?page_size=5&platform=linkedin")
+
+    assert response["X-Cache"] == "HIT"
+
+
+def test_cache_key_includes_query_parameters(authenticated_client):
+    JobPostingFactory(platform="linkedin")
+    url = reverse("job-posting-list")
+
+    authenticated_client.get(url, {"platform": "linkedin"})
+    response = authenticated_client.get(url, {"platform": "indeed"})
+
+    assert response["X-Cache"] == "MISS"
+    assert response.data["count"] == 0
+
+
+def test_cache_key_includes_user(authenticated_client):
+    JobPostingFactory()
+    url = reverse("job-posting-list")
+    other_client = APIClient()
+    other_client.force_authenticate(
+        user=get_user_model().objects.create_user(username="other")  # type: ignore[attr-defined]
+    )
+
+    authenticated_client.get(url)
+    response = other_client.get(url)
+
+    assert response["X-Cache"] == "MISS"
+
+
+@pytest.mark.parametrize("method", ["post", "put", "delete"])
+def test_writes_invalidate_cached_list(authenticated_client, method):
+    job_posting = JobPostingFactory()
+    list_url = reverse("job-posting-list")
+    detail_url = reverse("job-posting-detail", args=[job_posting.id])
+    payload = {"title": "Staff Engineer", "company": "ACME", "location": "Paris"}
+
+    authenticated_client.get(list_url)
+
+    if method == "post":
+        authenticated_client.post(list_url, payload, format="json")
+    elif method == "put":
+        authenticated_client.put(detail_url, payload, format="json")
+    else:
+        authenticated_client.delete(detail_url)
+
+    response = authenticated_client.get(list_url)
+
+    assert response["X-Cache"] == "MISS"
+
+
+def test_bulk_writes_invalidate_cached_list(authenticated_client):
+    list_url = reverse("job-posting-list")
+    authenticated_client.get(list_url)
+
+    authenticated_client.post(
+        reverse("job-posting-bulk"),
+        [{"title": "Staff Engineer", "company": "ACME", "location": "Paris"}],
+        format="json",
+    )
+    response = authenticated_client.get(list_url)
+
+    assert response["X-Cache"] == "MISS"
+    assert response.data["count"] == 1
+
+
+def test_candidacy_writes_invalidate_cached_postings(authenticated_client):
+    job_posting = JobPostingFactory()
+    list_url = reverse("job-posting-list")
+    authenticated_client.get(list_url)
+
+    candidacy = JobCandidacyFactory(job_posting=job_posting)
+    response = authenticated_client.get(list_url)
+
+    assert response.data["results"][0]["candidacy_id"] == str(candidacy.id)
+
+
+def test_queryset_updates_require_explicit_bump(authenticated_client):
+    job_posting = JobPostingFactory(title="Old title")
+    url = reverse("job-posting-detail", args=[job_posting.id])
+    authenticated_client.get(url)
+
+    JobPosting.objects.update(title="New title")
+    stale = authenticated_client.get(url)
+    bump_model_version(JobPosting)
+    fresh = authenticated_client.get(url)
+
+    assert stale.data["title"] == "Old title"
+    assert fresh.data["title"] == "New title"
+
+
+def test_writes_bump_versions_again_on_commit(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        JobPostingFactory()
+        # Responses cached by other transactions before the commit used
+        # this version, from rows without the new posting.
+        before_commit = get_model_versions([JobPosting])
+
+    assert get_model_versions([JobPosting]) != before_commit
+
+
+def test_response_cache_can_be_disabled(authenticated_client, settings):
+    settings.API_RESPONSE_CACHE_TIMEOUT = 0
+    url = reverse("job-posting-list")
+
+    authenticated_client.get(url)
+    response = authenticated_client.get(url)
+
+    assert "X-Cache" not in response
+
+
+def test_error_responses_are_not_cached(authenticated_client):
+    url = reverse("job-posting-detail", args=["00000000-0000-0000-0000-000000000000"])
+
+    authenticated_client.get(url)
+    response = authenticated_client.get(url)
+
+    assert response.status_code == 404
+    assert get_response_cache_stats(["job-posting"]) == {
+        "job-posting": {"hits": 0, "misses": 2}
+    }
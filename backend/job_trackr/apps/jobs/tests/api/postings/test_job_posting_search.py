@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_search.py
+
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from apps.common.search import build_search_query
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def get_result_ids(response) -> list[str]:
+    assert response.status_code == 200
+    return [item["id"] for item in response.data["results"]]
+
+
+def test_search_ranks_title_matches_above_description_matches(authenticated_client):
+    description_match = JobPostingFactory(
+        title="Backend Engineer",
+        description="Our stack is Django and Python.",
+        posted_on=date(2026, 7, 2),
+    )
+    title_match = JobPostingFactory(
+        title="Python Developer",
+        posted_on=date(2026, 7, 1),
+    )
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"search": "python"},
+    )
+
+    assert get_result_ids(response) == [str(title_match.id), str(description_match.id)]
+
+
+def test_search_matches_word_prefixes(authenticated_client):
+    matching = JobPostingFactory(title="Développeur Django")
+    JobPostingFactory(title="Data Analyst")
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"search": "dével"},
+    )
+
+    assert get_result_ids(response) == [str(matching.id)]
+
+
+def test_search_requires_every_term_to_match(authenticated_client):
+    matching = JobPostingFactory(title="Python Developer", location="Lyon")
+    JobPostingFactory(title="Python Developer", location="Paris")
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"search": "python lyon"},
+    )
+
+    assert get_result_ids(response) == [str(matching.id)]
+
+
+def test_search_ignores_tsquery_syntax_in_user_input(authenticated_client):
+    matching = JobPostingFactory(company="C&A")
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"search": "c & a !:*"},
+    )
+
+    assert get_result_ids(response) == [str(matching.id)]
+
+
+def test_search_keeps_explicit_ordering(authenticated_client):
+    title_match = JobPostingFactory(
+        title="Python Developer",
+        posted_on=date(2026, 7, 1),
+    )
+    description_match = JobPostingFactory(
+        description="Python",
+        posted_on=date(2026, 7, 2),
+    )
+
+    response = authenticated_client.get(
+        reverse("job-posting-list"),
+        {"search": "python", "ordering": "-posted_on"},
+    )
+
+    assert get_result_ids(response) == [str(description_match.id), str(title_match.id)]
+
+
+def test_search_on_candidacies_matches_notes_and_job_posting(authenticated_client):
+    by_notes = JobCandidacyFactory(notes="Recruiter mentioned Kubernetes.")
+    by_posting = JobCandidacyFactory(
+        job_posting__title="Kubernetes Platform Engineer",
+        notes="",
+    )
+    JobCandidacyFactory(notes="Nothing relevant.")
+
+    response = authenticated_client.get(
+        reverse("job-candidacy-list"),
+        {"search": "kubernetes"},
+    )
+
+    assert get_result_ids(response) == [str(by_posting.id), str(by_notes.id)]
+
+
+@pytest.mark.parametrize("terms", [[], [""], ["  ", "!!"]])
+def test_build_search_query_returns_none_without_words(terms):
+    assert build_search_query(terms) is None
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/postings/test_job_posting_write_queries.py
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+PAYLOAD = {
+    "title": "Backend Engineer",
+    "company": "ACME",
+    "location": "Paris",
+    "url": "https://example.com/jobs/1",
+    "description": "Django and PostgreSQL. " * 20,
+}
+
+
+def test_create_does_not_refetch(authenticated_client):
+    with CaptureQueriesContext(connection) as queries:
+        response = authenticated_client.post(
+            reverse("job-posting-list"), PAYLOAD, format="json"
+        )
+
+    sql = [query["sql"] for query in queries]
+
+    assert response.status_code == status.HTTP_201_CREATED
+    # Duplicate URL check, INSERT.
+    assert len(sql) == 2
+    assert not any(
+        statement.startswith('SELECT "job_posting"."id"') for statement in sql
+    )
+    assert response.data["candidacy_id"] is None
+    assert response.data["description_preview"].endswith("…")
+
+
+@pytest.mark.parametrize("method", ["put", "patch"])
+def test_update_does_not_refetch(
+    authenticated_client,
+    django_assert_num_queries,
+    method,
+):
+    job_posting = JobPostingFactory(description="Old description")
+    candidacy = JobCandidacyFactory(job_posting=job_posting)
+
+    # Object lookup, duplicate URL check, UPDATE, signature delete.
+    with django_assert_num_queries(4):
+        response = getattr(authenticated_client, method)(
+            reverse("job-posting-detail", args=[job_posting.id]),
+            PAYLOAD,
+            format="json",
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["candidacy_id"] == str(candidacy.id)
+    assert response.data["description"] == PAYLOAD["description"].strip()
+    # Recomputed from the new description, not the annotated one.
+    assert response.data["description_preview"].startswith("Django")
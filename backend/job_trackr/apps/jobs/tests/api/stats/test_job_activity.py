@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/stats/test_job_activity.py
+
+from datetime import date, timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.jobs.activity.rollups import refresh_activity_rollups
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("job-activity")
+
+
+def test_activity_reads_weekly_rollups(authenticated_client):
+    today = timezone.localdate()
+    JobCandidacyFactory(
+        applied_on=today,
+        job_posting__platform="linkedin",
+        job_posting__posted_on=today,
+    )
+    # Older than the default 12 months.
+    JobCandidacyFactory(applied_on=today - timedelta(days=500))
+    refresh_activity_rollups()
+
+    response = authenticated_client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["period"] == "week"
+    assert response.data["since"].weekday() == 0
+    assert response.data["results"] == [
+        {
+            "period_start": today - timedelta(days=today.weekday()),
+            "kind": kind,
+            "platform": "linkedin",
+            "status": candidacy_status,
+            "count": 1,
+        }
+        for kind, candidacy_status in [("applied", "applied"), ("posted", "")]
+    ]
+
+
+def test_activity_by_day(authenticated_client):
+    response = authenticated_client.get(URL, {"period": "day", "months": "1"})
+
+    today = timezone.localdate()
+    first_of_month = date(today.year, today.month, 1)
+    assert response.data["since"] == (first_of_month - timedelta(days=1)).replace(day=1)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"period": "month"}, {"months": "0"}, {"months": "61"}, {"months": "a"}],
+)
+def test_activity_rejects_invalid_parameters(authenticated_client, params):
+    response = authenticated_client.get(URL, params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_activity_requires_authentication(api_client):
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/stats/test_job_stats.py
+
+from datetime import date
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("job-stats")
+
+
+@pytest.fixture
+def candidacies():
+    return [
+        JobCandidacyFactory(
+            status=CandidacyStatus.APPLIED,
+            applied_on=date(2026, 3, 2),
+            job_posting__platform="linkedin",
+            job_posting__work_mode="remote",
+            job_posting__employment_type="full_time",
+        ),
+        JobCandidacyFactory(
+            status=CandidacyStatus.INTERVIEW,
+            applied_on=date(2026, 3, 8),
+            job_posting__platform="linkedin",
+            job_posting__work_mode="hybrid",
+            job_posting__employment_type="full_time",
+        ),
+        JobCandidacyFactory(
+            status=CandidacyStatus.REJECTED,
+            applied_on=date(2026, 3, 9),
+            job_posting__platform="",
+            job_posting__work_mode="remote",
+            job_posting__employment_type="freelance",
+        ),
+    ]
+
+
+def by_value(buckets):
+    return {bucket["value"]: bucket for bucket in buckets}
+
+
+def test_stats_counts_by_dimension(authenticated_client, candidacies):
+    response = authenticated_client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.data["count"] == 3
+    assert response.data["statuses"]["interview"] == 1
+
+    statuses = by_value(response.data["by_status"])
+    assert [bucket["value"] for bucket in response.data["by_status"]] == (
+        CandidacyStatus.values
+    )
+    assert statuses["applied"]["count"] == 1
+    assert statuses["offer"]["count"] == 0
+
+    platforms = by_value(response.data["by_platform"])
+    assert platforms["linkedin"]["count"] == 2
+    assert platforms["linkedin"]["statuses"]["interview"] == 1
+    assert platforms["indeed"]["count"] == 0
+    # Values outside the choices come last.
+    assert response.data["by_platform"][-1]["value"] == ""
+    assert platforms[""]["statuses"]["rejected"] == 1
+
+    assert by_value(response.data["by_work_mode"])["remote"]["count"] == 2
+    assert by_value(response.data["by_employment_type"])["full_time"]["count"] == 2
+
+
+def test_stats_counts_by_iso_week(authenticated_client, candidacies):
+    response = authenticated_client.get(URL)
+
+    assert [
+        (week["week"], week["start"], week["count"])
+        for week in response.data["by_week"]
+    ] == [
+        ("2026-W10", date(2026, 3, 2), 2),
+        ("2026-W11", date(2026, 3, 9), 1),
+    ]
+    assert response.data["by_week"][1]["statuses"]["rejected"] == 1
+
+
+def test_stats_without_candidacies(authenticated_client):
+    response = authenticated_client.get(URL)
+
+    assert response.data["count"] == 0
+    assert response.data["updated_at"] is None
+    assert response.data["by_week"] == []
+    assert all(bucket["count"] == 0 for bucket in response.data["by_platform"])
+
+
+def test_stats_are_cached_until_a_write(
+    authenticated_client,
+    candidacies,
+    django_assert_num_queries,
+):
+    with django_assert_num_queries(1):
+        authenticated_client.get(URL)
+
+    with django_assert_num_queries(0):
+        response = authenticated_client.get(URL)
+
+    assert response.data["count"] == 3
+
+    candidacies[0].delete()
+
+    assert authenticated_client.get(URL).data["count"] == 2
+
+
+def test_stats_answer_not_modified(authenticated_client, candidacies):
+    response = authenticated_client.get(URL)
+
+    assert response["Last-Modified"]
+    response = authenticated_client.get(URL, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_stats_require_authentication(api_client):
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/test_benchmark_api.py
+
+from io import StringIO
+
+import orjson
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+
+from apps.jobs.benchmarks import scenarios
+from apps.jobs.benchmarks.dataset import seed_dataset
+from apps.jobs.benchmarks.scenarios import build_scenarios
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.demo_data.rows import COMPANIES
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def _benchmark(baseline, **options):
+    stdout = StringIO()
+    call_command(
+        "benchmark_api",
+        postings=60,
+        repeat=1,
+        baseline=baseline,
+        stdout=stdout,
+        **options,
+    )
+    return stdout.getvalue()
+
+
+def test_seed_dataset_is_deterministic():
+    def rows():
+        seed_dataset(40, seed=3)
+        postings = list(
+            JobPosting.objects.order_by("url").values_list(
+                "url", "title", "company", "platform", "posted_on", "normalized_company"
+            )
+        )
+        candidacies = list(
+            JobCandidacy.objects.order_by("job_posting__url").values_list(
+                "job_posting__url", "status", "applied_on"
+            )
+        )
+        JobPosting.objects.all().delete()
+        return postings, candidacies
+
+    postings, candidacies = rows()
+
+    assert len(postings) == 40
+    assert candidacies
+    assert {company for *_, company in postings} <= {c.lower() for c in COMPANIES}
+    assert rows() == (postings, candidacies)
+
+
+def test_seed_dataset_records_status_histories():
+    seed_dataset(40, seed=1, candidacy_ratio=1)
+
+    for candidacy in JobCandidacy.objects.prefetch_related("status_events"):
+        events = list(candidacy.status_events.all())
+        assert events[0].status == "applied"
+        assert events[-1].status == candidacy.status
+
+    assert CandidacyStatusEvent.objects.count() >= JobCandidacy.objects.count() == 40
+
+
+def test_every_filter_has_a_scenario():
+    names = {
+        scenario.name for scenario in build_scenarios(posting_id="1", candidacy_id="2")
+    }
+
+    assert "postings filter has_candidacy" in names
+    assert "candidacies filter work_mode" in names
+    assert "postings ordering -platform" in names
+
+
+def test_filter_without_benchmark_value(monkeypatch):
+    values = dict(scenarios.CANDIDACY_FILTER_VALUES)
+    del values["status"]
+    monkeypatch.setattr(scenarios, "CANDIDACY_FILTER_VALUES", values)
+
+    with pytest.raises(ImproperlyConfigured, match="candidacies filters: status"):
+        build_scenarios(posting_id="1", candidacy_id="2")
+
+
+def test_benchmark_api_records_and_compares_baseline(tmp_path):
+    baseline = tmp_path / "baseline.json"
+
+    output = _benchmark(baseline, update_baseline=True)
+
+    assert "Baseline written" in output
+    recorded = orjson.loads(baseline.read_bytes())
+    assert recorded["dataset"] == {"postings": 60, "candidacy_ratio": 0.5, "seed": 0}
+    assert recorded["scenarios"]["postings list"]["queries"] > 0
+    assert "candidacies filter status" in recorded["scenarios"]
+
+    # The seeded rows are rolled back.
+    assert not JobPosting.objects.exists()
+
+    output = _benchmark(baseline, scenario=["stats"], threshold=10, min_delta_ms=1_000)
+
+    assert "stats: " in output
+    assert "postings list" not in output
+    assert "REGRESSED" not in output
+
+
+def test_benchmark_api_fails_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    _benchmark(baseline, update_baseline=True, scenario=["postings list"])
+
+    recorded = orjson.loads(baseline.read_bytes())
+    recorded["scenarios"]["postings list"] = {"median_ms": 0.001, "queries": 0}
+    baseline.write_bytes(orjson.dumps(recorded))
+
+    with pytest.raises(CommandError, match="1 scenario\\(s\\) regressed"):
+        _benchmark(baseline, scenario=["postings list"], min_delta_ms=0)
+
+
+def test_benchmark_api_rejects_baseline_of_other_dataset(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    _benchmark(baseline, update_baseline=True, scenario=["stats"])
+
+    with pytest.raises(CommandError, match="another dataset"):
+        _benchmark(baseline, scenario=["stats"], seed=1)
+
+
+def test_benchmark_api_requires_empty_database(tmp_path):
+    JobPostingFactory()
+
+    with pytest.raises(CommandError, match="empty database"):
+        _benchmark(tmp_path / "baseline.json")
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/test_benchmark_db_connections.py
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+
+# Connections are closed between requests: the rows must be committed.
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_db_connections():
+    JobCandidacyFactory.create_batch(3)
+    settings_dict = connection.settings_dict
+    stdout = StringIO()
+
+    call_command("benchmark_db_connections", repeat=2, stdout=stdout)
+
+    output = stdout.getvalue()
+    assert "postings list: new connection" in output
+    assert "candidacies list: new connection" in output
+    assert "persistent" in output
+    assert "pool" in output
+    assert connection.settings_dict is settings_dict
+    assert connection.pool is None
+
+
+@pytest.mark.django_db
+def test_benchmark_db_connections_inside_a_transaction():
+    with pytest.raises(CommandError, match="inside a transaction"):
+        call_command("benchmark_db_connections", repeat=1)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_db_connections_without_rows():
+    with pytest.raises(CommandError, match="seed_demo_jobs"):
+        call_command("benchmark_db_connections", repeat=1)
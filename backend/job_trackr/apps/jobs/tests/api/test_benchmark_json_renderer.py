@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/test_benchmark_json_renderer.py
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_benchmark_json_renderer():
+    JobCandidacyFactory.create_batch(3, notes="Notes " * 50)
+    stdout = StringIO()
+
+    call_command("benchmark_json_renderer", page_size=10, repeat=2, stdout=stdout)
+
+    output = stdout.getvalue()
+    assert "job postings render: 3 rows" in output
+    assert "job candidacies parse: 3 rows" in output
+
+
+def test_benchmark_json_renderer_without_rows():
+    with pytest.raises(CommandError, match="seed_demo_jobs"):
+        call_command("benchmark_json_renderer", repeat=1)
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/test_benchmark_list_serializers.py
+
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_benchmark_list_serializers():
+    JobCandidacyFactory.create_batch(3, notes="Notes " * 50)
+    stdout = StringIO()
+
+    call_command("benchmark_list_serializers", rows=10, repeat=2, stdout=stdout)
+
+    output = stdout.getvalue()
+    assert "job postings: 3 rows" in output
+    assert "job candidacies: 3 rows" in output
+    assert "faster" in output
+
+
+def test_benchmark_list_serializers_without_rows():
+    with pytest.raises(CommandError, match="seed_demo_jobs"):
+        call_command("benchmark_list_serializers", repeat=1)
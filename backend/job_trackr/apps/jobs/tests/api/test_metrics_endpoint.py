@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/test_metrics_endpoint.py
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.common.metrics import CONTENT_TYPE
+
+pytestmark = pytest.mark.django_db
+
+URL = reverse("metrics")
+
+
+def test_metrics_per_viewset_action(authenticated_client, api_client):
+    authenticated_client.get(reverse("job-posting-list"))
+
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == CONTENT_TYPE
+
+    body = response.content.decode()
+    assert (
+        'jobtrackr_http_requests_total{endpoint="job-posting:list",'
+        'method="GET",status="200"}'
+    ) in body
+    assert (
+        'jobtrackr_http_request_duration_seconds_bucket{endpoint="job-posting:list",'
+        'method="GET",le="+Inf"}'
+    ) in body
+    assert "# TYPE jobtrackr_http_request_queries histogram" in body
+
+
+def test_metrics_export_response_cache_lookups(authenticated_client, api_client):
+    authenticated_client.get(reverse("job-candidacy-list"))
+    authenticated_client.get(reverse("job-candidacy-list"))
+
+    body = api_client.get(URL).content.decode()
+
+    for outcome in ("hit", "miss"):
+        assert (
+            'jobtrackr_response_cache_lookups_total{scope="job-candidacy",'
+            f'outcome="{outcome}"}}'
+        ) in body
+
+
+def test_metrics_are_only_served_locally(api_client, settings):
+    settings.METRICS_ALLOWED_IPS = ["10.0.0.1"]
+
+    response = api_client.get(URL)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.parametrize(
+    ("authorization", "status_code"),
+    [
+        (None, status.HTTP_404_NOT_FOUND),
+        ("Bearer wrong-token", status.HTTP_404_NOT_FOUND),
+        ("Bearer scrape-token", status.HTTP_200_OK),
+    ],
+)
+def test_metrics_token_replaces_address_check(
+    api_client, settings, authorization, status_code
+):
+    # Behind a reverse proxy, every client has the proxy's local address.
+    settings.METRICS_TOKEN = "scrape-token"
+    extra = {} if authorization is None else {"HTTP_AUTHORIZATION": authorization}
+
+    response = api_client.get(URL, **extra)
+
+    assert response.status_code == status_code
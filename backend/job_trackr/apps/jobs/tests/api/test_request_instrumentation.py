@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/api/test_request_instrumentation.py
+
+import logging
+import re
+
+import pytest
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import reverse
+
+from apps.common.instrumentation import (
+    RequestInstrumentationMiddleware,
+    current_timings,
+    serialization_timer,
+)
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+LOGGER = "apps.common.instrumentation"
+
+SERVER_TIMING_RE = re.compile(
+    r'^db;dur=[\d.]+;desc="(?P<queries>\d+) queries", '
+    r"serialize;dur=[\d.]+, total;dur=[\d.]+$"
+)
+
+
+def test_server_timing_counts_queries(
+    authenticated_client,
+    django_assert_num_queries,
+):
+    JobCandidacyFactory.create_batch(3)
+
+    with django_assert_num_queries(2) as captured:
+        response = authenticated_client.get(reverse("job-candidacy-list"))
+
+    match = SERVER_TIMING_RE.match(response["Server-Timing"])
+    assert match is not None
+    assert int(match["queries"]) == len(captured)
+
+
+def test_server_timing_can_be_disabled(authenticated_client, settings):
+    settings.API_SERVER_TIMING = False
+
+    response = authenticated_client.get(reverse("job-stats"))
+
+    assert "Server-Timing" not in response
+
+
+def test_requests_over_budget_are_logged(authenticated_client, settings, caplog):
+    settings.API_REQUEST_BUDGETS = {"job-posting:list": {"queries": 0}}
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER):
+        authenticated_client.get(reverse("job-posting-list"))
+
+    [record] = caplog.records
+    assert record.endpoint == "job-posting:list"
+    assert "GET /api/v1/jobs/postings/ (job-posting:list): queries" in (
+        record.getMessage()
+    )
+
+
+def test_budgets_fall_back_to_url_names_and_default(
+    authenticated_client,
+    settings,
+    caplog,
+):
+    settings.API_REQUEST_BUDGET = {"queries": 0}
+    settings.API_REQUEST_BUDGETS = {"job-stats": {"queries": 10}}
+
+    with caplog.at_level(logging.WARNING, logger=LOGGER):
+        authenticated_client.get(reverse("job-stats"))
+        authenticated_client.get(reverse("job-posting-list"))
+
+    assert [record.endpoint for record in caplog.records] == ["job-posting:list"]
+
+
+def test_requests_within_budget_are_not_logged(authenticated_client, caplog):
+    with caplog.at_level(logging.WARNING, logger=LOGGER):
+        authenticated_client.get(reverse("job-candidacy-list"))
+
+    assert not caplog.records
+
+
+def test_serialization_time_excludes_sql():
+    def view(request):
+        with serialization_timer(), connection.cursor() as cursor:
+            cursor.execute("SELECT pg_sleep(0.05)")
+
+        timings = current_timings()
+        assert timings is not None
+        assert timings.queries == 1
+        assert timings.sql >= 0.05
+        assert timings.serialization < 0.05
+        return HttpResponse()
+
+    middleware = RequestInstrumentationMiddleware(view)
+    response = middleware(RequestFactory().get("/"))
+
+    assert current_timings() is None
+    assert 'desc="1 queries"' in response["Server-Timing"]
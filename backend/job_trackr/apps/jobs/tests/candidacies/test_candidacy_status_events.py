@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/candidacies/test_candidacy_status_events.py
+
+import pytest
+
+from apps.jobs.candidacies.choices import CandidacyStatus
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.candidacies.status import bulk_set_status
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def statuses(candidacy):
+    return list(candidacy.status_events.values_list("status", flat=True))
+
+
+def test_creation_records_initial_status():
+    candidacy = JobCandidacyFactory(status=CandidacyStatus.INTERVIEW)
+
+    event = candidacy.status_events.get()
+    assert event.status == CandidacyStatus.INTERVIEW
+    assert event.occurred_at == candidacy.updated_at
+
+
+def test_status_change_records_event():
+    candidacy = JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+    candidacy = JobCandidacy.objects.get(pk=candidacy.pk)
+
+    candidacy.status = CandidacyStatus.OFFER
+    candidacy.save()
+
+    assert statuses(candidacy) == ["applied", "offer"]
+
+
+def test_saves_without_status_change_record_nothing():
+    candidacy = JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+    candidacy = JobCandidacy.objects.get(pk=candidacy.pk)
+
+    candidacy.notes = "Called back."
+    candidacy.save()
+    JobCandidacy.objects.only("notes").get(pk=candidacy.pk).save()
+
+    assert statuses(candidacy) == ["applied"]
+
+
+def test_update_fields_status_change_records_event():
+    candidacy = JobCandidacyFactory(status=CandidacyStatus.APPLIED)
+
+    candidacy.status = CandidacyStatus.REJECTED
+    candidacy.save(update_fields=["notes"])
+    assert statuses(candidacy) == ["applied"]
+
+    candidacy.save(update_fields=["status"])
+    candidacy.refresh_from_db()
+
+    event = candidacy.status_events.last()
+    assert statuses(candidacy) == ["applied", "rejected"]
+    assert event.occurred_at == candidacy.updated_at
+
+
+def test_bulk_status_change_records_events():
+    candidacies = JobCandidacyFactory.create_batch(2, status=CandidacyStatus.APPLIED)
+    unchanged = JobCandidacyFactory(status=CandidacyStatus.WITHDRAWN)
+
+    ids = bulk_set_status(JobCandidacy.objects.all(), CandidacyStatus.WITHDRAWN)
+
+    assert sorted(ids) == sorted(candidacy.pk for candidacy in candidacies)
+    for candidacy in candidacies:
+        candidacy.refresh_from_db()
+        event = candidacy.status_events.last()
+        assert statuses(candidacy) == ["applied", "withdrawn"]
+        assert event.occurred_at == candidacy.updated_at
+    assert statuses(unchanged) == ["withdrawn"]
+
+
+def test_events_are_append_only():
+    event = JobCandidacyFactory().status_events.get()
+    event.status = CandidacyStatus.OFFER
+
+    with pytest.raises(ValueError, match="append-only"):
+        event.save()
+
+    assert CandidacyStatusEvent.objects.get().status == CandidacyStatus.APPLIED
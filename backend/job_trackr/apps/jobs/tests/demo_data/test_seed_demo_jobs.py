@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/demo_data/test_seed_demo_jobs.py
+
+from collections import Counter
+from datetime import UTC, date, datetime
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.demo_data import rows
+from apps.jobs.demo_data.rows import ChunkTask, generate_chunk, has_candidacy
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.postings.normalization import apply_normalization
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def debug(settings):
+    settings.DEBUG = True
+
+
+def _seed(**options):
+    stdout = StringIO()
+    call_command("seed_demo_jobs", stdout=stdout, **options)
+    return stdout.getvalue()
+
+
+def _task(**fields):
+    return ChunkTask(
+        **{
+            "seed": 0,
+            "start": 0,
+            "stop": 2_000,
+            "postings": 2_000,
+            "candidacies": 1_000,
+            "anchor": date(2026, 1, 1),
+            "now": datetime(2026, 1, 1, 12, tzinfo=UTC),
+            **fields,
+        }
+    )
+
+
+def _columns(data, *skipped):
+    """COPY text rows without the `skipped` columns (generated ids)."""
+    return [
+        [value for index, value in enumerate(line.split("\t")) if index not in skipped]
+        for line in data.decode().splitlines()
+    ]
+
+
+def test_seed_demo_jobs():
+    output = _seed(postings=120, candidacies=45)
+
+    assert "Created 120 job postings, 45 candidacies" in output
+    assert "rows/s" in output
+    assert JobPosting.objects.count() == 120
+    assert JobCandidacy.objects.count() == 45
+
+    for candidacy in JobCandidacy.objects.prefetch_related("status_events"):
+        events = list(candidacy.status_events.all())
+        assert events[0].status == "applied"
+        assert events[-1].status == candidacy.status
+
+    # Normalized fields match what save() computes.
+    for posting in JobPosting.objects.all()[:20]:
+        normalized = (
+            posting.normalized_title,
+            posting.normalized_company,
+            posting.normalized_url,
+        )
+        apply_normalization(posting)
+        assert normalized == (
+            posting.normalized_title,
+            posting.normalized_company,
+            posting.normalized_url,
+        )
+
+
+def test_seed_demo_jobs_rejects_existing_seed():
+    _seed(postings=10, candidacies=0, seed=4)
+
+    with pytest.raises(CommandError, match="seed 4 already exist"):
+        _seed(postings=10, candidacies=0, seed=4)
+
+    _seed(postings=10, candidacies=0, seed=5)
+    assert JobPosting.objects.count() == 20
+
+
+@pytest.mark.django_db(transaction=True)
+def test_seed_demo_jobs_with_workers():
+    _seed(postings=2_500, candidacies=1_000, workers=2)
+
+    assert JobPosting.objects.count() == 2_500
+    assert JobCandidacy.objects.count() == 1_000
+    assert CandidacyStatusEvent.objects.count() >= 1_000
+
+
+def test_seed_demo_jobs_requires_debug(settings):
+    settings.DEBUG = False
+
+    with pytest.raises(CommandError, match="DEBUG=True"):
+        _seed()
+
+
+def test_generated_rows_are_deterministic():
+    first, second = generate_chunk(_task()), generate_chunk(_task())
+
+    assert _columns(first.postings, 0) == _columns(second.postings, 0)
+    assert _columns(first.candidacies, 0, 1) == _columns(second.candidacies, 0, 1)
+    assert _columns(first.status_events, 0, 1) == _columns(second.status_events, 0, 1)
+    assert _columns(generate_chunk(_task(seed=1)).postings, 0) != _columns(
+        first.postings, 0
+    )
+
+
+def test_generated_distributions_are_skewed():
+    chunk = generate_chunk(_task(stop=10_000, postings=10_000, candidacies=5_000))
+    postings = _columns(chunk.postings)
+    platforms = Counter(row[rows.POSTING_COLUMNS.index("platform")] for row in postings)
+    companies = Counter(row[rows.POSTING_COLUMNS.index("company")] for row in postings)
+    statuses = Counter(
+        row[rows.CANDIDACY_COLUMNS.index("status")]
+        for row in _columns(chunk.candidacies)
+    )
+
+    assert [platform for platform, _ in platforms.most_common()] == list(rows.PLATFORMS)
+    assert companies[rows.COMPANIES[0]] > 10 * companies[rows.COMPANIES[-1]]
+    assert [status for status, _ in statuses.most_common(2)] == [
+        "applied",
+        "rejected",
+    ]
+
+
+def test_candidacies_are_spread_evenly():
+    flags = [has_candidacy(index, postings=10, candidacies=4) for index in range(10)]
+
+    assert sum(flags) == 4
+    assert flags != sorted(flags, reverse=True)
+
+
+def test_vocabularies_need_no_copy_escaping():
+    values = [
+        *rows.SENIORITIES,
+        *rows.ROLES,
+        *rows.LOCATIONS,
+        *rows.COMPANIES,
+        *rows.DESCRIPTION_ENDINGS,
+        *rows.NOTES,
+    ]
+
+    assert not any(char in value for value in values for char in "\\\t\n\r")
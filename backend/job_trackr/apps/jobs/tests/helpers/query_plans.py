@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/helpers/query_plans.py
+
+import json
+from collections.abc import Iterator
+from string import ascii_lowercase
+from typing import Any
+
+from django.db import connection
+from django.db.models import QuerySet
+
+from apps.jobs.postings.models import JobPosting
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli"]
+TITLES = ["Backend Engineer", "Data Analyst", "Frontend Developer", "SRE"]
+LOCATIONS = ["Paris", "Lyon", "Nantes", "Bordeaux", "Lille", "Remote"]
+
+
+def pseudo_word(n: int, length: int = 6) -> str:
+    """Deterministic, evenly spread lowercase word for seed number `n`."""
+    value = (n * 2_654_435_761) % len(ascii_lowercase) ** length
+    letters = []
+
+    for _ in range(length):
+        value, index = divmod(value, len(ascii_lowercase))
+        letters.append(ascii_lowercase[index])
+
+    return "".join(letters)
+
+
+def seeded_job_posting_fields(n: int) -> dict[str, str]:
+    """
+    Text fields of the `n`-th seeded posting.
+
+    A pseudo-random word is appended to every value so that substring filters
+    are selective, like they are on real titles, companies and locations.
+    """
+    return {
+        "title": f"{TITLES[n % len(TITLES)]} {pseudo_word(n)}",
+        "company": f"{COMPANIES[n % len(COMPANIES)]} {pseudo_word(n + 1)}",
+        "location": f"{LOCATIONS[n % len(LOCATIONS)]} {pseudo_word(n + 2)}",
+    }
+
+
+def seed_job_postings(count: int) -> None:
+    """
+    Insert `count` deterministic postings and refresh planner statistics.
+
+    The table is vacuumed, as autovacuum would do in production, to flush the
+    GIN pending lists filled by the bulk insert. This cannot run inside a
+    transaction, so call it from a fixture that unblocks the database outside
+    of the per-test transaction.
+    """
+    JobPosting.objects.bulk_create(
+        (JobPosting(**seeded_job_posting_fields(n)) for n in range(count)),
+        batch_size=5_000,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"VACUUM ANALYZE {JobPosting._meta.db_table}")
+
+
+def explain(queryset: QuerySet[Any]) -> dict[str, Any]:
+    plan: dict[str, Any] = json.loads(queryset.explain(format="json"))[0]["Plan"]
+    return plan
+
+
+def iter_plan_nodes(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield plan
+
+    for child in plan.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def assert_no_seq_scan(queryset: QuerySet[Any]) -> None:
+    """Fail if the planner reads the queryset's table with a sequential scan."""
+    table = queryset.model._meta.db_table
+    plan = explain(queryset)
+
+    seq_scans = [
+        node
+        for node in iter_plan_nodes(plan)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == table
+    ]
+
+    assert not seq_scans, f"Sequential scan on {table!r}:\n{json.dumps(plan, indent=2)}"
@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/imports/test_import_jobs.py
+
+from datetime import date
+from io import StringIO
+
+import orjson
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.jobs.candidacies.models import CandidacyStatusEvent, JobCandidacy
+from apps.jobs.postings.dedupe import index_postings
+from apps.jobs.postings.models import JobPosting, JobPostingSignature
+from apps.jobs.postings.normalization import NORMALIZED_FIELDS, apply_normalization
+from apps.jobs.tests.factories.job_candidacy import JobCandidacyFactory
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+HEADER = "title,company,location,url,easy_apply,posted_on,platform,status,notes"
+
+
+def _import(tmp_path, content, *, name="jobs.csv", **options):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    stdout = StringIO()
+    call_command("import_jobs", str(path), stdout=stdout, **options)
+    return stdout.getvalue()
+
+
+def test_import_csv_creates_postings_and_candidacies(tmp_path):
+    output = _import(
+        tmp_path,
+        "﻿Title, Company ,location,url,easy_apply,posted_on,platform,status,"
+        "notes,source\n"
+        "  Développeur  Backend ,ACME Corp.,Paris,HTTPS://Jobs.Example.COM/1/,"
+        'yes,2026-01-02,linkedin,interview,"Met the team,\nthen the CTO",x\n'
+        "Data Engineer,Nova,Lyon,,0,,,,,y\n",
+    )
+
+    assert "Ignored columns: source." in output
+    assert "Imported 2 of 2 rows, 0 rejected" in output
+    assert "rows/s" in output
+
+    posting = JobPosting.objects.get(company="ACME Corp.")
+    assert posting.title == "Développeur  Backend"
+    assert posting.easy_apply is True
+    assert posting.posted_on == date(2026, 1, 2)
+
+    expected = JobPosting(title=posting.title, company=posting.company, url=posting.url)
+    apply_normalization(expected)
+    for field in NORMALIZED_FIELDS:
+        assert getattr(posting, field) == getattr(expected, field)
+
+    candidacy = JobCandidacy.objects.get()
+    assert candidacy.job_posting == posting
+    assert candidacy.status == "interview"
+    assert candidacy.notes == "Met the team,\nthen the CTO"
+    assert list(candidacy.status_events.values_list("status", flat=True)) == [
+        "interview"
+    ]
+
+    other = JobPosting.objects.get(company="Nova")
+    assert other.normalized_url is None
+    assert other.easy_apply is False
+    assert not hasattr(other, "candidacy")
+
+
+def test_import_reports_rejected_rows(tmp_path):
+    rejects = tmp_path / "rejects.ndjson"
+    output = _import(
+        tmp_path,
+        f"{HEADER}\n"
+        "Backend,Acme,Paris,https://example.com/1,,,,,\n"
+        ",Acme,Paris,example.com,maybe,2026-02-30,myspace,hired,\n"
+        "Backend,Acme,Paris,https://EXAMPLE.com/1/,,,,,\n"
+        f"{'x' * 256},Acme,Paris,,,,,,\n",
+        rejects=rejects,
+    )
+
+    assert "Imported 1 of 4 rows, 3 rejected" in output
+    assert (
+        "Line 3: title: This field is required.; url: Enter a valid URL.; "
+        "easy_apply: Must be a valid boolean.; "
+        'platform: "myspace" is not a valid choice.; '
+        "posted_on: Date has wrong format." in output
+    )
+    assert "Line 4: url: This URL appears more than once in the file." in output
+    assert "Line 5: title: Ensure this field has no more than 255 characters." in output
+
+    lines = [orjson.loads(line) for line in rejects.read_bytes().splitlines()]
+    assert [line["line"] for line in lines] == [3, 4, 5]
+    assert 'status: "hired" is not a valid choice.' in lines[0]["errors"]
+
+    assert list(JobPosting.objects.values_list("url", flat=True)) == [
+        "https://example.com/1"
+    ]
+
+
+def test_import_updates_postings_by_normalized_url(tmp_path):
+    changed = JobPostingFactory(url="https://example.com/changed", title="Old")
+    unchanged = JobPostingFactory(
+        url="https://example.com/same",
+        title="Backend",
+        company="Acme",
+        location="Paris",
+        salary="",
+        description="",
+        easy_apply=False,
+        active_hiring=False,
+        posted_on=None,
+        platform="",
+        employment_type="",
+        work_mode="",
+    )
+    candidacy = JobCandidacyFactory(
+        job_posting=changed, status="applied", applied_on=date(2026, 1, 5)
+    )
+    index_postings([changed, unchanged])
+    updated_at = unchanged.updated_at
+
+    output = _import(
+        tmp_path,
+        f"{HEADER}\n"
+        "New,Acme,Paris,HTTPS://EXAMPLE.COM/changed/,,,,offer,\n"
+        "Backend,Acme,Paris,https://example.com/same,,,,,\n",
+    )
+
+    assert "Postings: 0 created, 1 updated, 1 unchanged." in output
+    assert "Candidacies: 0 created, 1 updated." in output
+
+    changed.refresh_from_db()
+    assert changed.title == "New"
+    assert changed.url == "HTTPS://EXAMPLE.COM/changed/"
+    assert changed.normalized_url == "https://example.com/changed"
+
+    unchanged.refresh_from_db()
+    assert unchanged.updated_at == updated_at
+
+    candidacy.refresh_from_db()
+    assert candidacy.status == "offer"
+    # Kept when the file has no date.
+    assert candidacy.applied_on == date(2026, 1, 5)
+    assert list(
+        candidacy.status_events.order_by("occurred_at").values_list("status", flat=True)
+    ) == ["applied", "offer"]
+
+    # The changed posting's signature is left to recompute.
+    assert list(
+        JobPostingSignature.objects.values_list("job_posting_id", flat=True)
+    ) == [unchanged.pk]
+
+
+def test_import_ndjson(tmp_path):
+    output = _import(
+        tmp_path,
+        '{"title": "Backend\\tEngineer", "company": "Acme", "location": "Paris", '
+        '"easy_apply": true, "url": "https://example.com/a\\\\b", "status": null}\n'
+        "\n"
+        "{not json}\n"
+        '["title"]\n'
+        '{"title": "Data", "company": "Nova", "location": "Lyon", "notes": "Hi"}\r\n',
+        name="jobs.ndjson",
+    )
+
+    assert "Imported 2 of 4 rows, 2 rejected" in output
+    assert "Line 3: This line is not valid JSON." in output
+    assert "Line 4: This line is not a JSON object." in output
+
+    posting = JobPosting.objects.get(company="Acme")
+    assert posting.title == "Backend\tEngineer"
+    assert posting.url == "https://example.com/a\\b"
+    assert posting.easy_apply is True
+    assert not hasattr(posting, "candidacy")
+
+    candidacy = JobCandidacy.objects.get()
+    assert candidacy.job_posting.company == "Nova"
+    assert candidacy.status == "applied"
+    assert candidacy.notes == "Hi"
+    assert CandidacyStatusEvent.objects.get().status == "applied"
+
+
+def test_import_dry_run_writes_nothing(tmp_path):
+    output = _import(
+        tmp_path,
+        f"{HEADER}\nBackend,Acme,Paris,,,,,applied,\n",
+        dry_run=True,
+    )
+
+    assert "Dry run, rolled back. Imported 1 of 1 rows" in output
+    assert "Postings: 1 created" in output
+    assert not JobPosting.objects.exists()
+    assert not JobCandidacy.objects.exists()
+
+
+@pytest.mark.parametrize(
+    ("name", "content", "message"),
+    [
+        ("jobs.txt", "", "Cannot tell the format of jobs.txt"),
+        ("jobs.csv", "", "The file has no header."),
+        ("jobs.csv", "title,Title\n", "Columns appear more than once: title."),
+        ("jobs.csv", "title,company\nBackend\n", "missing data for column"),
+    ],
+)
+def test_import_rejects_invalid_files(tmp_path, name, content, message):
+    with pytest.raises(CommandError, match=message):
+        _import(tmp_path, content, name=name)
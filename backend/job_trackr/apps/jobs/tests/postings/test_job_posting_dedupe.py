@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/postings/test_job_posting_dedupe.py
+
+import pytest
+from django.core.management import call_command
+
+from apps.jobs.postings.dedupe import (
+    cluster_duplicates,
+    find_duplicates,
+    index_missing_postings,
+    index_postings,
+)
+from apps.jobs.postings.models import JobPostingSignature
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+DESCRIPTION = (
+    "We are looking for a backend engineer to design, build and run the "
+    "services behind our logistics platform. You will work with Python, "
+    "Django and PostgreSQL, own features from design to production, review "
+    "code, improve observability and mentor junior engineers. Three years of "
+    "experience with web services and relational databases are required. "
+    "Remote friendly, based in Paris, with a yearly team offsite."
+)
+
+
+def create_posting_pair():
+    original = JobPostingFactory(
+        title="Senior Backend Engineer",
+        company="Acme",
+        description=DESCRIPTION,
+        platform="linkedin",
+    )
+    repost = JobPostingFactory(
+        title="Backend Engineer (Senior) - Python",
+        company="ACME",
+        description=DESCRIPTION.replace("Three years", "3+ years"),
+        platform="indeed",
+    )
+    index_missing_postings()
+    return original, repost
+
+
+def test_index_postings():
+    job_posting = JobPostingFactory(description=DESCRIPTION)
+
+    assert index_postings([job_posting]) == 1
+
+    signature = JobPostingSignature.objects.get(job_posting=job_posting)
+    assert len(signature.minhash) == 128
+    assert len(signature.buckets) == 32
+
+
+def test_save_does_not_index():
+    JobPostingFactory(description=DESCRIPTION)
+
+    assert not JobPostingSignature.objects.exists()
+
+
+def test_save_drops_stale_signature():
+    job_posting = JobPostingFactory(description=DESCRIPTION)
+    index_postings([job_posting])
+
+    job_posting.title = "Staff Engineer"
+    job_posting.save()
+
+    assert not JobPostingSignature.objects.exists()
+
+
+def test_save_without_source_fields_keeps_signature():
+    job_posting = JobPostingFactory(description=DESCRIPTION)
+    index_postings([job_posting])
+    signature = JobPostingSignature.objects.get(job_posting=job_posting)
+
+    job_posting.salary = "60k"
+    job_posting.save(update_fields=["salary"])
+
+    assert JobPostingSignature.objects.get(job_posting=job_posting).updated_at == (
+        signature.updated_at
+    )
+
+
+def test_find_duplicates_across_platforms():
+    original, repost = create_posting_pair()
+    JobPostingFactory(title="Frontend Engineer", company="Acme")
+
+    duplicates = find_duplicates(original)
+
+    assert [duplicate.job_posting_id for duplicate in duplicates] == [repost.id]
+    assert duplicates[0].similarity >= 0.5
+
+
+def test_find_duplicates_of_unindexed_posting():
+    original, repost = create_posting_pair()
+    JobPostingSignature.objects.filter(job_posting=original).delete()
+
+    assert [d.job_posting_id for d in find_duplicates(original)] == [repost.id]
+
+
+def test_index_missing_postings():
+    job_postings = JobPostingFactory.create_batch(3)
+    index_postings(job_postings[1:])
+
+    assert index_missing_postings(chunk_size=2) == 1
+    assert index_missing_postings(reindex=True, chunk_size=2) == 3
+
+
+def test_cluster_duplicates():
+    original, repost = create_posting_pair()
+    third = JobPostingFactory(
+        title="Senior Backend Engineer",
+        company="Acme Inc",
+        description=DESCRIPTION.replace("Paris", "Lyon"),
+    )
+    JobPostingFactory(title="Data Analyst", company="Other")
+    index_missing_postings()
+
+    assert cluster_duplicates() == [sorted([original.id, repost.id, third.id])]
+
+
+def test_cluster_duplicate_postings_command(capsys):
+    original, repost = create_posting_pair()
+    JobPostingSignature.objects.all().delete()
+
+    call_command("cluster_duplicate_postings")
+    output = capsys.readouterr().out
+
+    assert "Indexed 2 job postings." in output
+    assert f"{original.id} {repost.id}" in output
+    assert "Found 1 clusters covering 2 job postings." in output
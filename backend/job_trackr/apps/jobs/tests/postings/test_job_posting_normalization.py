@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/job_trackr/apps/jobs/tests/postings/test_job_posting_normalization.py
+
+import pytest
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.forms import modelform_factory
+
+from apps.jobs.postings.models import JobPosting
+from apps.jobs.postings.normalization import backfill_normalized_fields
+from apps.jobs.tests.factories.job_posting import JobPostingFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_save_populates_normalized_fields():
+    job_posting = JobPostingFactory(
+        title="  Développeur   Backend ",
+        company="ACME Corp.",
+        url="HTTPS://Example.COM/jobs/1/",
+    )
+
+    job_posting.refresh_from_db()
+
+    assert job_posting.normalized_title == "developpeur backend"
+    assert job_posting.normalized_company == "acme corp."
+    assert job_posting.normalized_url == "https://example.com/jobs/1"
+
+
+def test_save_stores_missing_url_as_null():
+    job_posting = JobPostingFactory(url="")
+
+    assert job_posting.normalized_url is None
+
+
+def test_save_with_update_fields_updates_normalized_fields():
+    job_posting = JobPostingFactory(company="Old Company")
+
+    job_posting.company = "New  Company"
+    job_posting.save(update_fields=["company"])
+    job_posting.refresh_from_db()
+
+    assert job_posting.normalized_company == "new company"
+
+
+def test_normalized_url_is_unique_when_not_empty():
+    JobPostingFactory(url="https://example.com/jobs/1")
+    JobPostingFactory(url="")
+    JobPostingFactory(url="")
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        JobPostingFactory(url="https://EXAMPLE.com/jobs/1/")
+
+
+def test_model_form_reports_duplicate_normalized_url():
+    existing = JobPostingFactory(url="https://example.com/jobs/1")
+    JobPostingForm = modelform_factory(
+        JobPosting, fields=["title", "company", "location", "url"]
+    )
+    data = {
+        "title": "Backend Engineer",
+        "company": "ACME",
+        "location": "Paris",
+        "url": "HTTPS://EXAMPLE.com/jobs/1/",
+    }
+
+    form = JobPostingForm(data)
+
+    assert not form.is_valid()
+    assert form.errors["url"] == ["A job posting with this URL already exists."]
+    # The posting keeps its own URL.
+    assert JobPostingForm(data, instance=existing).is_valid()
+
+
+def test_backfill_populates_rows_in_chunks():
+    job_postings = JobPostingFactory.create_batch(5, company="  Big   Company ")
+    JobPosting.objects.update(normalized_company="", normalized_title="")
+
+    chunks: list[int] = []
+    updated = backfill_normalized_fields(
+        JobPosting,
+        chunk_size=2,
+        on_chunk=chunks.append,
+    )
+
+    assert updated == 5
+    assert chunks == [2, 2, 1]
+    assert set(
+        JobPosting.objects.filter(
+            pk__in=[job_posting.pk for job_posting in job_postings]
+        ).values_list("normalized_company", flat=True)
+    ) == {"big company"}
+
+
+def test_backfill_keeps_url_on_oldest_duplicate():
+    first = JobPostingFactory(url="https://example.com/jobs/1")
+    second = JobPostingFactory(url="https://example.com/other")
+    # Simulates rows written before the unique constraint existed.
+    JobPosting.objects.filter(pk=second.pk).update(
+        url="https://example.com/jobs/1/",
+        normalized_url=None,
+    )
+    JobPosting.objects.filter(pk=first.pk).update(normalized_url=None)
+
+    backfill_normalized_fields(JobPosting, chunk_size=1)
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+
+    assert first.normalized_url == "https://example.com/jobs/1"
+    assert second.normalized_url is None
+
+
+def test_backfill_rerun_moves_url_from_newer_duplicate():
+    first = JobPostingFactory(url="https://example.com/other")
+    second = JobPostingFactory(url="https://example.com/jobs/1")
+    # The older posting's URL changed without its normalized value.
+    JobPosting.objects.filter(pk=first.pk).update(url="https://example.com/jobs/1/")
+
+    backfill_normalized_fields(JobPosting, chunk_size=1)
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+
+    assert first.normalized_url == "https://example.com/jobs/1"
+    assert second.normalized_url is None
+
+
+def test_backfill_swaps_urls_within_a_chunk():
+    first = JobPostingFactory(url="https://example.com/jobs/1")
+    second = JobPostingFactory(url="https://example.com/jobs/2")
+    JobPosting.objects.filter(pk=first.pk).update(url="https://example.com/jobs/2")
+    JobPosting.objects.filter(pk=second.pk).update(url="https://example.com/jobs/1")
+
+    assert backfill_normalized_fields(JobPosting) == 2
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+
+    assert first.normalized_url == "https://example.com/jobs/2"
+    assert second.normalized_url == "https://example.com/jobs/1"
+
+
+def test_backfill_skips_up_to_date_rows():
+    JobPostingFactory.create_batch(3)
+
+    assert backfill_normalized_fields(JobPosting) == 0
+
+
+def test_backfill_command(capsys):
+    job_posting = JobPostingFactory(title="Data Engineer")
+    JobPosting.objects.update(normalized_title="")
+
+    call_command("backfill_normalized_postings", "--chunk-size", "10")
+    job_posting.refresh_from_db()
+
+    assert job_posting.normalized_title == "data engineer"
+    assert "Updated 1 job postings." in capsys.readouterr().out
@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/job_trackr/apps/jobs/urls.py
 
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
 from apps.jobs.api.candidacies.views import JobCandidacyViewSet
 from apps.jobs.api.postings.views import JobPostingViewSet
+from apps.jobs.api.stats.views import JobActivityView, JobStatsView
 
 router = DefaultRouter()
 
@@ -20,4 +22,8 @@ router.register(
     basename="job-candidacy",
 )
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("stats/", JobStatsView.as_view(), name="job-stats"),
+    path("stats/activity/", JobActivityView.as_view(), name="job-activity"),
+    *router.urls,
+]
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     # Filter
     "django_filters",
     # DRF
@@ -44,6 +45,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so that the queries of every other middleware are counted.
+    "apps.common.instrumentation.RequestInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -111,6 +114,17 @@ STATIC_URL = "/static/"
 REST_FRAMEWORK = {
     **globals().get("REST_FRAMEWORK", {}),
     "DEFAULT_PAGINATION_CLASS": "apps.common.api.pagination.DefaultPagination",
+    # orjson-backed drop-ins for DRF's JSON renderer and parser, see
+    # apps.common.api.renderers.
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.common.api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "apps.common.api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     # NOTE:
     # Pagination is enabled globally for all DRF list endpoints.
     # This changes the response shape from a raw list to:
@@ -123,3 +137,77 @@ REST_FRAMEWORK = {
     # DefaultPagination.page_size.
     "PAGE_SIZE": 20,
 }
+
+# Cache
+# Holds the per-model version counters, cached counts, response data and
+# stats (see apps.common.cache). They are only consistent if every worker
+# process shares the backend: a local-memory cache is fine for a single
+# process (runserver, tests), but with several workers a write would only
+# invalidate the entries of its own process. prod.py reads a shared backend
+# from CACHE_URL, and turns the response and stats caches off without one.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+# List counts
+# How DefaultPagination computes `count` in page number mode:
+#   - "exact": COUNT(*) on every request;
+#   - "cached": COUNT(*) cached per query signature, invalidated by writes;
+#   - "estimated": planner estimate at or above the threshold, flagged with
+#     `count_is_approximate` in the response.
+# See apps.common.api.counting.
+
+API_COUNT_STRATEGY = "exact"
+API_COUNT_CACHE_TIMEOUT = 60
+API_COUNT_ESTIMATE_THRESHOLD = 10_000
+
+# Response cache
+# Seconds list and detail response data of viewsets with `cache_responses`
+# are cached for; 0 disables the cache. Writes invalidate entries through
+# per-model version counters. See apps.common.api.response_cache.
+
+API_RESPONSE_CACHE_TIMEOUT = 30
+
+# Seconds /api/v1/jobs/stats/ results are cached for; 0 disables the cache.
+# Writes invalidate them through the same version counters.
+# See apps.jobs.api.stats.
+
+API_STATS_CACHE_TIMEOUT = 300
+
+# Request instrumentation
+# Query count, SQL and serialization time of each request are sent in a
+# `Server-Timing` header when enabled. Requests over budget are logged;
+# `API_REQUEST_BUDGETS` overrides the default budget per viewset action
+# ("<basename>:<action>") or URL name. See apps.common.instrumentation.
+
+API_SERVER_TIMING = True
+API_REQUEST_BUDGET: dict[str, float] = {
+    "queries": 20,
+    "sql_ms": 200,
+    "serialize_ms": 200,
+    "total_ms": 1_000,
+}
+API_REQUEST_BUDGETS: dict[str, dict[str, float]] = {
+    # Keyset page, nested posting summary: no N+1.
+    "job-posting:list": {"queries": 5},
+    "job-candidacy:list": {"queries": 5},
+    "job-posting:retrieve": {"queries": 5},
+    "job-candidacy:retrieve": {"queries": 5},
+    "job-stats": {"queries": 4},
+}
+
+# Metrics
+# Served in the Prometheus text format at /metrics to requests with an
+# `Authorization: Bearer <METRICS_TOKEN>` header. Without a token, they are
+# served to METRICS_ALLOWED_IPS, checked against REMOTE_ADDR: behind a
+# reverse proxy, that is the proxy's address for every client, so set a
+# token there. With several worker processes, METRICS_DIR must be a
+# directory shared by the workers and emptied on startup.
+# See apps.common.metrics.
+
+METRICS_DIR: str | None = None
+METRICS_TOKEN: str | None = None
+METRICS_ALLOWED_IPS = ["127.0.0.1", "::1"]
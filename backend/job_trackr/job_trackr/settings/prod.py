@@ -4,6 +4,7 @@
 import environ
 from django.core.exceptions import ImproperlyConfigured
 
+from . import base
 from .base import *  # noqa: F403,F401
 
 env = environ.Env()
@@ -20,3 +21,96 @@ if not ALLOWED_HOSTS:
 DATABASES = {
     "default": env.db("DATABASE_URL"),
 }
+
+# Database connections
+# Either each worker thread keeps its connection open across requests for
+# DATABASE_CONN_MAX_AGE seconds, or, with DATABASE_POOL, threads borrow
+# connections from a psycopg pool per process. Django does not allow both.
+# Health checks ping a reused connection before its first query.
+DATABASE_POOL = env.bool("DATABASE_POOL", default=False)
+
+DATABASES["default"]["CONN_MAX_AGE"] = env.int(
+    "DATABASE_CONN_MAX_AGE",
+    default=0 if DATABASE_POOL else 60,
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool(
+    "DATABASE_CONN_HEALTH_CHECKS",
+    default=True,
+)
+
+if DATABASE_POOL:
+    if DATABASES["default"]["CONN_MAX_AGE"] != 0:
+        raise ImproperlyConfigured(
+            "DATABASE_CONN_MAX_AGE must be 0 when DATABASE_POOL is enabled"
+        )
+
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),
+        "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),
+        # Seconds a request waits for a free connection before failing.
+        "timeout": env.float("DATABASE_POOL_TIMEOUT", default=10.0),
+    }
+
+# Cache
+# A backend shared by every worker process, e.g. a file cache on a
+# directory shared by the workers (filecache:///var/tmp/django_cache),
+# memcached, or redis://redis:6379/0. The redis scheme needs the `redis`
+# client package, which is not a dependency of the project: install it
+# alongside (e.g. `uv add redis`). Without CACHE_URL, the cache is local to
+# each process, so the response and stats caches default to off and the
+# cached count strategy is refused, see base.CACHES.
+CACHES = {
+    "default": env.cache_url("CACHE_URL", default="locmemcache://"),
+}
+
+_SHARED_CACHE = CACHES["default"]["BACKEND"] != (
+    "django.core.cache.backends.locmem.LocMemCache"
+)
+
+if CACHES["default"]["BACKEND"] == "django.core.cache.backends.redis.RedisCache":
+    try:
+        import redis  # noqa: F401
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            "CACHE_URL uses Redis: install the redis package"
+        ) from exc
+
+API_COUNT_STRATEGY = env.str("API_COUNT_STRATEGY", default=base.API_COUNT_STRATEGY)
+API_COUNT_CACHE_TIMEOUT = env.int(
+    "API_COUNT_CACHE_TIMEOUT",
+    default=base.API_COUNT_CACHE_TIMEOUT,
+)
+API_COUNT_ESTIMATE_THRESHOLD = env.int(
+    "API_COUNT_ESTIMATE_THRESHOLD",
+    default=base.API_COUNT_ESTIMATE_THRESHOLD,
+)
+# Off by default without a shared cache, see above.
+API_RESPONSE_CACHE_TIMEOUT = env.int(
+    "API_RESPONSE_CACHE_TIMEOUT",
+    default=base.API_RESPONSE_CACHE_TIMEOUT if _SHARED_CACHE else 0,
+)
+API_STATS_CACHE_TIMEOUT = env.int(
+    "API_STATS_CACHE_TIMEOUT",
+    default=base.API_STATS_CACHE_TIMEOUT if _SHARED_CACHE else 0,
+)
+
+if not _SHARED_CACHE and (
+    API_RESPONSE_CACHE_TIMEOUT
+    or API_STATS_CACHE_TIMEOUT
+    or API_COUNT_STRATEGY == "cached"
+):
+    raise ImproperlyConfigured(
+        "CACHE_URL must point to a cache shared by all workers when "
+        "API_RESPONSE_CACHE_TIMEOUT, API_STATS_CACHE_TIMEOUT or the cached "
+        "count strategy is enabled"
+    )
+
+
+# Timings reveal how requests are served: opt-in in production.
+API_SERVER_TIMING = env.bool("API_SERVER_TIMING", default=False)
+METRICS_DIR = env.str("METRICS_DIR", default="") or None
+METRICS_TOKEN = env.str("METRICS_TOKEN", default="") or None
+METRICS_ALLOWED_IPS = env.list(
+    "METRICS_ALLOWED_IPS",
+    default=base.METRICS_ALLOWED_IPS,
+)
@@ -23,9 +23,12 @@ from django.contrib import admin
 from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import URLPattern, URLResolver, include, path
 
+from apps.common.views import metrics
+
 urlpatterns: list[URLPattern | URLResolver] = [
     path("admin/", admin.site.urls),
     path("api/v1/jobs/", include("apps.jobs.urls")),
+    path("metrics", metrics, name="metrics"),
 ]
 
 if settings.DEBUG: